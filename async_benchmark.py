@@ -0,0 +1,98 @@
+"""
+Async Benchmark
+
+This program measures the requests per second of the asyncio
+interface with thousands of coroutines creating reservations,
+mixed with lookups, for several concurrency limits
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from customers import Customers
+from hotels import Hotels
+from reservations import Reservations
+from reservations_async import AsyncReservations
+
+REQUESTS = 20_000
+HOTELS = 200
+ROOMS_PER_HOTEL = 100
+CONCURRENCY_LIMITS = [10, 100, 1_000, 10_000]
+
+
+def build_reservations(concurrent):
+    """
+    This function builds the Hotels and one customer, without a sink
+    for the results
+
+    Args:
+        concurrent (bool): True to build the objects in concurrent mode
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    hotels_obj = Hotels(sink=None, concurrent=concurrent)
+    customers_obj = Customers(sink=None, concurrent=concurrent)
+    for hotel in range(HOTELS):
+        hotels_obj.create_hotel_bulk(f'Hotel {hotel}', 'Monterrey',
+                                     room_range=range(1,
+                                                      ROOMS_PER_HOTEL + 1))
+    customers_obj.create_customer('1000', 'Bench Customer',
+                                  'bench@gmail.com', '8112345678')
+    return Reservations(hotels_obj, customers_obj, sink=None,
+                        concurrent=concurrent)
+
+
+async def run_requests(async_reservations, concurrency):
+    """
+    This function creates REQUESTS reservations with at most
+    concurrency coroutines at a time, while one lookup coroutine
+    per Hotel runs next to them
+
+    Args:
+        async_reservations (AsyncReservations): The async interface
+        concurrency (int): The maximum number of reservations in
+        progress
+
+    Returns:
+        float: Requests per second, lookups included
+    """
+    requests = [(f'{number:06d}', '1000', f'Hotel {number % HOTELS}',
+                 f'{number // HOTELS % ROOMS_PER_HOTEL + 1:03d}')
+                for number in range(REQUESTS)]
+    start = time.perf_counter()
+    await asyncio.gather(
+        async_reservations.create_many(requests, concurrency),
+        *(async_reservations.find_hotel_reservations(f'Hotel {hotel}')
+          for hotel in range(HOTELS)))
+    return (REQUESTS + HOTELS) / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Main function, prints the requests per second with the operations
+    run on the event loop and in a thread pool
+
+    Returns:
+        None
+    """
+    print(f'{REQUESTS} reservations in {HOTELS} hotels')
+    print(f'{"concurrency":>12} {"loop (req/s)":>14} '
+          f'{"threads (req/s)":>16}')
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for concurrency in CONCURRENCY_LIMITS:
+            on_loop = asyncio.run(run_requests(
+                AsyncReservations(build_reservations(False), inline=True),
+                concurrency))
+            in_threads = asyncio.run(run_requests(
+                AsyncReservations(build_reservations(True), executor),
+                concurrency))
+            print(f'{concurrency:>12} {on_loop:>14.0f} '
+                  f'{in_threads:>16.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Concurrency Benchmark
+
+This program measures the throughput of a mix of reservations,
+cancellations and lookups run by 1, 4, 16 and 64 threads on
+shared Hotels, Customers and Reservations objects in concurrent
+mode
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import itertools
+import random
+import threading
+import time
+
+from hotels import Hotels
+from customers import Customers
+from reservations import Reservations
+
+THREAD_COUNTS = [1, 4, 16, 64]
+OPERATIONS = 64_000
+HOTELS = 64
+ROOMS_PER_HOTEL = 50
+CUSTOMERS = 1_000
+# Share of reservations and cancellations, the rest are lookups
+RESERVE_SHARE = 0.2
+CANCEL_SHARE = 0.2
+
+
+def build_reservations():
+    """
+    This function builds the Hotels and customers in concurrent mode,
+    without a sink for the results
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    hotels_obj = Hotels(sink=None, concurrent=True)
+    customers_obj = Customers(sink=None, concurrent=True)
+    for number in range(HOTELS):
+        hotels_obj.create_hotel_bulk(f'Hotel {number}', 'Monterrey',
+                                     room_range=range(1, ROOMS_PER_HOTEL
+                                                      + 1))
+    for number in range(CUSTOMERS):
+        customers_obj.create_customer(f'{number:04d}', 'Bench Customer',
+                                      f'customer{number}@gmail.com',
+                                      f'81{number:08d}')
+    return Reservations(hotels_obj, customers_obj, sink=None,
+                        concurrent=True)
+
+
+def run_mix(reservations_obj, thread_count):
+    """
+    This function runs OPERATIONS operations split between the threads,
+    each thread cancels only the reservations it made
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+        thread_count (int): The number of threads
+
+    Returns:
+        float: Operations per second
+    """
+    hotels_obj = reservations_obj.hotels_instance
+    customers_obj = reservations_obj.customers_instance
+    reservation_ids = itertools.count(1)
+
+    def worker(number):
+        randomizer = random.Random(number)
+        own_reservations = []
+        for _ in range(OPERATIONS // thread_count):
+            hotel_name = f'Hotel {randomizer.randrange(HOTELS)}'
+            customer_number = randomizer.randrange(CUSTOMERS)
+            customer_id = f'{customer_number:04d}'
+            choice = randomizer.random()
+            if choice < RESERVE_SHARE:
+                room_number = \
+                    f'{randomizer.randint(1, ROOMS_PER_HOTEL):03d}'
+                reservation_id = f'{next(reservation_ids):06d}'
+                if reservations_obj.create_customer_reservation(
+                        reservation_id, customer_id, hotel_name,
+                        room_number):
+                    own_reservations.append(reservation_id)
+            elif choice < RESERVE_SHARE + CANCEL_SHARE:
+                if own_reservations:
+                    reservations_obj.cancel_customer_reservation(
+                        own_reservations.pop())
+            elif choice < 0.7:
+                hotels_obj.find_available_room(hotel_name, 'single')
+            elif choice < 0.85:
+                reservations_obj.find_customer_reservations(customer_id)
+            else:
+                customers_obj.find_by_email(
+                    f'customer{customer_number}@gmail.com')
+
+    threads = [threading.Thread(target=worker, args=(number,))
+               for number in range(thread_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return OPERATIONS / (time.perf_counter() - start)
+
+
+def count_mismatches(reservations_obj):
+    """
+    This function checks that the reserved rooms and the stored
+    reservations match
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+
+    Returns:
+        int: The number of rooms whose status does not match the
+        reservations stored for them
+    """
+    hotels_obj = reservations_obj.hotels_instance
+    mismatches = 0
+    for number in range(HOTELS):
+        hotel_name = f'Hotel {number}'
+        reserved = set(hotels_obj.list_rooms(hotel_name, 'reserved'))
+        held = {reservation['room_number'] for reservation
+                in reservations_obj.find_hotel_reservations(hotel_name)}
+        mismatches += len(reserved ^ held)
+    return mismatches
+
+
+def main():
+    """
+    Main function, prints the throughput for each number of threads
+
+    Returns:
+        None
+    """
+    print(f'{OPERATIONS} operations, {HOTELS} hotels, '
+          f'{CUSTOMERS} customers')
+    print(f'{"threads":>8} {"ops/s":>10} {"mismatches":>11}')
+    for thread_count in THREAD_COUNTS:
+        reservations_obj = build_reservations()
+        throughput = run_mix(reservations_obj, thread_count)
+        print(f'{thread_count:>8} {throughput:>10.0f} '
+              f'{count_mismatches(reservations_obj):>11}')
+
+
+if __name__ == '__main__':
+    main()
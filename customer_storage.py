@@ -0,0 +1,273 @@
+"""
+Customer Storage
+
+This program handles a compact storage for the customers,
+where the name, email and phone of each customer are kept in
+preallocated columns indexed by the 4 digit customer ID
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import sys
+from collections.abc import MutableMapping
+
+# Customer IDs have 4 digits, so there are at most 10000 customers
+CAPACITY = 10000
+
+CUSTOMER_FIELDS = ('name', 'email', 'phone')
+
+
+def customer_slot(customer_id):
+    """
+    This function converts a 4 digit customer ID into its slot
+
+    Args:
+        customer_id (str): The customer ID
+
+    Returns:
+        int: The slot of the customer
+
+    Raises:
+        KeyError: If the customer ID does not have 4 digits
+    """
+    if (not isinstance(customer_id, str) or len(customer_id) != 4
+            or not customer_id.isdigit()):
+        raise KeyError(customer_id)
+    return int(customer_id)
+
+
+class CompactCustomer(MutableMapping):
+    """
+    Class to view the fields of one customer of a CompactCustomers
+    storage as a dictionary with the 'name', 'email' and 'phone' keys
+    """
+    __slots__ = ('_customers', '_slot')
+
+    def __init__(self, customers, slot):
+        """
+        Initializes the CompactCustomer object
+
+        Args:
+            customers (CompactCustomers): The storage of the customer
+            slot (int): The slot of the customer
+
+        Returns:
+            None
+        """
+        self._customers = customers
+        self._slot = slot
+
+    def __getitem__(self, field):
+        """
+        This method reads a field of the customer
+
+        Args:
+            field (str): 'name', 'email' or 'phone'
+
+        Returns:
+            str: The value of the field
+        """
+        return self._customers.column(field)[self._slot]
+
+    def __setitem__(self, field, value):
+        """
+        This method writes a field of the customer
+
+        Args:
+            field (str): 'name', 'email' or 'phone'
+            value (str): The new value of the field
+
+        Returns:
+            None
+        """
+        self._customers.column(field)[self._slot] = sys.intern(value)
+
+    def __delitem__(self, field):
+        """
+        This method rejects removing a field, every customer keeps all
+
+        Args:
+            field (str): The field to be removed
+
+        Returns:
+            None
+        """
+        raise TypeError('Customer fields cannot be removed')
+
+    def __iter__(self):
+        """
+        This method iterates over the fields of the customer
+
+        Returns:
+            iterator: The field names
+        """
+        return iter(CUSTOMER_FIELDS)
+
+    def __len__(self):
+        """
+        This method returns the number of fields of the customer
+
+        Returns:
+            int: The number of fields
+        """
+        return len(CUSTOMER_FIELDS)
+
+    def __repr__(self):
+        """
+        This method represents the customer as a dictionary
+
+        Returns:
+            str: The representation of the customer
+        """
+        return repr(dict(self))
+
+
+class CompactCustomers(MutableMapping):
+    """
+    Class to keep the customers in preallocated columns indexed by
+    their ID, with a bitmap of the occupied IDs, which behaves as the
+    dictionary of customer dictionaries it replaces
+    """
+    def __init__(self):
+        """
+        Initializes the CompactCustomers object
+
+        Returns:
+            None
+        """
+        self.names = [None] * CAPACITY
+        self.emails = [None] * CAPACITY
+        self.phones = [None] * CAPACITY
+        self.occupied = bytearray(CAPACITY // 8)
+        self._count = 0
+
+    def column(self, field):
+        """
+        This method returns the column that keeps a field
+
+        Args:
+            field (str): 'name', 'email' or 'phone'
+
+        Returns:
+            list: The column of the field
+        """
+        if field == 'name':
+            return self.names
+        if field == 'email':
+            return self.emails
+        if field == 'phone':
+            return self.phones
+        raise KeyError(field)
+
+    def _is_occupied(self, slot):
+        """
+        This method checks the bitmap for a slot
+
+        Args:
+            slot (int): The slot of the customer
+
+        Returns:
+            bool: True if the slot holds a customer, False otherwise
+        """
+        return bool(self.occupied[slot >> 3] & (1 << (slot & 7)))
+
+    def __getitem__(self, customer_id):
+        """
+        This method returns a view of a customer
+
+        Args:
+            customer_id (str): The customer ID
+
+        Returns:
+            CompactCustomer: The view of the customer
+        """
+        slot = customer_slot(customer_id)
+        if not self._is_occupied(slot):
+            raise KeyError(customer_id)
+        return CompactCustomer(self, slot)
+
+    def __setitem__(self, customer_id, customer_details):
+        """
+        This method stores a customer
+
+        Args:
+            customer_id (str): The customer ID
+            customer_details (dict): The 'name', 'email' and 'phone'
+            of the customer
+
+        Returns:
+            None
+        """
+        slot = customer_slot(customer_id)
+        self.names[slot] = sys.intern(customer_details['name'])
+        self.emails[slot] = sys.intern(customer_details['email'])
+        self.phones[slot] = sys.intern(customer_details['phone'])
+        if not self._is_occupied(slot):
+            self.occupied[slot >> 3] |= 1 << (slot & 7)
+            self._count += 1
+
+    def __delitem__(self, customer_id):
+        """
+        This method removes a customer
+
+        Args:
+            customer_id (str): The customer ID
+
+        Returns:
+            None
+        """
+        slot = customer_slot(customer_id)
+        if not self._is_occupied(slot):
+            raise KeyError(customer_id)
+        self.names[slot] = self.emails[slot] = self.phones[slot] = None
+        self.occupied[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+        self._count -= 1
+
+    def __contains__(self, customer_id):
+        """
+        This method checks whether a customer exists
+
+        Args:
+            customer_id (str): The customer ID
+
+        Returns:
+            bool: True if the customer exists, False otherwise
+        """
+        try:
+            slot = customer_slot(customer_id)
+        except KeyError:
+            return False
+        return self._is_occupied(slot)
+
+    def __iter__(self):
+        """
+        This method iterates over the customer IDs in ascending order
+
+        Returns:
+            iterator: The customer IDs
+        """
+        for byte_number, byte in enumerate(self.occupied):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield f'{(byte_number << 3) | bit:04d}'
+
+    def __len__(self):
+        """
+        This method returns the number of customers
+
+        Returns:
+            int: The number of customers
+        """
+        return self._count
+
+    def __repr__(self):
+        """
+        This method represents the customers as a dictionary
+
+        Returns:
+            str: The representation of the customers
+        """
+        return repr({customer_id: dict(customer)
+                     for customer_id, customer in self.items()})
@@ -10,19 +10,56 @@ Author:
 """
 import re
 
+from customer_storage import CompactCustomers
+from events import CONSOLE_SINK, EventEmitter, Result, report
+from locking import make_lock, make_striped_lock
+from name_index import NameIndex
+from render import customer_lines, write_lines
 
-class Customers:
+
+class Customers(EventEmitter):
     """
     Class to handle the customers operations
     """
-    def __init__(self):
+    def __init__(self, compact=False, unique_contacts=False,
+                 sink=CONSOLE_SINK, concurrent=False, storage=None):
         """
         Initializes the Customers object
 
+        Args:
+            compact (bool): True to keep the customers in preallocated
+            columns (CompactCustomers) instead of dictionaries
+            unique_contacts (bool): True to reject an email or phone
+            number already used by another customer
+            sink (object): The sink the results are sent to, None to
+            discard them
+            concurrent (bool): True if the object is shared by threads,
+            so customers are changed under the lock of their shard
+            storage (SqliteStorage): The database the customers are kept
+            in instead of dictionaries, the customers already stored in
+            it are indexed (if applicable)
+
         Returns:
             None
         """
-        self.customers = {}
+        if storage is not None:
+            self.customers = storage.customers
+        else:
+            self.customers = CompactCustomers() if compact else {}
+        self.sink = sink
+        self.concurrent = concurrent
+        self.unique_contacts = unique_contacts
+        # Customer IDs by email (case-insensitive) and by phone number
+        self._email_index = {}
+        self._phone_index = {}
+        self._name_index = NameIndex()
+        # Locks of the customer ID shards, and lock of the email, phone
+        # and name indexes that all the customers share
+        self._locks = make_striped_lock(concurrent)
+        self._index_lock = make_lock(concurrent)
+        for customer_id, info in list(self.customers.items()):
+            self._index_customer(customer_id, info['name'], info['email'],
+                                 info['phone'])
 
     def create_customer(self, customer_id, name, email, phone):
         """
@@ -36,24 +73,61 @@ class Customers:
             phone (str): The phone number of the customer
 
         Returns:
-             None
+            Result: The outcome of the creation
         """
-        if not self.validate_customer_id(customer_id):
-            return
-
-        if not self.validate_customer_name(name):
-            return
-
-        if not self.validate_customer_email(email):
-            return
+        with self._locks.lock_for(customer_id):
+            error = (self.customer_id_error(customer_id)
+                     or self.customer_name_error(name)
+                     or self.customer_email_error(email)
+                     or self.customer_phone_error(phone))
+            if error is None:
+                with self._index_lock:
+                    error = self.unique_contact_error(None, email, phone)
+                    if error is None:
+                        self.insert_customer(customer_id, name, email,
+                                             phone)
+        if error is not None:
+            return self._fail(error)
+
+        return self._succeed('Customer created successfully')
+
+    def insert_customer(self, customer_id, name, email, phone):
+        """
+        This method stores an already validated customer and adds it
+        to the email, phone and name indexes
 
-        if not self.validate_customer_phone(phone):
-            return
+        Args:
+            customer_id (str): The ID of the customer
+            name (str): The name of the customer
+            email (str): The email of the customer
+            phone (str): The phone number of the customer
 
+        Returns:
+            None
+        """
         self.customers[customer_id] = {'name': name,
                                        'email': email,
                                        'phone': phone}
-        print('\nCustomer created successfully')
+        self._index_customer(customer_id, name, email, phone)
+
+    def _index_customer(self, customer_id, name, email, phone):
+        """
+        This method adds a customer to the email, phone and name indexes
+
+        Args:
+            customer_id (str): The ID of the customer
+            name (str): The name of the customer
+            email (str): The email of the customer
+            phone (str): The phone number of the customer
+
+        Returns:
+            None
+        """
+        with self._index_lock:
+            self._index_contact(self._email_index, email.casefold(),
+                                customer_id)
+            self._index_contact(self._phone_index, phone, customer_id)
+            self._name_index.add(customer_id, name)
 
     def validate_customer_id(self, customer_id):
         """
@@ -65,20 +139,51 @@ class Customers:
         Returns:
             bool: True if the ID entered is valid, False otherwise
         """
+        return self._report(self.customer_id_error(customer_id))
+
+    def customer_id_error(self, customer_id):
+        """
+        This function checks the customer ID entered without printing
+
+        Args:
+            customer_id (str): The customer ID to be checked
+
+        Returns:
+            str: The error found, None if the ID entered is valid
+        """
         if customer_id.strip() == '':
-            print('\nError: Customer ID cannot be empty')
-            return False
+            return 'Customer ID cannot be empty'
 
         if customer_id in self.customers:
-            print(f'\nError: {customer_id} already exists')
-            return False
+            return f'{customer_id} already exists'
 
         if (not isinstance(customer_id, str) or len(customer_id) != 4
                 or not customer_id.isdigit()):
-            print('\nError: Invalid Customer ID entered')
-            return False
+            return 'Invalid Customer ID entered'
+
+        return None
 
-        return True
+    def existing_customer_error(self, customer_id):
+        """
+        This function checks that a customer ID exists without printing
+
+        Args:
+            customer_id (str): The customer ID to be checked
+
+        Returns:
+            str: The error found, None if the customer exists
+        """
+        if customer_id.strip() == '':
+            return 'Customer ID cannot be empty'
+
+        if (not isinstance(customer_id, str) or len(customer_id) != 4
+                or not customer_id.isdigit()):
+            return 'Invalid Customer ID entered'
+
+        if customer_id not in self.customers:
+            return f'ID {customer_id} does not exist'
+
+        return None
 
     @staticmethod
     def validate_customer_name(customer_name):
@@ -92,17 +197,28 @@ class Customers:
             bool: True if the name entered is valid, False
             otherwise
         """
+        return report(Customers.customer_name_error(customer_name))
+
+    @staticmethod
+    def customer_name_error(customer_name):
+        """
+        This function checks the customer name entered without printing
+
+        Args:
+            customer_name (str): The customer name to be checked
+
+        Returns:
+            str: The error found, None if the name entered is valid
+        """
         pattern = r"^[a-zA-Z\s\']+$"
 
         if customer_name.strip() == '':
-            print('\nError: Customer name cannot be empty')
-            return False
+            return 'Customer name cannot be empty'
 
         if not re.fullmatch(pattern, customer_name):
-            print('\nError: Customer name is invalid')
-            return False
+            return 'Customer name is invalid'
 
-        return True
+        return None
 
     @staticmethod
     def validate_customer_email(customer_email):
@@ -117,18 +233,31 @@ class Customers:
             bool: True if the email entered is valid,
             False otherwise
         """
+        return report(Customers.customer_email_error(customer_email))
+
+    @staticmethod
+    def customer_email_error(customer_email):
+        """
+        This function checks the customer email entered without
+        printing
+
+        Args:
+            customer_email (str): The customer email
+            to be checked
+
+        Returns:
+            str: The error found, None if the email entered is valid
+        """
         pattern = (r"^[a-zA-Z0-9._%+-]+"
                    r"@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
         if customer_email.strip() == '':
-            print('\nError: Customer email cannot be empty')
-            return False
+            return 'Customer email cannot be empty'
 
         if not re.fullmatch(pattern, customer_email):
-            print('\nError: Customer email is invalid')
-            return False
+            return 'Customer email is invalid'
 
-        return True
+        return None
 
     @staticmethod
     def validate_customer_phone(customer_phone):
@@ -144,75 +273,141 @@ class Customers:
             bool: True if the phone number entered is valid,
             False otherwise
         """
+        return report(Customers.customer_phone_error(customer_phone))
+
+    @staticmethod
+    def customer_phone_error(customer_phone):
+        """
+        This function checks the customer phone number entered without
+        printing
+
+        Args:
+            customer_phone (str): The customer phone number
+            to be checked
+
+        Returns:
+            str: The error found, None if the phone number entered is
+            valid
+        """
         if customer_phone.strip() == '':
-            print('\nError: Customer phone cannot be empty')
-            return False
+            return 'Customer phone cannot be empty'
 
         if (not isinstance(customer_phone, str)
                 or len(customer_phone) != 10
                 or not customer_phone.isdigit()):
-            print('\nError: Invalid Customer phone entered')
-            return False
+            return 'Invalid Customer phone entered'
 
-        return True
+        return None
 
-    def delete_customer(self, customer_id):
+    def validate_unique_contact(self, customer_id, email, phone):
         """
-        This method deletes a customer register (if it exists)
+        This function validates that the email and phone number are not
+        used by another customer, when unique contacts are required
 
         Args:
-            customer_id (str): The ID of the customer
-             (already created)
+            customer_id (str): The ID of the customer that will use
+            them (None for a new customer)
+            email (str): The customer email (if applicable)
+            phone (str): The customer phone number (if applicable)
 
         Returns:
-            None
+            bool: True if they can be used, False otherwise
         """
-        if customer_id.strip() == '':
-            print('\nError: Customer ID cannot be empty')
-            return
+        return self._report(
+            self.unique_contact_error(customer_id, email, phone))
 
-        if (not isinstance(customer_id, str) or len(customer_id) != 4
-                or not customer_id.isdigit()):
-            print('\nError: Invalid Customer ID entered')
-            return
+    def unique_contact_error(self, customer_id, email, phone):
+        """
+        This function checks that the email and phone number are not
+        used by another customer without printing
 
-        if customer_id not in self.customers:
-            print(f'\nError: ID {customer_id} does not exist')
-            return
+        Args:
+            customer_id (str): The ID of the customer that will use
+            them (None for a new customer)
+            email (str): The customer email (if applicable)
+            phone (str): The customer phone number (if applicable)
 
-        del self.customers[customer_id]
-        print(f'\nID: {customer_id} deleted successfully')
+        Returns:
+            str: The error found, None if they can be used
+        """
+        if not self.unique_contacts:
+            return None
+
+        if email is not None and any(
+                owner != customer_id for owner
+                in self._email_index.get(email.casefold(), ())):
+            return f'E-mail {email} is already in use'
 
-    def display_customer_information(self, customer_id):
+        if phone is not None and any(
+                owner != customer_id for owner
+                in self._phone_index.get(phone, ())):
+            return f'Phone {phone} is already in use'
+
+        return None
+
+    def delete_customer(self, customer_id):
         """
-        This method displays the customer information (if it exists)
+        This method deletes a customer register (if it exists)
 
         Args:
             customer_id (str): The ID of the customer
-            (already created)
+             (already created)
 
         Returns:
-            None
+            Result: The outcome of the removal
         """
-        if customer_id.strip() == '':
-            print('\nError: Customer ID cannot be empty')
-            return
-
-        if (not isinstance(customer_id, str) or len(customer_id) != 4
-                or not customer_id.isdigit()):
-            print('\nError: Invalid Customer ID entered')
-            return
+        with self._locks.lock_for(customer_id):
+            error = self.existing_customer_error(customer_id)
+            if error is None:
+                customer_info = self.customers[customer_id]
+                with self._index_lock:
+                    self._unindex_contact(self._email_index,
+                                          customer_info['email'].casefold(),
+                                          customer_id)
+                    self._unindex_contact(self._phone_index,
+                                          customer_info['phone'],
+                                          customer_id)
+                    self._name_index.remove(customer_id)
+                del self.customers[customer_id]
+        if error is not None:
+            return self._fail(error)
+
+        return self._succeed('ID: %s deleted successfully', customer_id)
+
+    def display_customer_information(self, customer_id, output='text',
+                                     stream=None):
+        """
+        This method displays the customer information (if it exists)
 
-        if customer_id not in self.customers:
-            print(f'\nError: ID {customer_id} does not exist')
-            return
+        Args:
+            customer_id (str): The ID of the customer
+            (already created)
+            output (str): The output format, 'text' or 'json'
+            (if applicable)
+            stream (file): The text stream the information is written
+            to instead of the message (if applicable)
 
-        customer_info = self.customers[customer_id]
-        print('\nCustomer Information:')
-        print(f'Customer ID: {customer_id}')
-        print(f'Name: {customer_info["name"]}')
-        print(f'E-mail: {customer_info["email"]}')
-        print(f'Phone: {customer_info["phone"]}')
+        Returns:
+            Result: The information of the customer as its message, or
+            the number of lines written to the stream as its data
+        """
+        with self._locks.lock_for(customer_id):
+            error = self.existing_customer_error(customer_id)
+            if error is None:
+                customer_info = dict(self.customers[customer_id])
+        if error is not None:
+            return self._fail(error)
+
+        try:
+            lines = customer_lines(customer_id, customer_info, output)
+        except ValueError as error:
+            return self._fail(str(error))
+        if stream is None:
+            return self._succeed('%s', '\n'.join(lines))
+
+        written = write_lines(lines, stream)
+        return self._succeed('Customer %s information written (%s lines)',
+                             customer_id, written, data=written)
 
     def modify_customer_information(self, customer_id, new_name=None,
                                     new_email=None, new_phone=None):
@@ -226,32 +421,30 @@ class Customers:
             new_phone (str): The new phone of the customer (if applicable)
 
         Returns:
-            None
+            Result: Successful if every change succeeded, its data is
+            the list of the outcomes of the changes
         """
-        if customer_id.strip() == '':
-            print('\nError: Customer ID cannot be empty')
-            return
-
-        if (not isinstance(customer_id, str) or len(customer_id) != 4
-                or not customer_id.isdigit()):
-            print('\nError: Invalid Customer ID entered')
-            return
-
-        if customer_id not in self.customers:
-            print(f'\nError: ID {customer_id} does not exist')
-            return
+        error = self.existing_customer_error(customer_id)
+        if error is not None:
+            return self._fail(error)
 
+        results = []
         if new_name is not None:
-            self.modify_customer_name(customer_id,
-                                      new_name)
+            results.append(self.modify_customer_name(customer_id,
+                                                     new_name))
 
         if new_email is not None:
-            self.modify_customer_email(customer_id,
-                                       new_email)
+            results.append(self.modify_customer_email(customer_id,
+                                                      new_email))
 
         if new_phone is not None:
-            self.modify_customer_phone(customer_id,
-                                       new_phone)
+            results.append(self.modify_customer_phone(customer_id,
+                                                      new_phone))
+        if all(results):
+            return Result(True, 'ID: %s information modified',
+                          (customer_id,), results)
+        return Result(False, 'ID: %s information was not fully modified',
+                      (customer_id,), results)
 
     def modify_customer_name(self, customer_id, new_name):
         """
@@ -262,18 +455,21 @@ class Customers:
             new_name (str): The new name of the customer
 
         Returns:
-            None
+            Result: The outcome of the change
         """
-        if not self.validate_customer_name(new_name):
-            return
+        error = self.customer_name_error(new_name)
+        if error is not None:
+            return self._fail(error)
 
-        if (customer_id in self.customers and
-                self.customers[customer_id]['name'] == new_name):
-            print('\nError: Name was not updated')
-            return
+        with self._locks.lock_for(customer_id):
+            if (customer_id in self.customers and
+                    self.customers[customer_id]['name'] == new_name):
+                return self._fail('Name was not updated')
 
-        self.customers[customer_id]['name'] = new_name
-        print(f'\nName updated to: {new_name}')
+            self.customers[customer_id]['name'] = new_name
+            with self._index_lock:
+                self._name_index.add(customer_id, new_name)
+        return self._succeed('Name updated to: %s', new_name)
 
     def modify_customer_email(self, customer_id, new_email):
         """
@@ -284,18 +480,28 @@ class Customers:
             new_email (str): The new email of the customer
 
         Returns:
-            None
+            Result: The outcome of the change
         """
-        if not self.validate_customer_email(new_email):
-            return
-
-        if (customer_id in self.customers and
-                self.customers[customer_id]['email'] == new_email):
-            print('\nError: E-mail was not updated')
-            return
-
-        self.customers[customer_id]['email'] = new_email
-        print(f'\nE-mail updated to: {new_email}')
+        error = self.customer_email_error(new_email)
+        if error is not None:
+            return self._fail(error)
+
+        with self._locks.lock_for(customer_id), self._index_lock:
+            if (customer_id in self.customers and
+                    self.customers[customer_id]['email'] == new_email):
+                return self._fail('E-mail was not updated')
+
+            error = self.unique_contact_error(customer_id, new_email, None)
+            if error is not None:
+                return self._fail(error)
+
+            self._unindex_contact(self._email_index,
+                                  self.customers[customer_id]['email'].
+                                  casefold(), customer_id)
+            self.customers[customer_id]['email'] = new_email
+            self._index_contact(self._email_index, new_email.casefold(),
+                                customer_id)
+        return self._succeed('E-mail updated to: %s', new_email)
 
     def modify_customer_phone(self, customer_id, new_phone):
         """
@@ -305,16 +511,115 @@ class Customers:
             customer_id (str): The ID of the customer
             new_phone (str): The new phone number of the customer
 
+        Returns:
+            Result: The outcome of the change
+        """
+        error = self.customer_phone_error(new_phone)
+        if error is not None:
+            return self._fail(error)
+
+        with self._locks.lock_for(customer_id), self._index_lock:
+            if (customer_id in self.customers and
+                    self.customers[customer_id]['phone'] == new_phone):
+                return self._fail('Phone number was not updated')
+
+            error = self.unique_contact_error(customer_id, None, new_phone)
+            if error is not None:
+                return self._fail(error)
+
+            self._unindex_contact(self._phone_index,
+                                  self.customers[customer_id]['phone'],
+                                  customer_id)
+            self.customers[customer_id]['phone'] = new_phone
+            self._index_contact(self._phone_index, new_phone, customer_id)
+        return self._succeed('Phone number updated to: %s', new_phone)
+
+    @staticmethod
+    def _index_contact(index, key, customer_id):
+        """
+        This function adds a customer to a contact index
+
+        Args:
+            index (dict): The email or phone index
+            key (str): The email or phone number
+            customer_id (str): The ID of the customer
+
         Returns:
             None
         """
-        if not self.validate_customer_phone(new_phone):
-            return
+        index.setdefault(key, {})[customer_id] = None
+
+    @staticmethod
+    def _unindex_contact(index, key, customer_id):
+        """
+        This function removes a customer from a contact index
 
-        if (customer_id in self.customers and
-                self.customers[customer_id]['phone'] == new_phone):
-            print('\nError: Phone number was not updated')
+        Args:
+            index (dict): The email or phone index
+            key (str): The email or phone number
+            customer_id (str): The ID of the customer
+
+        Returns:
+            None
+        """
+        owners = index.get(key)
+        if owners is None:
             return
+        owners.pop(customer_id, None)
+        if not owners:
+            del index[key]
 
-        self.customers[customer_id]['phone'] = new_phone
-        print(f'\nPhone number updated to: {new_phone}')
+    def find_by_email(self, email):
+        """
+        This function finds the customers that use an email
+
+        Args:
+            email (str): The customer email (case-insensitive)
+
+        Returns:
+            list: The IDs of the customers
+        """
+        return list(self._email_index.get(email.casefold(), ()))
+
+    def find_by_phone(self, phone):
+        """
+        This function finds the customers that use a phone number
+
+        Args:
+            phone (str): The customer phone number
+
+        Returns:
+            list: The IDs of the customers
+        """
+        return list(self._phone_index.get(phone, ()))
+
+    def find_by_name_prefix(self, prefix, limit=10):
+        """
+        This function finds the customers with a name word that starts
+        with the given prefix
+
+        Args:
+            prefix (str): The partial name (case-insensitive)
+            limit (int): The maximum number of results
+
+        Returns:
+            list: The IDs of the customers, sorted by the matching name
+        """
+        with self._index_lock:
+            return self._name_index.prefix(prefix, limit)
+
+    def find_by_name_fuzzy(self, name, limit=10):
+        """
+        This function finds the customers whose name is the most
+        similar to the given one, which may be misspelled
+
+        Args:
+            name (str): The name (case-insensitive)
+            limit (int): The maximum number of results
+
+        Returns:
+            list: The IDs of the customers, from the most similar name
+        """
+        with self._index_lock:
+            matches = self._name_index.fuzzy(name, limit)
+        return [customer_id for customer_id, _ in matches]
@@ -0,0 +1,73 @@
+"""
+Customers Benchmark
+
+This program measures the memory used by the customers when
+they are kept as dictionaries and when they are kept in the
+compact storage (ID indexed columns)
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import tracemalloc
+
+from customer_storage import CAPACITY, CompactCustomers
+
+FIRST_NAMES = ('Ana', 'Jose', 'Maria', 'Luis', 'Sofia', 'Carlos')
+LAST_NAMES = ('Lopez', 'Perez', 'Garcia', 'Martinez', 'Hernandez')
+
+
+def build_customer(number):
+    """
+    This function builds the information of a customer
+
+    Args:
+        number (int): The number of the customer
+
+    Returns:
+        dict: The name, email and phone of the customer
+    """
+    return {
+        'name': (f'{FIRST_NAMES[number % len(FIRST_NAMES)]} '
+                 f'{LAST_NAMES[number % len(LAST_NAMES)]}'),
+        'email': f'customer{number}@gmail.com',
+        'phone': f'81{number:08d}'
+    }
+
+
+def measure_memory(compact):
+    """
+    This function measures the memory used by the customers storage,
+    including the strings of the customer fields
+
+    Args:
+        compact (bool): True to use the compact storage
+
+    Returns:
+        int: Bytes used by the storage
+    """
+    tracemalloc.start()
+    storage = CompactCustomers() if compact else {}
+    for number in range(CAPACITY):
+        storage[f'{number:04d}'] = build_customer(number)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    """
+    Main function, prints the memory used by each layout
+
+    Returns:
+        None
+    """
+    print(f'{CAPACITY} customers')
+    print(f'{"layout":>8} {"B/customer":>12}')
+    for compact in (False, True):
+        size = measure_memory(compact)
+        layout = 'compact' if compact else 'dict'
+        print(f'{layout:>8} {size / CAPACITY:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
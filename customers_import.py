@@ -0,0 +1,216 @@
+"""
+Customers Import
+
+This program handles the bulk import of customers from CSV or
+JSON Lines files, which are read as a stream and validated in
+batches
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+
+CUSTOMER_COLUMNS = ('customer_id', 'name', 'email', 'phone')
+
+
+@dataclass
+class RowError:
+    """
+    Class to describe a row that could not be imported
+    """
+    row: int
+    customer_id: str
+    message: str
+
+
+@dataclass
+class ImportReport:
+    """
+    Class to summarize a bulk import of customers. At most max_errors
+    rows are kept in errors, error_count counts all of them
+    """
+    rows_read: int = 0
+    rows_imported: int = 0
+    error_count: int = 0
+    elapsed: float = 0.0
+    max_errors: int = 1000
+    errors: list = field(default_factory=list)
+
+    @property
+    def rows_per_second(self):
+        """
+        This method returns the import throughput
+
+        Returns:
+            float: The rows read per second
+        """
+        if self.elapsed == 0:
+            return 0.0
+        return self.rows_read / self.elapsed
+
+    def add_error(self, row, customer_id, message):
+        """
+        This method records a row that could not be imported
+
+        Args:
+            row (int): The line of the row in the file
+            customer_id (str): The customer ID of the row (if any)
+            message (str): The reason the row was rejected
+
+        Returns:
+            None
+        """
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(RowError(row, customer_id, message))
+
+
+def read_csv_rows(stream):
+    """
+    This function reads the rows of a CSV file with a header
+
+    Args:
+        stream (file): The text stream of the file
+
+    Returns:
+        iterator: (line, row) tuples, where row is a dictionary
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_jsonl_rows(stream):
+    """
+    This function reads the rows of a JSON Lines file
+
+    Args:
+        stream (file): The text stream of the file
+
+    Returns:
+        iterator: (line, row) tuples, where row is a dictionary or
+        None if the line is not a JSON object
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+def row_error(customers, row, batch_ids):
+    """
+    This function checks a row with the Customers validators
+
+    Args:
+        customers (Customers): The Customers object
+        row (dict): The row to be checked
+        batch_ids (set): The customer IDs of the current batch
+
+    Returns:
+        str: The error found, None if the row is valid
+    """
+    if row is None:
+        return 'Row is not a valid record'
+
+    for column in CUSTOMER_COLUMNS:
+        if not isinstance(row.get(column), str):
+            return f'Missing or invalid {column}'
+
+    if row['customer_id'] in batch_ids:
+        return f'{row["customer_id"]} already exists'
+
+    return (customers.customer_id_error(row['customer_id'])
+            or customers.customer_name_error(row['name'])
+            or customers.customer_email_error(row['email'])
+            or customers.customer_phone_error(row['phone']))
+
+
+def import_batch(customers, batch, report):
+    """
+    This function validates a batch of rows and inserts the valid ones
+
+    Args:
+        customers (Customers): The Customers object
+        batch (list): (line, row) tuples
+        report (ImportReport): The report of the import
+
+    Returns:
+        None
+    """
+    valid_rows = []
+    batch_ids = set()
+    for line_number, row in batch:
+        error = row_error(customers, row, batch_ids)
+        if error is not None:
+            customer_id = row.get('customer_id') if row else None
+            report.add_error(line_number, customer_id, error)
+            continue
+        batch_ids.add(row['customer_id'])
+        valid_rows.append((line_number, row))
+
+    for line_number, row in valid_rows:
+        # Contacts are checked on insertion, so rows of the same batch
+        # are checked against each other
+        error = customers.unique_contact_error(None, row['email'],
+                                               row['phone'])
+        if error is not None:
+            report.add_error(line_number, row['customer_id'], error)
+            continue
+        customers.insert_customer(row['customer_id'], row['name'],
+                                  row['email'], row['phone'])
+        report.rows_imported += 1
+
+
+def import_customers(customers, source, file_format=None,
+                     batch_size=1000, max_errors=1000):
+    """
+    This function imports customers from a CSV (with a header with the
+    customer_id, name, email and phone columns) or JSON Lines file.
+    The file is read as a stream and only one batch of rows is kept in
+    memory at a time
+
+    Args:
+        customers (Customers): The Customers object
+        source (str or file): The path of the file or a text stream
+        file_format (str): 'csv' or 'jsonl', taken from the extension
+        of the path when not given
+        batch_size (int): The number of rows validated at a time
+        max_errors (int): The maximum number of rejected rows kept in
+        the report
+
+    Returns:
+        ImportReport: The summary of the import
+    """
+    if file_format is None:
+        extension = os.path.splitext(str(source))[1].lower()
+        file_format = 'csv' if extension == '.csv' else 'jsonl'
+
+    if file_format not in ('csv', 'jsonl'):
+        raise ValueError(f'Unsupported file format: {file_format}')
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline='', encoding='utf-8') as stream:
+            return import_customers(customers, stream, file_format,
+                                    batch_size, max_errors)
+
+    read_rows = read_csv_rows if file_format == 'csv' else read_jsonl_rows
+    rows = read_rows(source)
+    report = ImportReport(max_errors=max_errors)
+    start = time.perf_counter()
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        report.rows_read += len(batch)
+        import_batch(customers, batch, report)
+    report.elapsed = time.perf_counter() - start
+    return report
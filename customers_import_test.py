@@ -0,0 +1,127 @@
+"""
+Customers Import Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- import_customers()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from customers import Customers
+from customers_import import import_customers
+
+
+class CustomersImportTest(unittest.TestCase):
+    """
+    Class to handle the Customers Import Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.customers_obj = Customers()
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_import_csv_happy_path(self):
+        csv_file = io.StringIO(
+            'customer_id,name,email,phone\n'
+            '1234,Jose Lopez,jlopez@gmail.com,6643127401\n'
+            '5678,Ana Perez,aperez@gmail.com,6643127402\n')
+        report = import_customers(self.customers_obj, csv_file, 'csv',
+                                  batch_size=1)
+        # Verifies the customers were imported and indexed
+        self.assertEqual(report.rows_imported, 2)
+        self.assertEqual(report.error_count, 0)
+        self.assertIn('5678', self.customers_obj.customers)
+        self.assertEqual(self.customers_obj.find_by_phone('6643127401'),
+                         ['1234'])
+
+    def test_import_jsonl_file_happy_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'customers.jsonl')
+            with open(path, 'w', encoding='utf-8') as jsonl_file:
+                jsonl_file.write('{"customer_id": "1234", '
+                                 '"name": "Jose Lopez", '
+                                 '"email": "jlopez@gmail.com", '
+                                 '"phone": "6643127401"}\n')
+            report = import_customers(self.customers_obj, path)
+        # Verifies the format was taken from the extension
+        self.assertEqual(report.rows_imported, 1)
+        self.assertEqual(self.customers_obj.customers['1234']['name'],
+                         'Jose Lopez')
+        self.assertGreater(report.rows_per_second, 0)
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # some are missing/None.
+
+    def test_import_neg_path_1(self):
+        # Path 1: Invalid rows are reported with their line
+        jsonl_file = io.StringIO(
+            '{"customer_id": "1234", "name": "Jose Lopez", '
+            '"email": "jlopez@gmail.com", "phone": "6643127401"}\n'
+            'not json\n'
+            '{"customer_id": "1234", "name": "Jose Lopez", '
+            '"email": "jlopez@gmail.com", "phone": "6643127401"}\n'
+            '{"customer_id": "5678", "name": "Ana Perez", '
+            '"email": "aperez", "phone": "6643127402"}\n'
+            '{"customer_id": "9012", "name": "Luis Garcia"}\n')
+        report = import_customers(self.customers_obj, jsonl_file, 'jsonl')
+        self.assertEqual(report.rows_read, 5)
+        self.assertEqual(report.rows_imported, 1)
+        self.assertEqual([(error.row, error.message)
+                          for error in report.errors],
+                         [(2, 'Row is not a valid record'),
+                          (3, '1234 already exists'),
+                          (4, 'Customer email is invalid'),
+                          (5, 'Missing or invalid email')])
+
+    def test_import_neg_path_2(self):
+        # Path 2: Duplicated contacts in the same batch
+        self.customers_obj.unique_contacts = True
+        csv_file = io.StringIO(
+            'customer_id,name,email,phone\n'
+            '1234,Jose Lopez,jlopez@gmail.com,6643127401\n'
+            '5678,Ana Perez,jlopez@gmail.com,6643127402\n')
+        report = import_customers(self.customers_obj, csv_file, 'csv')
+        self.assertEqual(report.rows_imported, 1)
+        self.assertNotIn('5678', self.customers_obj.customers)
+
+    def test_import_neg_path_3(self):
+        # Path 3: Errors beyond the limit are only counted
+        csv_file = io.StringIO('customer_id,name,email,phone\n'
+                               + '12,Jose Lopez,x,1\n' * 5)
+        report = import_customers(self.customers_obj, csv_file, 'csv',
+                                  max_errors=2)
+        self.assertEqual(report.error_count, 5)
+        self.assertEqual(len(report.errors), 2)
+
+    def test_import_neg_path_4(self):
+        # Path 4: Unsupported format
+        with self.assertRaises(ValueError):
+            import_customers(self.customers_obj, io.StringIO(''), 'xml')
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(CustomersImportTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('CustomersImportTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -17,8 +17,14 @@ Author:
     Julia Gabriela Pinedo (A01795315)
 """
 
+import io
+import json
+import threading
 import unittest
+from contextlib import redirect_stdout
 from customers import Customers
+from customer_storage import CompactCustomers
+from sqlite_storage import SqliteStorage
 
 
 class CustomersTest(unittest.TestCase):
@@ -366,6 +372,213 @@ class CustomersTest(unittest.TestCase):
         self.customers_obj.delete_customer('')
         self.assertEqual(len(self.customers_obj.customers), 0)
 
+    # PART 3: This part of the Test Cases covers the email and phone
+    # number indexes.
+
+    def test_find_by_email_and_phone(self):
+        self.customers_obj.create_customer('1234', 'Jose Lopez',
+                                           'jlopez@gmail.com', '6643127401')
+        self.customers_obj.create_customer('5678', 'Ana Perez',
+                                           'aperez@gmail.com', '6643127402')
+        # Verifies both indexes find the customer
+        self.assertEqual(self.customers_obj.find_by_email(
+            'JLopez@gmail.com'), ['1234'])
+        self.assertEqual(self.customers_obj.find_by_phone('6643127402'),
+                         ['5678'])
+        self.assertEqual(self.customers_obj.find_by_phone('0000000000'), [])
+
+    def test_find_by_email_after_modification(self):
+        self.customers_obj.create_customer('1234', 'Jose Lopez',
+                                           'jlopez@gmail.com', '6643127401')
+        self.customers_obj.modify_customer_information(
+            '1234', new_email='jose@gmail.com', new_phone='6643127409')
+        # Verifies the indexes follow the new email and phone
+        self.assertEqual(self.customers_obj.find_by_email(
+            'jlopez@gmail.com'), [])
+        self.assertEqual(self.customers_obj.find_by_email(
+            'jose@gmail.com'), ['1234'])
+        self.assertEqual(self.customers_obj.find_by_phone('6643127409'),
+                         ['1234'])
+        self.customers_obj.delete_customer('1234')
+        self.assertEqual(self.customers_obj.find_by_email(
+            'jose@gmail.com'), [])
+        self.assertEqual(self.customers_obj.find_by_phone('6643127409'), [])
+
+    def test_unique_contacts_neg_path_1(self):
+        # Path 1: Email already used by another customer
+        self.customers_obj.unique_contacts = True
+        self.customers_obj.create_customer('1234', 'Jose Lopez',
+                                           'jlopez@gmail.com', '6643127401')
+        self.customers_obj.create_customer('5678', 'Ana Perez',
+                                           'JLOPEZ@gmail.com', '6643127402')
+        self.assertNotIn('5678', self.customers_obj.customers)
+
+    def test_unique_contacts_neg_path_2(self):
+        # Path 2: Phone changed to one used by another customer
+        self.customers_obj.unique_contacts = True
+        self.customers_obj.create_customer('1234', 'Jose Lopez',
+                                           'jlopez@gmail.com', '6643127401')
+        self.customers_obj.create_customer('5678', 'Ana Perez',
+                                           'aperez@gmail.com', '6643127402')
+        self.customers_obj.modify_customer_phone('5678', '6643127401')
+        self.assertEqual(self.customers_obj.customers['5678']['phone'],
+                         '6643127402')
+        self.assertEqual(self.customers_obj.find_by_phone('6643127401'),
+                         ['1234'])
+
+    # PART 4: This part of the Test Cases covers the search of
+    # customers by name.
+
+    def test_find_by_name(self):
+        self.customers_obj.create_customer('1234', 'Jose Lopez',
+                                           'jlopez@gmail.com', '6643127401')
+        self.customers_obj.create_customer('5678', 'Ana Perez',
+                                           'aperez@gmail.com', '6643127402')
+        # Verifies partial and misspelled names find the customer
+        self.assertEqual(self.customers_obj.find_by_name_prefix('lop'),
+                         ['1234'])
+        self.assertEqual(self.customers_obj.find_by_name_fuzzy(
+            'Ana Peres')[0], '5678')
+
+    def test_find_by_name_after_modification(self):
+        self.customers_obj.create_customer('1234', 'Jose Lopez',
+                                           'jlopez@gmail.com', '6643127401')
+        self.customers_obj.modify_customer_name('1234', 'Pedro Lopez')
+        # Verifies the index follows the new name and the removal
+        self.assertEqual(self.customers_obj.find_by_name_prefix('jose'), [])
+        self.assertEqual(self.customers_obj.find_by_name_prefix('pedro'),
+                         ['1234'])
+        self.customers_obj.delete_customer('1234')
+        self.assertEqual(self.customers_obj.find_by_name_prefix('pedro'), [])
+
+    def test_customer_results(self):
+        result = self.customers_obj.create_customer('1234',
+                                                    'Juan Lopez',
+                                                    'juanlopez@gmail.com',
+                                                    '2348760981')
+        self.assertTrue(result)
+        result = self.customers_obj.display_customer_information('1234')
+        self.assertIn('Name: Juan Lopez', result.message)
+        result = self.customers_obj.modify_customer_information(
+            '1234', new_name='Juan Perez', new_phone='2348760981')
+        # Verifies the phone number was not updated
+        self.assertFalse(result)
+        self.assertEqual([item.ok for item in result.data], [True, False])
+        self.assertEqual(result.text, 'Error: ID: 1234 information was '
+                                      'not fully modified')
+
+    def test_display_customer_information_stream(self):
+        self.customers_obj.create_customer('1234', 'Juan Lopez',
+                                           'juanlopez@gmail.com',
+                                           '2348760981')
+        stream = io.StringIO()
+        result = self.customers_obj.display_customer_information(
+            '1234', 'json', stream=stream)
+        self.assertEqual(result.data, 1)
+        self.assertEqual(json.loads(stream.getvalue())['name'],
+                         'Juan Lopez')
+        result = self.customers_obj.display_customer_information('1234',
+                                                                 'xml')
+        self.assertEqual(result.text, 'Error: Invalid output format: xml')
+
+    def test_customer_results_neg_path_1(self):
+        # Path 1: Invalid email
+        result = self.customers_obj.create_customer('1234',
+                                                    'Juan Lopez',
+                                                    'juanlopez',
+                                                    '2348760981')
+        self.assertFalse(result)
+        self.assertEqual(result.text, 'Error: Customer email is invalid')
+
+    def test_validate_customer_information(self):
+        stream = io.StringIO()
+        # Verifies the validators are called on the class and print
+        # their errors
+        with redirect_stdout(stream):
+            self.assertTrue(Customers.validate_customer_name('Juan Lopez'))
+            self.assertTrue(
+                Customers.validate_customer_phone('2348760981'))
+            self.assertFalse(Customers.validate_customer_email('juanlopez'))
+        self.assertEqual(stream.getvalue(),
+                         '\nError: Customer email is invalid\n')
+
+    def test_concurrent_create_customer(self):
+        customers_obj = Customers(unique_contacts=True, sink=None,
+                                  concurrent=True)
+        results = []
+
+        def create(number):
+            results.append(customers_obj.create_customer(
+                f'{number:04d}', 'Juan Lopez', 'juanlopez@gmail.com',
+                '2348760981'))
+
+        threads = [threading.Thread(target=create, args=(number,))
+                   for number in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Verifies only one customer got the email and phone number
+        self.assertEqual(sum(1 for result in results if result), 1)
+        self.assertEqual(len(customers_obj.find_by_email(
+            'juanlopez@gmail.com')), 1)
+
+
+class CompactCustomersTest(CustomersTest):
+    """
+    Class to run the Customers Test Cases with the compact storage
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.customers_obj = Customers(compact=True)
+
+    def test_compact_customers_storage(self):
+        self.customers_obj.create_customer('0042', 'Ana Perez',
+                                           'aperez@gmail.com', '8112345678')
+        self.customers_obj.create_customer('0009', 'Ana Perez',
+                                           'aperez2@gmail.com', '8112345679')
+        customers = self.customers_obj.customers
+        # Verifies the customers are kept in the ID indexed columns
+        self.assertIsInstance(customers, CompactCustomers)
+        self.assertEqual(list(customers), ['0009', '0042'])
+        self.assertEqual(customers.names[42], 'Ana Perez')
+        self.assertIs(customers.names[9], customers.names[42])
+        self.customers_obj.delete_customer('0042')
+        self.assertEqual(dict(customers['0009']),
+                         {'name': 'Ana Perez',
+                          'email': 'aperez2@gmail.com',
+                          'phone': '8112345679'})
+        self.assertNotIn('0042', customers)
+
+
+class SqliteCustomersTest(CustomersTest):
+    """
+    Class to run the Customers Test Cases with the SQLite storage
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.storage = SqliteStorage(':memory:')
+        self.customers_obj = Customers(storage=self.storage)
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.storage.close()
+
 
 # This part of the code prints the results from the Unit Tests performed
 if __name__ == '__main__':
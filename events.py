@@ -0,0 +1,312 @@
+"""
+Events
+
+This program handles the results of the operations of the
+Hotels, Customers and Reservations classes and the sinks their
+messages are sent to (console, buffer, collection)
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import sys
+
+
+class Result:
+    """
+    Class to describe the outcome of an operation. Its message is
+    only formatted when it is read, so results that nobody looks at
+    cost no string formatting
+    """
+    __slots__ = ('ok', 'data', '_template', '_args')
+
+    def __init__(self, ok, template, args=(), data=None):
+        """
+        Initializes the Result object
+
+        Args:
+            ok (bool): True if the operation succeeded
+            template (str): The message, with %s placeholders for args
+            args (tuple): The values of the placeholders
+            data (object): The value produced by the operation
+            (if applicable)
+
+        Returns:
+            None
+        """
+        self.ok = ok
+        self.data = data
+        self._template = template
+        self._args = args
+
+    def __bool__(self):
+        """
+        This method makes a result true when the operation succeeded
+
+        Returns:
+            bool: True if the operation succeeded, False otherwise
+        """
+        return self.ok
+
+    def __repr__(self):
+        """
+        This method represents the result
+
+        Returns:
+            str: The representation of the result
+        """
+        return f'Result(ok={self.ok}, message={self.message!r})'
+
+    @property
+    def message(self):
+        """
+        This method formats the message of the result
+
+        Returns:
+            str: The message
+        """
+        if self._args:
+            return self._template % self._args
+        return self._template
+
+    @property
+    def text(self):
+        """
+        This method formats the message as it is shown to users,
+        errors start with 'Error: '
+
+        Returns:
+            str: The text of the result
+        """
+        if self.ok:
+            return self.message
+        return f'Error: {self.message}'
+
+
+class ConsoleSink:
+    """
+    Class to print every result as soon as it is emitted, as the
+    programs have always done
+    """
+    def __init__(self, stream=None):
+        """
+        Initializes the ConsoleSink object
+
+        Args:
+            stream (file): The text stream to write to, the current
+            standard output when not given
+
+        Returns:
+            None
+        """
+        self.stream = stream
+
+    def emit(self, result):
+        """
+        This method prints a result
+
+        Args:
+            result (Result): The result to be printed
+
+        Returns:
+            None
+        """
+        print(f'\n{result.text}', file=self.stream or sys.stdout)
+
+
+class BufferedSink:
+    """
+    Class to collect the text of the results and write them in one
+    batch when the buffer is full, when it is flushed or when the
+    sink is closed (for example at the end of a with block)
+    """
+    def __init__(self, stream=None, capacity=1000):
+        """
+        Initializes the BufferedSink object
+
+        Args:
+            stream (file): The text stream to write to, the current
+            standard output when not given
+            capacity (int): The number of results kept before writing
+
+        Returns:
+            None
+        """
+        self.stream = stream
+        self.capacity = capacity
+        self._texts = []
+
+    def __enter__(self):
+        """
+        This method starts using the sink in a with block
+
+        Returns:
+            BufferedSink: The sink
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        This method writes the pending results at the end of a with
+        block
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def emit(self, result):
+        """
+        This method buffers a result
+
+        Args:
+            result (Result): The result to be written
+
+        Returns:
+            None
+        """
+        self._texts.append(result.text)
+        if len(self._texts) >= self.capacity:
+            self.flush()
+
+    def flush(self):
+        """
+        This method writes the buffered results
+
+        Returns:
+            None
+        """
+        if not self._texts:
+            return
+        stream = self.stream or sys.stdout
+        stream.write(''.join(f'\n{text}\n' for text in self._texts))
+        self._texts.clear()
+
+    def close(self):
+        """
+        This method writes the pending results
+
+        Returns:
+            None
+        """
+        self.flush()
+
+
+class CollectingSink:
+    """
+    Class to keep the emitted results in a list
+    """
+    def __init__(self):
+        """
+        Initializes the CollectingSink object
+
+        Returns:
+            None
+        """
+        self.results = []
+
+    def emit(self, result):
+        """
+        This method keeps a result
+
+        Args:
+            result (Result): The result to be kept
+
+        Returns:
+            None
+        """
+        self.results.append(result)
+
+    @property
+    def errors(self):
+        """
+        This method lists the results of the failed operations
+
+        Returns:
+            list: The failed results
+        """
+        return [result for result in self.results if not result.ok]
+
+
+CONSOLE_SINK = ConsoleSink()
+
+
+def report(error, sink=CONSOLE_SINK):
+    """
+    This function emits the error of a validation (if any)
+
+    Args:
+        error (str): The error found, None if there is none
+        sink (object): The sink the error is sent to, None to drop it
+        (if applicable)
+
+    Returns:
+        bool: True if there is no error, False otherwise
+    """
+    if error is None:
+        return True
+    if sink is not None:
+        sink.emit(Result(False, error))
+    return False
+
+
+class EventEmitter:
+    """
+    Class to give the Hotels, Customers and Reservations classes their
+    results. Results are sent to the sink attribute, and nothing is
+    done with them when the sink is None
+    """
+    sink = CONSOLE_SINK
+
+    def _emit(self, result):
+        """
+        This method sends a result to the sink (if any)
+
+        Args:
+            result (Result): The result to be sent
+
+        Returns:
+            Result: The same result
+        """
+        if self.sink is not None:
+            self.sink.emit(result)
+        return result
+
+    def _succeed(self, template, *args, data=None):
+        """
+        This method emits the result of a successful operation
+
+        Args:
+            template (str): The message, with %s placeholders
+            args (tuple): The values of the placeholders
+            data (object): The value produced (if applicable)
+
+        Returns:
+            Result: The successful result
+        """
+        return self._emit(Result(True, template, args, data))
+
+    def _fail(self, template, *args, data=None):
+        """
+        This method emits the result of a failed operation
+
+        Args:
+            template (str): The error, with %s placeholders
+            args (tuple): The values of the placeholders
+            data (object): Additional information (if applicable)
+
+        Returns:
+            Result: The failed result
+        """
+        return self._emit(Result(False, template, args, data))
+
+    def _report(self, error):
+        """
+        This method emits the error of a validation (if any)
+
+        Args:
+            error (str): The error found, None if there is none
+
+        Returns:
+            bool: True if there is no error, False otherwise
+        """
+        return report(error, self.sink)
@@ -0,0 +1,114 @@
+"""
+Events Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following classes:
+
+- Result
+- ConsoleSink
+- BufferedSink
+- CollectingSink
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import io
+import unittest
+from events import BufferedSink, CollectingSink, ConsoleSink, Result
+from hotels import Hotels
+
+
+class EventsTest(unittest.TestCase):
+    """
+    Class to handle the Events Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.stream = io.StringIO()
+        self.sink = CollectingSink()
+        self.hotels_obj = Hotels(sink=self.sink)
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_result_happy_path(self):
+        result = Result(True, 'Room %s added successfully to %s',
+                        ('101', 'Hotel Uno'))
+        self.assertTrue(result)
+        self.assertEqual(result.message,
+                         'Room 101 added successfully to Hotel Uno')
+        self.assertEqual(result.text, result.message)
+
+    def test_console_sink_happy_path(self):
+        ConsoleSink(self.stream).emit(Result(True, 'Hotel Uno created '
+                                             'successfully'))
+        self.assertEqual(self.stream.getvalue(),
+                         '\nHotel Uno created successfully\n')
+
+    def test_buffered_sink_happy_path(self):
+        with BufferedSink(self.stream, capacity=10) as sink:
+            sink.emit(Result(True, 'First'))
+            sink.emit(Result(False, 'Second'))
+            # Verifies nothing is written until the block ends
+            self.assertEqual(self.stream.getvalue(), '')
+        self.assertEqual(self.stream.getvalue(),
+                         '\nFirst\n\nError: Second\n')
+
+    def test_collecting_sink_happy_path(self):
+        result = self.hotels_obj.create_hotel(
+            'Hotel Uno', 'Monterrey',
+            {'101': {'status': 'available', 'type': 'single'}})
+        self.assertTrue(result)
+        self.assertEqual([item.message for item in self.sink.results],
+                         ['Hotel Uno created successfully',
+                          'Room 101 added successfully to Hotel Uno'])
+        self.assertEqual(len(result.data), 1)
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_result_neg_path_1(self):
+        # Path 1: Failed operation
+        result = Result(False, '%s does not exist', ('Hotel Dos',))
+        self.assertFalse(result)
+        self.assertEqual(result.text, 'Error: Hotel Dos does not exist')
+
+    def test_buffered_sink_neg_path_1(self):
+        # Path 1: Buffer is full before the sink is closed
+        sink = BufferedSink(self.stream, capacity=2)
+        sink.emit(Result(True, 'First'))
+        sink.emit(Result(True, 'Second'))
+        self.assertEqual(self.stream.getvalue(), '\nFirst\n\nSecond\n')
+
+    def test_collecting_sink_neg_path_1(self):
+        # Path 1: Hotel that does not exist
+        result = self.hotels_obj.delete_hotel('Hotel Dos')
+        self.assertFalse(result)
+        self.assertEqual(self.sink.errors, [result])
+
+    def test_no_sink_neg_path_1(self):
+        # Path 1: Results are discarded without a sink
+        self.hotels_obj.sink = None
+        result = self.hotels_obj.delete_hotel('Hotel Dos')
+        self.assertFalse(result)
+        self.assertEqual(self.sink.results, [])
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(EventsTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('EventsTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
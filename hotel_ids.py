@@ -0,0 +1,154 @@
+"""
+Hotel IDs
+
+This program handles the table that gives every Hotel name
+a stable integer ID, so the Hotels can be renamed without
+changing the records that refer to them
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+
+class HotelIds:
+    """
+    Class to keep the name of each Hotel ID and the ID of each Hotel
+    name. An ID stays with its Hotel when the Hotel is renamed and is
+    never given to another Hotel
+    """
+    def __init__(self):
+        """
+        Initializes the HotelIds object
+
+        Returns:
+            None
+        """
+        self._ids = {}
+        self._names = {}
+        self._next_id = 1
+
+    def __len__(self):
+        """
+        This method returns the number of Hotels with an ID
+
+        Returns:
+            int: The number of Hotels
+        """
+        return len(self._ids)
+
+    def __contains__(self, hotel_name):
+        """
+        This method checks whether a Hotel name has an ID
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            bool: True if the name has an ID, False otherwise
+        """
+        return hotel_name in self._ids
+
+    def intern(self, hotel_name, hotel_id=None):
+        """
+        This method gives an ID to a Hotel name, or returns the ID it
+        already has
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            hotel_id (int): The ID the Hotel was stored with, a new ID
+            is given if it is None (if applicable)
+
+        Returns:
+            int: The ID of the Hotel
+
+        Raises:
+            ValueError: If the ID belongs to another Hotel
+        """
+        current_id = self._ids.get(hotel_name)
+        if current_id is not None:
+            return current_id
+
+        if hotel_id is None:
+            hotel_id = self._next_id
+        elif hotel_id in self._names:
+            raise ValueError(f'Hotel ID {hotel_id} belongs to '
+                             f'{self._names[hotel_id]}')
+        self._next_id = max(self._next_id, hotel_id + 1)
+        self._ids[hotel_name] = hotel_id
+        self._names[hotel_id] = hotel_name
+        return hotel_id
+
+    def get(self, hotel_name):
+        """
+        This method finds the ID of a Hotel name
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            int: The ID of the Hotel, None if it has no ID
+        """
+        return self._ids.get(hotel_name)
+
+    def name(self, hotel_id):
+        """
+        This method finds the current name of a Hotel ID
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            str: The name of the Hotel, None if the ID is not used
+        """
+        return self._names.get(hotel_id)
+
+    def rename(self, hotel_name, new_hotel_name):
+        """
+        This method moves the ID of a Hotel to its new name
+
+        Args:
+            hotel_name (str): The current name of the Hotel
+            new_hotel_name (str): The new name of the Hotel
+
+        Returns:
+            int: The ID of the Hotel
+
+        Raises:
+            KeyError: If the Hotel has no ID
+            ValueError: If the new name already has an ID
+        """
+        if new_hotel_name in self._ids:
+            raise ValueError(f'{new_hotel_name} already has an ID')
+        hotel_id = self._ids.pop(hotel_name)
+        self._ids[new_hotel_name] = hotel_id
+        self._names[hotel_id] = new_hotel_name
+        return hotel_id
+
+    def release(self, hotel_name):
+        """
+        This method removes the ID of a deleted Hotel, the ID is not
+        given to any other Hotel
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            int: The ID of the Hotel, None if it had no ID
+        """
+        hotel_id = self._ids.pop(hotel_name, None)
+        if hotel_id is not None:
+            del self._names[hotel_id]
+        return hotel_id
+
+    def retire(self, hotel_id):
+        """
+        This method marks an ID as used, so a Hotel deleted before the
+        IDs were loaded does not give its ID to a new Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            None
+        """
+        self._next_id = max(self._next_id, hotel_id + 1)
@@ -0,0 +1,90 @@
+"""
+Hotel IDs Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- intern()
+- rename()
+- release()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import unittest
+from hotel_ids import HotelIds
+
+
+class HotelIdsTest(unittest.TestCase):
+    """
+    Class to handle the HotelIds Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.ids_obj = HotelIds()
+        self.ids_obj.intern('Hotel Uno')
+        self.ids_obj.intern('Hotel Dos')
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_intern_happy_path(self):
+        self.assertEqual(self.ids_obj.intern('Hotel Uno'), 1)
+        self.assertEqual(self.ids_obj.intern('Hotel Tres', 10), 10)
+        # Verifies the next ID follows the largest one given
+        self.assertEqual(self.ids_obj.intern('Hotel Cuatro'), 11)
+        self.assertEqual(self.ids_obj.name(10), 'Hotel Tres')
+        self.assertEqual(len(self.ids_obj), 4)
+
+    def test_rename_happy_path(self):
+        self.assertEqual(self.ids_obj.rename('Hotel Uno', 'Hotel Once'), 1)
+        self.assertEqual(self.ids_obj.get('Hotel Once'), 1)
+        self.assertEqual(self.ids_obj.name(1), 'Hotel Once')
+        self.assertNotIn('Hotel Uno', self.ids_obj)
+
+    def test_release_happy_path(self):
+        self.assertEqual(self.ids_obj.release('Hotel Dos'), 2)
+        self.assertIsNone(self.ids_obj.name(2))
+        # Verifies the released ID is not given again
+        self.assertEqual(self.ids_obj.intern('Hotel Dos'), 3)
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_intern_neg_path_1(self):
+        # Path 1: ID that belongs to another Hotel
+        with self.assertRaises(ValueError):
+            self.ids_obj.intern('Hotel Tres', 2)
+
+    def test_rename_neg_path_1(self):
+        # Path 1: Hotel without ID or new name already used
+        with self.assertRaises(KeyError):
+            self.ids_obj.rename('Hotel Tres', 'Hotel Cuatro')
+        with self.assertRaises(ValueError):
+            self.ids_obj.rename('Hotel Uno', 'Hotel Dos')
+        self.assertEqual(self.ids_obj.get('Hotel Uno'), 1)
+
+    def test_release_neg_path_1(self):
+        # Path 1: Hotel without ID
+        self.assertIsNone(self.ids_obj.release('Hotel Tres'))
+        self.assertIsNone(self.ids_obj.get('Hotel Tres'))
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(HotelIdsTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('HotelIdsTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
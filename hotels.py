@@ -8,412 +8,1829 @@ Author:
     Julia Gabriela Pinedo (A01795315)
 """
 import re
+import threading
+from dataclasses import dataclass, field
+from itertools import islice
 
+from events import CONSOLE_SINK, EventEmitter, Result, report
+from hotel_ids import HotelIds
+from locking import NULL_LOCK, make_lock
+from render import hotel_lines, write_lines
+from room_calendar import RoomCalendar, stay_dates_error
+from room_map import MappedRooms
+from room_storage import CompactRooms
+from views import ViewRegistry
 
-class Hotels:
+
+class RoomPool:
     """
-    Class to handle the hotels operations
+    Class to keep a set of room numbers with O(1) insertion,
+    removal and picking of any member
+    """
+    def __init__(self, room_numbers=()):
+        """
+        Initializes the RoomPool object
+
+        Args:
+            room_numbers (iterable): The rooms of the pool, without
+            repeated numbers (if applicable)
+
+        Returns:
+            None
+        """
+        self._rooms = list(room_numbers)
+        self._positions = {room_number: position for position, room_number
+                           in enumerate(self._rooms)}
+
+    def __len__(self):
+        """
+        This method returns the number of rooms in the pool
+
+        Returns:
+            int: The number of rooms
+        """
+        return len(self._rooms)
+
+    def __iter__(self):
+        """
+        This method iterates over the rooms in the pool
+
+        Returns:
+            iterator: The room numbers
+        """
+        return iter(list(self._rooms))
+
+    def __contains__(self, room_number):
+        """
+        This method checks whether a room is in the pool
+
+        Args:
+            room_number (str): The number of the room
+
+        Returns:
+            bool: True if the room is in the pool, False otherwise
+        """
+        return room_number in self._positions
+
+    def add(self, room_number):
+        """
+        This method adds a room to the pool
+
+        Args:
+            room_number (str): The number of the room
+
+        Returns:
+            None
+        """
+        if room_number in self._positions:
+            return
+        self._positions[room_number] = len(self._rooms)
+        self._rooms.append(room_number)
+
+    def discard(self, room_number):
+        """
+        This method removes a room from the pool (if it is there) by
+        moving the last room into its position
+
+        Args:
+            room_number (str): The number of the room
+
+        Returns:
+            None
+        """
+        position = self._positions.pop(room_number, None)
+        if position is None:
+            return
+        last_room = self._rooms.pop()
+        if last_room != room_number:
+            self._rooms[position] = last_room
+            self._positions[last_room] = position
+
+    def pick(self):
+        """
+        This method returns any room of the pool without removing it
+
+        Returns:
+            str: A room number, None if the pool is empty
+        """
+        try:
+            return self._rooms[-1]
+        except IndexError:
+            return None
+
+
+def normalize_location(location):
+    """
+    This function folds the case and the whitespace of a location, so
+    'Monterrey' and ' monterrey ' are the same location
+
+    Args:
+        location (str): The location of a Hotel
+
+    Returns:
+        str: The normalized location
+    """
+    return ' '.join(location.split()).casefold()
+
+
+class LocationIndex:
+    """
+    Class to keep the IDs of the Hotels of each normalized location and
+    the number of rooms of each location, so the Hotels of a location
+    are listed and its rooms are counted without scanning every Hotel
     """
     def __init__(self):
         """
-        Initializes the Hotels object
+        Initializes the LocationIndex object
+
+        Returns:
+            None
+        """
+        # Hotel IDs of each location, in the order they were added
+        self._hotels = {}
+        self._rooms = {}
+        # Location and number of rooms of each Hotel ID
+        self._by_hotel = {}
+
+    def add(self, hotel_id, location, rooms=0):
+        """
+        This method adds a Hotel to its location
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            location (str): The location of the Hotel
+            rooms (int): The number of rooms of the Hotel
+
+        Returns:
+            None
+        """
+        key = normalize_location(location)
+        self._hotels.setdefault(key, {})[hotel_id] = None
+        self._rooms[key] = self._rooms.get(key, 0) + rooms
+        self._by_hotel[hotel_id] = [key, rooms]
+
+    def remove(self, hotel_id):
+        """
+        This method removes a Hotel from its location (if it is there)
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            int: The number of rooms of the Hotel, 0 if it was not there
+        """
+        entry = self._by_hotel.pop(hotel_id, None)
+        if entry is None:
+            return 0
+        key, rooms = entry
+        hotel_ids = self._hotels[key]
+        del hotel_ids[hotel_id]
+        self._rooms[key] -= rooms
+        if not hotel_ids:
+            del self._hotels[key]
+            del self._rooms[key]
+        return rooms
+
+    def move(self, hotel_id, location):
+        """
+        This method moves a Hotel and its rooms to another location
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            location (str): The new location of the Hotel
+
+        Returns:
+            None
+        """
+        self.add(hotel_id, location, self.remove(hotel_id))
+
+    def add_rooms(self, hotel_id, count):
+        """
+        This method counts rooms added to a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            count (int): The number of rooms added
+
+        Returns:
+            None
+        """
+        entry = self._by_hotel.get(hotel_id)
+        if entry is not None:
+            entry[1] += count
+            self._rooms[entry[0]] += count
+
+    def location_of(self, hotel_id):
+        """
+        This method finds the location of a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            str: The normalized location, None if the Hotel is not there
+        """
+        entry = self._by_hotel.get(hotel_id)
+        return None if entry is None else entry[0]
+
+    def hotel_ids(self, location):
+        """
+        This method lists the Hotels of a location
+
+        Args:
+            location (str): The location, in any case and spacing
+
+        Returns:
+            list: The IDs of the Hotels in the order they were added
+        """
+        return list(self._hotels.get(normalize_location(location), ()))
+
+    def room_count(self, location):
+        """
+        This method returns the number of rooms of a location
+
+        Args:
+            location (str): The location, in any case and spacing
+
+        Returns:
+            int: The number of rooms of the Hotels of the location
+        """
+        return self._rooms.get(normalize_location(location), 0)
+
+    def room_counts(self):
+        """
+        This method returns the number of rooms of every location
+
+        Returns:
+            dict: The number of rooms by normalized location
+        """
+        return dict(self._rooms)
+
+
+class OccupancyCounters:
+    """
+    Class to count the rooms of each Hotel and of all the Hotels by
+    (status, type). The counts are updated as the rooms change, so the
+    occupancy is read without counting any room
+    """
+    def __init__(self, concurrent=False):
+        """
+        Initializes the OccupancyCounters object
+
+        Args:
+            concurrent (bool): True if the counters are shared by
+            threads, the totals are changed by every Hotel
+
+        Returns:
+            None
+        """
+        # Number of rooms of each Hotel ID by (status, type)
+        self._hotels = {}
+        # Number of rooms of all the Hotels by (status, type)
+        self._totals = {}
+        self._lock = make_lock(concurrent)
+
+    def add_hotel(self, hotel_id, counts):
+        """
+        This method starts counting the rooms of a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            counts (dict): The number of rooms by (status, type)
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._hotels[hotel_id] = dict(counts)
+            for key, count in counts.items():
+                self._totals[key] = self._totals.get(key, 0) + count
+
+    def remove_hotel(self, hotel_id):
+        """
+        This method stops counting the rooms of a Hotel (if it is
+        counted) and takes them out of the totals
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            dict: The number of rooms the Hotel had by (status, type)
+        """
+        with self._lock:
+            counts = self._hotels.pop(hotel_id, {})
+            for key, count in counts.items():
+                self._totals[key] -= count
+            return counts
+
+    def move(self, hotel_id, key, step):
+        """
+        This method adds rooms to, or takes rooms from, one (status,
+        type) of a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            key (tuple): The (status, type) of the rooms
+            step (int): The number of rooms added, negative if taken
+
+        Returns:
+            None
+        """
+        with self._lock:
+            counts = self._hotels.get(hotel_id)
+            if counts is not None:
+                counts[key] = counts.get(key, 0) + step
+                self._totals[key] = self._totals.get(key, 0) + step
+
+    def hotel_counts(self, hotel_id):
+        """
+        This method returns the counts of a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            dict: The number of rooms by (status, type), None if the
+            Hotel is not counted
+        """
+        with self._lock:
+            counts = self._hotels.get(hotel_id)
+            return None if counts is None else dict(counts)
+
+    def totals(self):
+        """
+        This method returns the counts of all the Hotels
+
+        Returns:
+            dict: The number of rooms by (status, type)
+        """
+        with self._lock:
+            return dict(self._totals)
+
+
+@dataclass
+class HotelLoadSummary:
+    """
+    Class to summarize a bulk creation of a Hotel and its rooms
+    """
+    hotel_name: str
+    created: bool = False
+    rooms_created: int = 0
+    rooms_by_type: dict = field(default_factory=dict)
+    errors: list = field(default_factory=list)
+
+    def __bool__(self):
+        """
+        This method makes a summary true when the Hotel was created
+
+        Returns:
+            bool: True if the Hotel was created, False otherwise
+        """
+        return self.created
+
+
+@dataclass
+class Occupancy:
+    """
+    Class to summarize the rooms of a Hotel, or of all the Hotels, by
+    status and by type
+    """
+    total: int = 0
+    reserved: int = 0
+    available: int = 0
+    # Total, reserved and available rooms of each type
+    by_type: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_counts(cls, counts):
+        """
+        This method builds the summary of the counts of the rooms
+
+        Args:
+            counts (dict): The number of rooms by (status, type)
+
+        Returns:
+            Occupancy: The summary of the rooms
+        """
+        occupancy = cls()
+        for (status, room_type), count in sorted(counts.items()):
+            if not count:
+                continue
+            by_type = occupancy.by_type.setdefault(
+                room_type, {'total': 0, 'reserved': 0, 'available': 0})
+            by_type['total'] += count
+            by_type[status] += count
+            occupancy.total += count
+            if status == 'reserved':
+                occupancy.reserved += count
+            else:
+                occupancy.available += count
+        return occupancy
+
+    @property
+    def rate(self):
+        """
+        This method returns the share of the rooms that are reserved
+
+        Returns:
+            float: The reserved rooms over all the rooms, 0.0 if there
+            are no rooms
+        """
+        return self.reserved / self.total if self.total else 0.0
+
+
+class Hotels(EventEmitter):
+    """
+    Class to handle the hotels operations
+    """
+    def __init__(self, compact=False, sink=CONSOLE_SINK,
+                 concurrent=False, storage=None):
+        """
+        Initializes the Hotels object
+
+        Args:
+            compact (bool): True to keep the rooms of each Hotel in
+            byte columns (CompactRooms) instead of dictionaries
+            sink (object): The sink the results are sent to, None to
+            discard them
+            concurrent (bool): True if the object is shared by threads,
+            so Hotels are added, renamed and deleted under a lock
+            storage (SqliteStorage or RoomMap): The database or room
+            map file the Hotels are kept in instead of dictionaries,
+            the Hotels already stored in it are indexed (if applicable)
+
+        Returns:
+            None
+        """
+        self.hotels = {} if storage is None else storage.hotels
+        self.sink = sink
+        self._compact = compact and storage is None
+        # Stable ID of each Hotel name, the indexes below are kept by
+        # ID so renaming a Hotel does not move them
+        self.hotel_ids = HotelIds()
+        # Room numbers of each Hotel grouped by (status, type)
+        self._room_index = {}
+        # Date-ranged bookings of each room of each Hotel
+        self._calendars = {}
+        # Lock of each Hotel, held while the status or the bookings of
+        # its rooms are checked and changed
+        self._locks = {}
+        # Hotel IDs and number of rooms of each location
+        self._locations = LocationIndex()
+        # Rooms of each Hotel and of all the Hotels by (status, type)
+        self._occupancy = OccupancyCounters(concurrent)
+        # Materialized views updated with the counters above
+        self._views = ViewRegistry(concurrent)
+        # Held while Hotels are added, renamed or deleted, the rooms of
+        # different Hotels only wait for the lock of their own Hotel
+        self._registry_lock = make_lock(concurrent)
+        self.concurrent = concurrent
+        for hotel_name, hotel in list(self.hotels.items()):
+            rooms = hotel['rooms']
+            self._register_hotel(
+                self.hotel_ids.intern(hotel_name, hotel.get('hotel_id')),
+                self._room_pools(rooms), hotel['location'], len(rooms))
+
+    def create_hotel(self, hotel_name, location, rooms_info):
+        """
+        This method handles the creation of a Hotel dictionary
+
+        Args:
+            hotel_name (str): The name of the Hotel to be created
+            location (str): The location of the Hotel
+            rooms_info (dict): A dictionary containing the room
+            numbers as keys and dictionaries containing room details
+            (status, type) as values
+
+        Returns:
+            Result: The outcome of the creation, its data is the list
+            of the outcomes of the rooms
+        """
+        error = (self.hotel_name_error(hotel_name)
+                 or self.hotel_location_error(location))
+        if error is not None:
+            return self._fail(error)
+
+        # Creates the "Hotel" dictionary
+        if not self._add_hotel(hotel_name, location):
+            return self._fail('%s already exists', hotel_name)
+        room_results = []
+        result = self._succeed('%s created successfully', hotel_name,
+                               data=room_results)
+
+        for room_number, room_details in rooms_info.items():
+            error = self.new_room_error(room_number, room_details)
+            if error is not None:
+                room_results.append(self._fail(error))
+                continue
+
+            # Creates the "rooms_info" dictionary
+            room_results.append(
+                self.create_hotel_room(hotel_name, room_number,
+                                       room_details['status'],
+                                       room_details['type']))
+        return result
+
+    def create_hotel_room(self, hotel_name, room_number, status, room_type):
+        """
+        This method creates a hotel room dictionary for a given hotel
+
+        Args:
+            hotel_name (str): The name of the Hotel (already created)
+            room_number (str): The number of the room(s) of the Hotel
+            status (str): The status of the room(s), 'reserved' or 'available'
+            room_type (str): The type of room(s), 'single' or 'double'
+
+        Returns:
+            Result: The outcome of the creation
+        """
+        error = (self.existing_hotel_error(hotel_name)
+                 or self.new_room_error(room_number,
+                                        {'status': status,
+                                         'type': room_type}))
+        if error is not None:
+            return self._fail(error)
+
+        hotel_id = self.hotel_ids.get(hotel_name)
+        with self._locks.get(hotel_id, NULL_LOCK):
+            hotel = self.hotels.get(hotel_name)
+            created = (hotel is not None
+                       and room_number not in hotel['rooms'])
+            if created:
+                hotel['rooms'][room_number] = \
+                    {'status': status, 'type': room_type}
+                self._index_room(hotel_id, room_number, status,
+                                 room_type)
+                self._count_rooms(hotel_id, {(status, room_type): 1})
+        if not created:
+            return self._fail('%s already exists', room_number)
+
+        with self._registry_lock:
+            self._locations.add_rooms(hotel_id, 1)
+
+        return self._succeed('Room %s added successfully to %s',
+                             room_number, hotel_name)
+
+    def create_hotel_bulk(self, hotel_name, location, rooms_info=None,
+                          room_range=None, room_types=('single',),
+                          status='available'):
+        """
+        This method creates a Hotel with all its rooms at once, without
+        printing. Every room is validated first, and nothing is created
+        if any of them is invalid. The rooms are given either as a
+        rooms_info dictionary or as a range of room numbers whose types
+        repeat the room_types pattern
+
+        Args:
+            hotel_name (str): The name of the Hotel to be created
+            location (str): The location of the Hotel
+            rooms_info (dict): A dictionary containing the room
+            numbers as keys and dictionaries containing room details
+            (status, type) as values (if applicable)
+            room_range (range): The room numbers as integers
+            (if applicable)
+            room_types (tuple): The types assigned in turn to the
+            rooms of room_range
+            status (str): The status of the rooms of room_range
+
+        Returns:
+            HotelLoadSummary: The summary of the creation
+        """
+        summary = HotelLoadSummary(hotel_name)
+        if rooms_info is None:
+            if room_range and not room_types:
+                summary.errors.append('Room types cannot be empty')
+                return summary
+            rooms_info = {
+                f'{number:03d}': {'status': status,
+                                  'type': room_types[position
+                                                     % len(room_types)]}
+                for position, number in enumerate(room_range or ())}
+
+        for error in (self.hotel_name_error(hotel_name),
+                      self.hotel_location_error(location)):
+            if error is not None:
+                summary.errors.append(error)
+
+        for room_number, room_details in rooms_info.items():
+            error = self.new_room_error(room_number, room_details)
+            if error is not None:
+                summary.errors.append(error)
+
+        if summary.errors:
+            return summary
+
+        rooms = self._new_rooms()
+        for room_number, room_details in rooms_info.items():
+            rooms[room_number] = {'status': room_details['status'],
+                                  'type': room_details['type']}
+        if not self._add_hotel(hotel_name, location, rooms, rooms_info):
+            summary.errors.append(f'{hotel_name} already exists')
+            return summary
+
+        summary.created = True
+        summary.rooms_created = len(rooms)
+        for room_details in rooms_info.values():
+            summary.rooms_by_type[room_details['type']] = \
+                summary.rooms_by_type.get(room_details['type'], 0) + 1
+        return summary
+
+    def insert_hotel(self, hotel_name, location, rooms_info,
+                     hotel_id=None):
+        """
+        This method stores an already validated Hotel with its rooms,
+        without checking them or printing
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            location (str): The location of the Hotel
+            rooms_info (dict): The room details (status, type) by room
+            number, in dictionary mode the details are stored as they
+            are
+            hotel_id (int): The ID the Hotel was saved with
+            (if applicable)
+
+        Returns:
+            bool: True if the Hotel was added, False if the name is
+            already used
+        """
+        if not self._compact:
+            return self._add_hotel(hotel_name, location, dict(rooms_info),
+                                   rooms_info, hotel_id)
+
+        rooms = self._new_rooms()
+        for room_number, room_details in rooms_info.items():
+            rooms[room_number] = room_details
+        return self._add_hotel(hotel_name, location, rooms, rooms_info,
+                               hotel_id)
+
+    def _new_rooms(self):
+        """
+        This method creates the empty rooms storage of a Hotel
+
+        Returns:
+            dict: A dictionary, or CompactRooms in compact mode. With a
+            storage the dictionary is copied into it when the Hotel is
+            stored
+        """
+        return CompactRooms() if self._compact else {}
+
+    def _add_hotel(self, hotel_name, location, rooms=None,
+                   rooms_info=None, hotel_id=None):
+        """
+        This method stores an already validated Hotel with its rooms
+        and indexes the rooms
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            location (str): The location of the Hotel
+            rooms (dict): The rooms of the Hotel (if applicable)
+            rooms_info (dict): The same rooms as dictionaries, which
+            are faster to read than compact rooms when they are indexed
+            (if applicable)
+            hotel_id (int): The ID of the Hotel, a new ID is given if
+            it is None (if applicable)
+
+        Returns:
+            bool: True if the Hotel was added, False if the name is
+            already used
+        """
+        if rooms is None:
+            rooms = self._new_rooms()
+        pools = self._room_pools(rooms_info or rooms)
+        with self._registry_lock:
+            if hotel_name in self.hotels:
+                return False
+
+            hotel_id = self.hotel_ids.intern(hotel_name, hotel_id)
+            self._register_hotel(hotel_id, pools, location,
+                                 len(rooms_info or rooms))
+            # The Hotel is visible once its indexes are ready
+            self.hotels[hotel_name] = {'hotel_id': hotel_id,
+                                       'location': location,
+                                       'rooms': rooms}
+        return True
+
+    @staticmethod
+    def _room_pools(rooms):
+        """
+        This method groups the rooms of a Hotel by status and type, and
+        builds the pool of each group at once
+
+        Args:
+            rooms (dict): The room details (status, type) by room number
+
+        Returns:
+            dict: The RoomPool of each (status, type). The rooms of a
+            room map are read in place instead
+        """
+        if isinstance(rooms, MappedRooms):
+            return rooms.pools()
+        groups = {}
+        for room_number, room_details in rooms.items():
+            key = (room_details['status'], room_details['type'])
+            numbers = groups.get(key)
+            if numbers is None:
+                numbers = groups[key] = []
+            numbers.append(room_number)
+        return {key: RoomPool(numbers) for key, numbers in groups.items()}
+
+    def _register_hotel(self, hotel_id, pools, location, rooms):
+        """
+        This method creates the availability index, the calendars and
+        the lock of a Hotel, and adds it to its location
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            pools (dict): The RoomPool of each (status, type)
+            location (str): The location of the Hotel
+            rooms (int): The number of rooms of the Hotel
+
+        Returns:
+            None
+        """
+        counts = {key: len(pool) for key, pool in pools.items()}
+        with self._views.lock:
+            self._locations.add(hotel_id, location, rooms)
+            self._occupancy.add_hotel(hotel_id, counts)
+            notices = self._views.apply(self._room_changes(
+                normalize_location(location), counts, 1))
+        self._room_index[hotel_id] = pools
+        self._calendars[hotel_id] = {}
+        self._locks[hotel_id] = threading.RLock()
+        self._views.notify(notices)
+
+    def delete_hotel(self, hotel_name):
+        """
+        This method deletes a Hotel register (if it exists)
+
+        Args:
+            hotel_name (str): The name of the Hotel (already created)
+
+        Returns:
+            Result: The outcome of the removal
+        """
+        notices = []
+        with self._registry_lock:
+            error = self.existing_hotel_error(hotel_name)
+            if error is None:
+                hotel_id = self.hotel_ids.get(hotel_name)
+                with self._locks[hotel_id], self._views.lock:
+                    del self.hotels[hotel_name]
+                    self.hotel_ids.release(hotel_name)
+                    location = self._locations.location_of(hotel_id)
+                    self._locations.remove(hotel_id)
+                    notices = self._views.apply(self._room_changes(
+                        location, self._occupancy.remove_hotel(hotel_id),
+                        -1))
+                    del self._room_index[hotel_id]
+                    del self._calendars[hotel_id]
+                    del self._locks[hotel_id]
+        self._views.notify(notices)
+        if error is not None:
+            return self._fail(error)
+
+        return self._succeed('%s deleted successfully', hotel_name)
+
+    def display_hotel_information(self, hotel_name, output='text',
+                                  offset=0, limit=None, stream=None):
+        """
+        This method displays the information of a Hotel (if it exists)
+
+        Args:
+            hotel_name (str): The name of the Hotel (already created)
+            output (str): The output format, 'text' or 'json'
+            (if applicable)
+            offset (int): The number of rooms skipped (if applicable)
+            limit (int): The largest number of rooms shown, None for
+            all of them (if applicable)
+            stream (file): The text stream the information is written
+            to in chunks instead of the message (if applicable)
+
+        Returns:
+            Result: The information of the Hotel as its message, or the
+            number of lines written to the stream as its data
+        """
+        error = self.existing_hotel_error(hotel_name)
+        if error is not None:
+            return self._fail(error)
+
+        hotel = self.hotels[hotel_name]
+        # The lines are produced one chunk at a time while the Hotel is
+        # locked, so a large Hotel is never held in memory as a whole
+        with self._read_lock(hotel_name):
+            try:
+                lines = hotel_lines(hotel_name, hotel['location'],
+                                    hotel['rooms'], output, offset, limit)
+            except ValueError as error:
+                return self._fail(str(error))
+            if stream is None:
+                message = '\n'.join(lines)
+            else:
+                written = write_lines(lines, stream)
+        if stream is None:
+            return self._succeed(message)
+
+        return self._succeed('%s information written (%s lines)',
+                             hotel_name, written, data=written)
+
+    def modify_hotel_information(self, hotel_name, new_hotel_name=None,
+                                 new_location=None, new_room_info=None):
+        """
+        This function modifies the information of a Hotel: its name,
+        location and rooms information
+
+        Args:
+            hotel_name (str): The name of the existing Hotel (already created)
+            new_hotel_name (str): The name to change (if applicable)
+            new_location (str): The location to change (if applicable)
+            new_room_info (dict): The rooms information to change
+            (if applicable)
+
+        Returns:
+            Result: Successful if every change succeeded, its data is
+            the list of the outcomes of the changes
+        """
+        error = self.existing_hotel_error(hotel_name)
+        if error is not None:
+            return self._fail(error)
+
+        results = []
+        if new_hotel_name is not None:
+            results.append(self.modify_hotel_name(hotel_name,
+                                                  new_hotel_name))
+
+        if new_location is not None:
+            results.append(self.modify_hotel_location(hotel_name,
+                                                      new_hotel_name,
+                                                      new_location))
+
+        if new_room_info is not None:
+            results.append(self.modify_hotel_rooms(hotel_name,
+                                                   new_hotel_name,
+                                                   new_room_info))
+        if all(results):
+            return Result(True, '%s information modified', (hotel_name,),
+                          results)
+        return Result(False, '%s information was not fully modified',
+                      (hotel_name,), results)
+
+    def validate_hotel_name(self, hotel_name):
+        """
+        This function validates that the Hotel name entered exists
+
+        Args:
+            hotel_name (str): The Hotel name to be validated
+
+        Returns:
+            bool: True if the Hotel name entered is valid, False otherwise
+        """
+        return self._report(self.hotel_name_error(hotel_name))
+
+    def hotel_name_error(self, hotel_name):
+        """
+        This function checks the Hotel name entered without printing
+
+        Args:
+            hotel_name (str): The Hotel name to be checked
+
+        Returns:
+            str: The error found, None if the Hotel name is valid
+        """
+        if hotel_name.strip() == '':
+            return 'Hotel name cannot be empty'
+
+        if hotel_name in self.hotels:
+            return f'{hotel_name} already exists'
+
+        return None
+
+    @staticmethod
+    def validate_hotel_location(hotel_location):
+        """
+        This function validates the Hotel location entered
+
+        Args:
+            hotel_location (str): The Hotel location to be validated
+
+        Returns:
+            bool: True if the Hotel location entered is valid, False
+            otherwise
+        """
+        return report(Hotels.hotel_location_error(hotel_location))
+
+    @staticmethod
+    def hotel_location_error(hotel_location):
+        """
+        This function checks the Hotel location entered without printing
+
+        Args:
+            hotel_location (str): The Hotel location to be checked
+
+        Returns:
+            str: The error found, None if the Hotel location is valid
+        """
+        pattern = r"^[a-zA-Z\s\']+$"
+
+        if hotel_location.strip() == '':
+            return 'Location name cannot be empty'
+
+        if not re.fullmatch(pattern, hotel_location):
+            return 'Location name is invalid'
+
+        return None
+
+    @staticmethod
+    def new_room_error(room_number, room_details):
+        """
+        This function checks the information of a room to be created,
+        which needs both its status and type, without printing
+
+        Args:
+            room_number (str): The Room number
+            room_details (dict): The Room details (status, type)
+
+        Returns:
+            str: The error found, None if the Room information is valid
+        """
+        error = Hotels.room_number_error(room_number)
+        if error is not None:
+            return error
+
+        if room_details.get('status') not in ['reserved', 'available']:
+            return f'Invalid room status for room {room_number}'
+
+        if room_details.get('type') not in ['single', 'double']:
+            return f'Invalid room type for room {room_number}'
+
+        return None
+
+    def existing_hotel_error(self, hotel_name):
+        """
+        This function checks that a Hotel exists without printing
+
+        Args:
+            hotel_name (str): The Hotel name to be checked
+
+        Returns:
+            str: The error found, None if the Hotel exists
+        """
+        if hotel_name.strip() == '':
+            return 'Hotel name cannot be empty'
+
+        if hotel_name not in self.hotels:
+            return f'{hotel_name} does not exist'
+
+        return None
+
+    @staticmethod
+    def room_number_error(room_number):
+        """
+        This function checks the format of a room number without
+        printing
+
+        Args:
+            room_number (str): The room number to be checked
+
+        Returns:
+            str: The error found, None if the room number is valid
+        """
+        if (not isinstance(room_number, str) or len(room_number) != 3
+                or not room_number.isdigit()):
+            return 'Invalid room number'
+
+        return None
+
+    @staticmethod
+    def validate_room_information(room_number, room_details):
+        """
+        This function validates the Room information entered as a dictionary
+
+        Args:
+            room_number (str): The Room number to edit its details
+            room_details (dict): The Room details to be edited
+
+        Returns:
+            bool: True if the Room information entered is valid, False
+            otherwise
+            status: The status of the Room
+            room_type: The type of the Room
+        """
+        error, status, room_type = \
+            Hotels.room_information_error(room_number, room_details)
+        return report(error), status, room_type
+
+    @staticmethod
+    def room_information_error(room_number, room_details):
+        """
+        This function checks the Room information entered as a dictionary
+        without printing
+
+        Args:
+            room_number (str): The Room number to edit its details
+            room_details (dict): The Room details to be edited
+
+        Returns:
+            str: The error found, None if the Room information is valid
+            status: The status of the Room
+            room_type: The type of the Room
+        """
+        error = Hotels.room_number_error(room_number)
+        if error is not None:
+            return error, None, None
+
+        status = room_details.get('status')
+        if status is not None and status not in ['reserved', 'available']:
+            return f'Invalid room status for room {room_number}', None, None
+
+        room_type = room_details.get('type')
+        if room_type is not None and room_type not in ['single', 'double']:
+            return f'Invalid room type for room {room_number}', None, None
+
+        return None, status, room_type
+
+    def modify_hotel_name(self, hotel_name, new_hotel_name):
+        """
+        This function modifies the Hotel name to a different one
+
+        Args:
+            hotel_name (str): The original name of the Hotel
+            new_hotel_name (str): The new name of the Hotel
+
+        Returns:
+            Result: The outcome of the change
+        """
+        with self._registry_lock:
+            error = (self.hotel_name_error(new_hotel_name)
+                     or self.existing_hotel_error(hotel_name))
+            if error is None:
+                # The indexes are kept by ID, only the name moves. The
+                # storages rename the Hotel in place
+                with self._locks[self.hotel_ids.get(hotel_name)]:
+                    if isinstance(self.hotels, dict):
+                        self.hotels[new_hotel_name] = \
+                            self.hotels.pop(hotel_name)
+                    else:
+                        self.hotels.rename(hotel_name, new_hotel_name)
+                    self.hotel_ids.rename(hotel_name, new_hotel_name)
+        if error is not None:
+            return self._fail(error)
+
+        return self._succeed('%s successfully changed to %s', hotel_name,
+                             new_hotel_name)
+
+    def modify_hotel_location(self, hotel_name, new_hotel_name,
+                              new_location):
+        """
+        This function modifies the location of a Hotel
+
+        Args:
+            hotel_name (str): The original Hotel name
+            new_hotel_name (str): The new name of the Hotel (if applicable)
+            new_location (str): The new location of the Hotel (if applicable)
+
+        Returns:
+            Result: The outcome of the change
+        """
+        error = self.hotel_location_error(new_location)
+        if error is not None:
+            return self._fail(error)
+
+        if (hotel_name in self.hotels and
+            self.hotels[hotel_name]['location'] == new_location) or \
+                (new_hotel_name is not None and new_hotel_name in
+                 self.hotels and self.hotels[new_hotel_name]['location'] ==
+                 new_location):
+            return self._fail('Location was not updated')
+
+        target_hotel = \
+            hotel_name if new_hotel_name is None else new_hotel_name
+        with self._registry_lock:
+            self.hotels[target_hotel]['location'] = new_location
+            hotel_id = self.hotel_ids.get(target_hotel)
+            with self._views.lock:
+                counts = self._occupancy.hotel_counts(hotel_id) or {}
+                changes = self._room_changes(
+                    self._locations.location_of(hotel_id), counts, -1)
+                self._locations.move(hotel_id, new_location)
+                changes.extend(self._room_changes(
+                    normalize_location(new_location), counts, 1))
+                notices = self._views.apply(changes)
+        self._views.notify(notices)
+        return self._succeed('Location updated to: %s', new_location)
+
+    def modify_hotel_rooms(self, hotel_name, new_hotel_name,
+                           new_room_info):
+        """
+        This function updates the information from a Hotel room
+
+        Args:
+            hotel_name (str): The original Hotel name
+            new_hotel_name (str): The new name of the Hotel (if applicable)
+            new_room_info (dict): A dictionary containing the
+            new room information (if applicable)
+
+        Returns:
+            Result: Successful if every room was updated
+        """
+        target_hotel = \
+            hotel_name if new_hotel_name is None else new_hotel_name
+        if target_hotel not in self.hotels:
+            return self._fail('%s does not exist', target_hotel)
+
+        updated = True
+        for room_number, room_details in new_room_info.items():
+            # Validates the "new_room_info" dictionary provided
+            error, status, room_type = \
+                self.room_information_error(room_number, room_details)
+
+            if not self._report(error):
+                updated = False
+                continue
+
+            hotel_id = self.hotel_ids.get(target_hotel)
+            with self._locks.get(hotel_id, NULL_LOCK):
+                hotel = self.hotels.get(target_hotel)
+                exists = hotel is not None and room_number in hotel['rooms']
+                if exists:
+                    self._update_room(hotel_id, hotel, room_number, status,
+                                      room_type)
+            if exists:
+                self._succeed('Room information updated successfully')
+            else:
+                updated = False
+                self._fail('Room does not exist')
+        if updated:
+            return Result(True, 'Rooms of %s updated', (target_hotel,))
+        return Result(False, 'Some rooms of %s were not updated',
+                      (target_hotel,))
+
+    def reserve_room(self, hotel_name, room_number):
+        """
+        This function reserves a room in the given Hotel
+
+        Args:
+            hotel_name (str): The Hotel name
+            room_number (str): The room number that will be reserved
+
+        Returns:
+            Result: The outcome of the reservation
+        """
+        error = (self.existing_hotel_error(hotel_name)
+                 or self.room_number_error(room_number))
+        if error is not None:
+            return self._fail(error)
+
+        if room_number not in self.hotels[hotel_name]['rooms']:
+            return self._fail('Room %s does not exist', room_number)
+
+        if not self.try_reserve_room(hotel_name, room_number):
+            return self._fail('Room %s is not available', room_number)
+
+        return self._succeed('Room %s reserved successfully', room_number)
+
+    def cancel_reservation(self, hotel_name, room_number):
+        """
+        This function cancels the reservation of a room in the given Hotel
+
+        Args:
+            hotel_name (str): The Hotel name
+            room_number (str): The room number that will be cancelled
 
         Returns:
-            None
+            Result: The outcome of the cancellation
         """
-        self.hotels = {}
+        error = (self.existing_hotel_error(hotel_name)
+                 or self.room_number_error(room_number))
+        if error is not None:
+            return self._fail(error)
 
-    def create_hotel(self, hotel_name, location, rooms_info):
+        if room_number not in self.hotels[hotel_name]['rooms']:
+            return self._fail('Room %s does not exist', room_number)
+
+        if not self.try_cancel_room(hotel_name, room_number):
+            return self._fail('Room %s is available', room_number)
+
+        return self._succeed('Room %s cancelled successfully', room_number)
+
+    def hotel_lock(self, hotel_name):
         """
-        This method handles the creation of a Hotel dictionary
+        This function returns the lock of a Hotel, which is held while
+        the status or the bookings of its rooms are checked and changed
 
         Args:
-            hotel_name (str): The name of the Hotel to be created
-            location (str): The location of the Hotel
-            rooms_info (dict): A dictionary containing the room
-            numbers as keys and dictionaries containing room details
-            (status, type) as values
+            hotel_name (str): The Hotel name
 
         Returns:
-             None
+            Lock: The lock of the Hotel, None if it does not exist
         """
-        if not self.validate_hotel_name(hotel_name):
-            return
+        return self._locks.get(self.hotel_ids.get(hotel_name))
 
-        if not self.validate_hotel_location(location):
-            return
+    def _read_lock(self, hotel_name):
+        """
+        This function returns the lock held while the rooms of a Hotel
+        are read. Only in concurrent mode readers wait for the writers
+        of the same Hotel, since a calendar or a rooms dictionary
+        cannot be read while it changes
 
-        # Creates the "Hotel" dictionary
-        self.hotels[hotel_name] = {'location': location, 'rooms': {}}
-        print(f'\n{hotel_name} created successfully')
+        Args:
+            hotel_name (str): The Hotel name
 
-        for room_number, room_details in rooms_info.items():
-            if (not isinstance(room_number, str) or len(room_number) != 3
-                    or not room_number.isdigit()):
-                print('\nError: Invalid room number')
-                continue
+        Returns:
+            RLock: The lock of the Hotel, or NULL_LOCK
+        """
+        if not self.concurrent:
+            return NULL_LOCK
+        return self._locks.get(self.hotel_ids.get(hotel_name), NULL_LOCK)
 
-            status = room_details.get('status')
-            if status not in ['reserved', 'available']:
-                print(f'\nError: Invalid room status for room {room_number}')
-                continue
+    def try_reserve_room(self, hotel_name, room_number):
+        """
+        This function reserves a room only if it is available. The
+        check and the change are done while holding the lock of the
+        Hotel, so when several threads try to reserve the same room
+        exactly one of them wins
 
-            room_type = room_details.get('type')
-            if room_type not in ['single', 'double']:
-                print(f'\nError: Invalid room type for room {room_number}')
-                continue
+        Args:
+            hotel_name (str): The Hotel name
+            room_number (str): The room number that will be reserved
 
-            # Creates the "rooms_info" dictionary
-            self.create_hotel_room(hotel_name, room_number, status, room_type)
+        Returns:
+            bool: True if this call reserved the room, False if the
+            room does not exist, is not available or has bookings of
+            date ranges
+        """
+        return self._swap_room_status(hotel_name, room_number,
+                                      'available', 'reserved')
 
-    def create_hotel_room(self, hotel_name, room_number, status, room_type):
+    def try_cancel_room(self, hotel_name, room_number):
         """
-        This method creates a hotel room dictionary for a given hotel
+        This function makes a room available again only if it is
+        reserved, as one step under the lock of the Hotel
 
         Args:
-            hotel_name (str): The name of the Hotel (already created)
-            room_number (str): The number of the room(s) of the Hotel
-            status (str): The status of the room(s), 'reserved' or 'available'
-            room_type (str): The type of room(s), 'single' or 'double'
+            hotel_name (str): The Hotel name
+            room_number (str): The room number that will be cancelled
 
         Returns:
-            None
+            bool: True if this call cancelled the reservation, False if
+            the room does not exist or is not reserved
         """
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return
+        return self._swap_room_status(hotel_name, room_number,
+                                      'reserved', 'available')
 
-        if hotel_name not in self.hotels:
-            print(f'\nError: {hotel_name} does not exist')
-            return
+    def try_book_room(self, hotel_name, room_number, check_in, check_out):
+        """
+        This function books a room for a date range only if it is free,
+        as one step under the lock of the Hotel
 
-        if room_number in self.hotels[hotel_name]['rooms']:
-            print(f'\nError: {room_number} already exists')
-            return
+        Args:
+            hotel_name (str): The Hotel name
+            room_number (str): The room number that will be booked
+            check_in (str or date): The first night of the stay
+            check_out (str or date): The day the stay ends (not
+            included)
+
+        Returns:
+            bool: True if this call booked the room, False otherwise
+        """
+        error, check_in, check_out = stay_dates_error(check_in, check_out)
+        hotel_id = self.hotel_ids.get(hotel_name)
+        lock = self._locks.get(hotel_id)
+        if error is not None or lock is None:
+            return False
 
-        self.hotels[hotel_name]['rooms'][room_number] = \
-            {'status': status, 'type': room_type}
-        print(f'\nRoom {room_number} added successfully to {hotel_name}')
+        with lock:
+            if not self.is_room_free(hotel_name, room_number, check_in,
+                                     check_out):
+                return False
 
-    def delete_hotel(self, hotel_name):
+            calendars = self._calendars[hotel_id]
+            if room_number not in calendars:
+                calendars[room_number] = RoomCalendar()
+            return calendars[room_number].add(check_in, check_out)
+
+    def try_release_room(self, hotel_name, room_number, check_in,
+                         check_out):
         """
-        This method deletes a Hotel register (if it exists)
+        This function cancels the booking of a room for a date range
+        only if it exists, as one step under the lock of the Hotel
 
         Args:
-            hotel_name (str): The name of the Hotel (already created)
+            hotel_name (str): The Hotel name
+            room_number (str): The room number that will be released
+            check_in (str or date): The first night of the stay
+            check_out (str or date): The day the stay ends (not
+            included)
 
         Returns:
-            None
+            bool: True if this call released the room, False otherwise
         """
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return
-
-        if hotel_name not in self.hotels:
-            print(f'\nError: {hotel_name} does not exist')
-            return
+        error, check_in, check_out = stay_dates_error(check_in, check_out)
+        hotel_id = self.hotel_ids.get(hotel_name)
+        lock = self._locks.get(hotel_id)
+        if error is not None or lock is None:
+            return False
 
-        del self.hotels[hotel_name]
-        print(f'\n{hotel_name} deleted successfully')
+        with lock:
+            calendar = self._calendars.get(hotel_id, {}).get(room_number)
+            return (calendar is not None
+                    and calendar.remove(check_in, check_out))
 
-    def display_hotel_information(self, hotel_name):
+    def _swap_room_status(self, hotel_name, room_number, expected, status):
         """
-        This method displays the information of a Hotel (if it exists)
+        This function changes the status of a room if it has the
+        expected status (compare-and-set) under the lock of the Hotel
 
         Args:
-            hotel_name (str): The name of the Hotel (already created)
+            hotel_name (str): The Hotel name
+            room_number (str): The room number
+            expected (str): The status the room must have
+            status (str): The new status of the room
 
         Returns:
-            None
+            bool: True if the status was changed, False otherwise
         """
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return
+        hotel_id = self.hotel_ids.get(hotel_name)
+        lock = self._locks.get(hotel_id)
+        if lock is None:
+            return False
 
-        if hotel_name not in self.hotels:
-            print(f'\nError: {hotel_name} does not exist')
-            return
+        with lock:
+            hotel = self.hotels.get(hotel_name)
+            if hotel is None or room_number not in hotel['rooms']:
+                return False
 
-        print(f'\n{hotel_name} Information:')
-        print(f'Location: {self.hotels[hotel_name]["location"]}')
-        print('Rooms:')
-        for room, room_info in self.hotels[hotel_name]["rooms"].items():
-            print(f'    Room No.: {room}')
-            for key, value in room_info.items():
-                print(f'      {key.capitalize()}: {value}')
+            if hotel['rooms'][room_number]['status'] != expected:
+                return False
 
-    def modify_hotel_information(self, hotel_name, new_hotel_name=None,
-                                 new_location=None, new_room_info=None):
+            # A reserved status holds the room for every date, so it is
+            # not given while the room has bookings of date ranges
+            if status == 'reserved' and \
+                    self._calendars[hotel_id].get(room_number):
+                return False
+
+            self._update_room(hotel_id, hotel, room_number, status=status)
+            return True
+
+    def _index_room(self, hotel_id, room_number, status, room_type):
         """
-        This function modifies the information of a Hotel: its name,
-        location and rooms information
+        This function adds a room to the availability index of a Hotel
 
         Args:
-            hotel_name (str): The name of the existing Hotel (already created)
-            new_hotel_name (str): The name to change (if applicable)
-            new_location (str): The location to change (if applicable)
-            new_room_info (dict): The rooms information to change
-            (if applicable)
+            hotel_id (int): The Hotel ID
+            room_number (str): The room number
+            status (str): The status of the room
+            room_type (str): The type of the room
 
         Returns:
             None
         """
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return
-
-        if hotel_name not in self.hotels:
-            print(f'\nError: {hotel_name} does not exist')
-            return
+        index = self._room_index[hotel_id]
+        pool = index.get((status, room_type))
+        if pool is None:
+            pool = index[(status, room_type)] = RoomPool()
+        pool.add(room_number)
 
-        if new_hotel_name is not None:
-            self.modify_hotel_name(hotel_name, new_hotel_name)
+    def _unindex_room(self, hotel_id, room_number, status, room_type):
+        """
+        This function removes a room from the availability index of
+        a Hotel
 
-        if new_location is not None:
-            self.modify_hotel_location(hotel_name, new_hotel_name,
-                                       new_location)
+        Args:
+            hotel_id (int): The Hotel ID
+            room_number (str): The room number
+            status (str): The status of the room
+            room_type (str): The type of the room
 
-        if new_room_info is not None:
-            self.modify_hotel_rooms(hotel_name, new_hotel_name,
-                                    new_room_info)
+        Returns:
+            None
+        """
+        pool = self._room_index[hotel_id].get((status, room_type))
+        if pool is not None:
+            pool.discard(room_number)
 
-    def validate_hotel_name(self, hotel_name):
+    def _count_rooms(self, hotel_id, counts):
         """
-        This function validates that the Hotel name entered exists
+        This function updates the occupancy counters and the views
+        that match a room change of a Hotel, as one step so each view
+        is changed and notified once
 
         Args:
-            hotel_name (str): The Hotel name to be validated
+            hotel_id (int): The Hotel ID
+            counts (dict): The number of rooms added to each (status,
+            type), negative if taken
 
         Returns:
-            bool: True if the Hotel name entered is valid, False otherwise
+            None
         """
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return False
+        with self._views.lock:
+            for room_key, step in counts.items():
+                self._occupancy.move(hotel_id, room_key, step)
+            notices = self._views.apply(self._room_changes(
+                self._locations.location_of(hotel_id), counts, 1))
+        self._views.notify(notices)
 
-        if hotel_name in self.hotels:
-            print(f'\nError: {hotel_name} already exists')
-            return False
+    @staticmethod
+    def _room_changes(location, counts, sign):
+        """
+        This function lists the rooms of a Hotel that is added, deleted
+        or moved as the changes the views are updated with
 
-        return True
+        Args:
+            location (str): The normalized location of the Hotel
+            counts (dict): The number of rooms by (status, type)
+            sign (int): 1 if the rooms were added, -1 if they were taken
 
-    @staticmethod
-    def validate_hotel_location(hotel_location):
+        Returns:
+            list: The (location, (status, type), step) of each change
         """
-        This function validates the Hotel location entered
+        return [(location, room_key, sign * count)
+                for room_key, count in counts.items() if count]
+
+    def _update_room(self, hotel_id, hotel, room_number, status=None,
+                     room_type=None):
+        """
+        This function updates the status and/or type of a room and
+        keeps the availability index in sync
 
         Args:
-            hotel_location (str): The Hotel location to be validated
+            hotel_id (int): The Hotel ID
+            hotel (dict): The Hotel the room belongs to
+            room_number (str): The room number
+            status (str): The new status of the room (if applicable)
+            room_type (str): The new type of the room (if applicable)
 
         Returns:
-            bool: True if the Hotel location entered is valid, False
-            otherwise
+            None
         """
-        pattern = r"^[a-zA-Z\s\']+$"
+        room = hotel['rooms'][room_number]
+        old_key = (room['status'], room['type'])
+        self._unindex_room(hotel_id, room_number, *old_key)
+        if status is not None:
+            room['status'] = status
+        if room_type is not None:
+            room['type'] = room_type
+        new_key = (room['status'], room['type'])
+        self._index_room(hotel_id, room_number, *new_key)
+        if new_key != old_key:
+            self._count_rooms(hotel_id, {old_key: -1, new_key: 1})
+
+    def find_available_room(self, hotel_name, room_type):
+        """
+        This function finds an available room of the given type in
+        the given Hotel that can be reserved, without scanning its
+        rooms unless some of them have bookings of date ranges
 
-        if hotel_location.strip() == '':
-            print('\nError: Location name cannot be empty')
-            return False
+        Args:
+            hotel_name (str): The Hotel name
+            room_type (str): The type of room, 'single' or 'double'
 
-        if not re.fullmatch(pattern, hotel_location):
-            print('\nError: Location name is invalid')
-            return False
+        Returns:
+            str: An available room number, None if there is none
+        """
+        hotel_id = self.hotel_ids.get(hotel_name)
+        index = self._room_index.get(hotel_id)
+        if index is None:
+            self._fail('%s does not exist', hotel_name)
+            return None
+
+        pool = index.get(('available', room_type))
+        if pool is None:
+            return None
+        room_number = pool.pick()
+        calendars = self._calendars.get(hotel_id, {})
+        if room_number is None or not calendars.get(room_number):
+            return room_number
+
+        # A room with bookings of date ranges cannot be reserved, so
+        # the first room of the pool without any is given instead
+        for room_number in pool:
+            if not calendars.get(room_number):
+                return room_number
+        return None
+
+    def list_rooms(self, hotel_name, status, room_type=None):
+        """
+        This function lists the rooms of a Hotel with the given status
+        and, optionally, the given type
 
-        return True
+        Args:
+            hotel_name (str): The Hotel name
+            status (str): The status of the rooms, 'reserved' or
+            'available'
+            room_type (str): The type of the rooms (if applicable)
 
-    @staticmethod
-    def validate_room_information(room_number, room_details):
+        Returns:
+            list: The matching room numbers
         """
-        This function validates the Room information entered as a dictionary
+        index = self._room_index.get(self.hotel_ids.get(hotel_name))
+        if index is None:
+            self._fail('%s does not exist', hotel_name)
+            return []
+
+        room_numbers = []
+        for (room_status, pool_type), pool in list(index.items()):
+            if room_status == status and room_type in (None, pool_type):
+                room_numbers.extend(pool)
+        return room_numbers
+
+    def hotels_in(self, location):
+        """
+        This function lists the Hotels of a location from the location
+        index, without scanning the other Hotels
 
         Args:
-            room_number (str): The Room number to edit its details
-            room_details (dict): The Room details to be edited
+            location (str): The location, in any case and spacing
 
         Returns:
-            bool: True if the Room information entered is valid, False
-            otherwise
-            status: The status of the Room
-            room_type: The type of the Room
+            list: The names of the Hotels in the order they were created
         """
-        if (not isinstance(room_number, str) or len(room_number) != 3
-                or not room_number.isdigit()):
-            print('\nError: Invalid room number')
-            return False, None, None
+        with self._registry_lock:
+            hotel_ids = self._locations.hotel_ids(location)
+            return [self.hotel_ids.name(hotel_id) for hotel_id in hotel_ids]
 
-        status = room_details.get('status')
-        if status is not None and status not in ['reserved', 'available']:
-            print(f'\nError: Invalid room status for room {room_number}')
-            return False, None, None
+    def location_room_count(self, location):
+        """
+        This function returns the number of rooms of a location
 
-        room_type = room_details.get('type')
-        if room_type is not None and room_type not in ['single', 'double']:
-            print(f'\nError: Invalid room type for room {room_number}')
-            return False, None, None
+        Args:
+            location (str): The location, in any case and spacing
 
-        return True, status, room_type
+        Returns:
+            int: The number of rooms of the Hotels of the location
+        """
+        with self._registry_lock:
+            return self._locations.room_count(location)
 
-    def modify_hotel_name(self, hotel_name, new_hotel_name):
+    def location_room_counts(self):
         """
-        This function modifies the Hotel name to a different one
+        This function returns the number of rooms of every location
+
+        Returns:
+            dict: The number of rooms by location, with the locations
+            in lowercase and single-spaced
+        """
+        with self._registry_lock:
+            return self._locations.room_counts()
+
+    def occupancy(self, hotel_name=None):
+        """
+        This function returns the total, reserved and available rooms
+        of a Hotel, or of all the Hotels, from the counters kept as the
+        rooms change, without counting any room
 
         Args:
-            hotel_name (str): The original name of the Hotel
-            new_hotel_name (str): The new name of the Hotel
+            hotel_name (str): The Hotel name, None for all the Hotels
+            (if applicable)
 
         Returns:
-            None
+            Occupancy: The rooms by status and by type, None if the
+            Hotel does not exist
         """
-        if not self.validate_hotel_name(new_hotel_name):
-            return
+        if hotel_name is None:
+            return Occupancy.from_counts(self._occupancy.totals())
 
-        self.hotels[new_hotel_name] = self.hotels.pop(hotel_name)
-        print(f'\n{hotel_name} successfully changed to {new_hotel_name}')
+        counts = self._occupancy.hotel_counts(
+            self.hotel_ids.get(hotel_name))
+        if counts is None:
+            self._fail('%s does not exist', hotel_name)
+            return None
+        return Occupancy.from_counts(counts)
 
-    def modify_hotel_location(self, hotel_name, new_hotel_name,
-                              new_location):
+    def occupancy_by_hotel(self):
         """
-        This function modifies the location of a Hotel
+        This function returns the occupancy of every Hotel
+
+        Returns:
+            dict: The Occupancy of each Hotel name
+        """
+        with self._registry_lock:
+            hotel_ids = list(self._room_index)
+        occupancies = {}
+        for hotel_id in hotel_ids:
+            counts = self._occupancy.hotel_counts(hotel_id)
+            hotel_name = self.hotel_ids.name(hotel_id)
+            if counts is not None and hotel_name is not None:
+                occupancies[hotel_name] = Occupancy.from_counts(counts)
+        return occupancies
+
+    def register_view(self, view):
+        """
+        This function registers a materialized view over the Hotels.
+        Its number of rooms is counted once, and is then updated as the
+        rooms are reserved, cancelled, added and changed. Registering a
+        view again does not change it
 
         Args:
-            hotel_name (str): The original Hotel name
-            new_hotel_name (str): The new name of the Hotel (if applicable)
-            new_location (str): The new location of the Hotel (if applicable)
+            view (AvailabilityView): The view
 
         Returns:
-            None
+            AvailabilityView: The registered view
         """
-        if not self.validate_hotel_location(new_location):
-            return
+        location = None if view.location is None else \
+            normalize_location(view.location)
+        with self._registry_lock, self._views.lock:
+            if view in self._views:
+                return view
+
+            if location is None:
+                hotel_counts = [self._occupancy.totals()]
+            else:
+                hotel_counts = [self._occupancy.hotel_counts(hotel_id)
+                                for hotel_id in
+                                self._locations.hotel_ids(location)]
+            count = 0
+            for counts in hotel_counts:
+                for (status, room_type), number in (counts or {}).items():
+                    if status == view.status and \
+                            view.room_type in (None, room_type):
+                        count += number
+            self._views.add(view, location, count)
+        return view
+
+    def unregister_view(self, view):
+        """
+        This function stops updating a view
 
-        if (hotel_name in self.hotels and
-            self.hotels[hotel_name]['location'] == new_location) or \
-                (new_hotel_name is not None and new_hotel_name in
-                 self.hotels and self.hotels[new_hotel_name]['location'] ==
-                 new_location):
-            print('\nError: Location was not updated')
-            return
+        Args:
+            view (AvailabilityView): The view
 
-        if new_hotel_name is None:
-            self.hotels[hotel_name]['location'] = new_location
-        else:
-            self.hotels[new_hotel_name]['location'] = new_location
-        print(f'\nLocation updated to: {new_location}')
+        Returns:
+            bool: True if the view was registered, False otherwise
+        """
+        with self._views.lock:
+            return self._views.remove(view)
 
-    def modify_hotel_rooms(self, hotel_name, new_hotel_name,
-                           new_room_info):
+    def is_room_free(self, hotel_name, room_number, check_in, check_out):
         """
-        This function updates the information from a Hotel room
+        This function checks whether a room can be booked for a date
+        range. A room whose status is 'reserved' is held without dates,
+        so it is not free for any date range
 
         Args:
-            hotel_name (str): The original Hotel name
-            new_hotel_name (str): The new name of the Hotel (if applicable)
-            new_room_info (dict): A dictionary containing the
-            new room information (if applicable)
+            hotel_name (str): The Hotel name
+            room_number (str): The room number
+            check_in (str or date): The first night of the stay
+            check_out (str or date): The day the stay ends (not
+            included)
 
         Returns:
-            None
+            bool: True if the room is free, False otherwise or if the
+            dates are not valid
         """
-        for room_number, room_details in new_room_info.items():
-            # Validates the "new_room_info" dictionary provided
-            is_valid, status, room_type = \
-                self.validate_room_information(room_number, room_details)
+        error, check_in, check_out = stay_dates_error(check_in, check_out)
+        if error is not None:
+            return False
 
-            if not is_valid:
-                continue
+        with self._read_lock(hotel_name):
+            hotel = self.hotels.get(hotel_name)
+            if hotel is None or room_number not in hotel['rooms']:
+                return False
 
-            if new_hotel_name is None:
-                if room_number in self.hotels[hotel_name]['rooms']:
-                    if status is not None:
-                        self.\
-                            hotels[hotel_name]['rooms'][room_number]['status']\
-                            = status
-                    if room_type is not None:
-                        self.\
-                            hotels[hotel_name]['rooms'][room_number]['type']\
-                            = room_type
-                else:
-                    print('\nError: Room does not exist')
-            else:
-                if room_number in self.hotels[new_hotel_name]['rooms']:
-                    if status is not None:
-                        (self.hotels[new_hotel_name]
-                            ['rooms'][room_number]['status']) = status
-                    if room_type is not None:
-                        (self.hotels[new_hotel_name]
-                            ['rooms'][room_number]['type']) = room_type
-                else:
-                    print('\nError: Room does not exist')
-            print('\nRoom information updated successfully')
+            if hotel['rooms'][room_number]['status'] == 'reserved':
+                return False
 
-    def reserve_room(self, hotel_name, room_number):
+            calendar = self._calendars[
+                self.hotel_ids.get(hotel_name)].get(room_number)
+            return (calendar is None
+                    or calendar.is_free(check_in, check_out))
+
+    def book_room(self, hotel_name, room_number, check_in, check_out):
         """
-        This function reserves a room in the given Hotel
+        This function books a room of the given Hotel for a date range
 
         Args:
             hotel_name (str): The Hotel name
-            room_number (str): The room number that will be reserved
+            room_number (str): The room number that will be booked
+            check_in (str or date): The first night of the stay
+            check_out (str or date): The day the stay ends (not
+            included)
 
         Returns:
-            None
+            Result: The outcome of the booking
         """
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return
-
         if hotel_name not in self.hotels:
-            print(f'\nError: {hotel_name} does not exist')
-            return
+            return self._fail('%s does not exist', hotel_name)
 
-        if (not isinstance(room_number, str) or len(room_number) != 3
-                or not room_number.isdigit()):
-            print('\nError: Invalid room number')
-            return
+        error, check_in, check_out = stay_dates_error(check_in, check_out)
+        if error is not None:
+            return self._fail(error)
 
         if room_number not in self.hotels[hotel_name]['rooms']:
-            print(f'\nError: Room {room_number} does not exist')
+            return self._fail('Room %s does not exist', room_number)
 
-        if (self.hotels[hotel_name]['rooms'][room_number]['status']
-                == 'reserved'):
-            print(f'\nError: Room {room_number} is not available')
+        if not self.try_book_room(hotel_name, room_number, check_in,
+                                  check_out):
+            return self._fail('Room %s is not available from %s to %s',
+                              room_number, check_in, check_out)
 
-        self.\
-            hotels[hotel_name]['rooms'][room_number]['status'] \
-            = 'reserved'
-        print(f'\nRoom {room_number} reserved successfully')
+        return self._succeed('Room %s booked successfully from %s to %s',
+                             room_number, check_in, check_out)
 
-    def cancel_reservation(self, hotel_name, room_number):
+    def release_room(self, hotel_name, room_number, check_in, check_out):
         """
-        This function cancels the reservation of a room in the given Hotel
+        This function cancels the booking of a room for a date range
 
         Args:
             hotel_name (str): The Hotel name
-            room_number (str): The room number that will be cancelled
+            room_number (str): The room number that will be released
+            check_in (str or date): The first night of the stay
+            check_out (str or date): The day the stay ends (not
+            included)
 
         Returns:
-            None
+            Result: The outcome of the cancellation
         """
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return
+        error, check_in, check_out = stay_dates_error(check_in, check_out)
+        if error is not None:
+            return self._fail(error)
 
-        if hotel_name not in self.hotels:
-            print(f'\nError: {hotel_name} does not exist')
-            return
+        if not self.try_release_room(hotel_name, room_number, check_in,
+                                     check_out):
+            return self._fail('Room %s is not booked from %s to %s',
+                              room_number, check_in, check_out)
 
-        if (not isinstance(room_number, str) or len(room_number) != 3
-                or not room_number.isdigit()):
-            print('\nError: Invalid room number')
-            return
+        return self._succeed('Room %s released successfully from %s to %s',
+                             room_number, check_in, check_out)
 
-        if room_number not in self.hotels[hotel_name]['rooms']:
-            print(f'\nError: Room {room_number} does not exist')
+    def search_availability(self, location=None, room_type=None,
+                            check_in=None, check_out=None, limit=None):
+        """
+        This function searches the available rooms across all the
+        Hotels. Hotels are pruned by their location and by the number
+        of available rooms of the requested type before any room is
+        looked at, and the results are produced lazily
+
+        Args:
+            location (str): The location of the Hotels (if applicable)
+            room_type (str): The type of room, 'single' or 'double'
+            (if applicable)
+            check_in (str or date): The first night of the stay
+            (if applicable)
+            check_out (str or date): The day the stay ends
+            (if applicable)
+            limit (int): The maximum number of results (if applicable)
+
+        Returns:
+            iterator: (hotel_name, room_number) tuples of free rooms
+        """
+        if (check_in is None) != (check_out is None):
+            self._fail('Both check-in and check-out are required')
+            return iter(())
+
+        if check_in is not None:
+            error, check_in, check_out = stay_dates_error(check_in,
+                                                          check_out)
+            if error is not None:
+                self._fail(error)
+                return iter(())
+
+        results = self._iter_available_rooms(location, room_type,
+                                             check_in, check_out)
+        if limit is not None:
+            results = islice(results, limit)
+        return results
+
+    def _iter_available_rooms(self, location, room_type, check_in,
+                              check_out):
+        """
+        This function yields the free rooms that match a search
+
+        Args:
+            location (str): The location of the Hotels (if applicable)
+            room_type (str): The type of room (if applicable)
+            check_in (date): The first night of the stay (if applicable)
+            check_out (date): The day the stay ends (if applicable)
 
-        if (self.hotels[hotel_name]['rooms'][room_number]['status']
-                == 'available'):
-            print(f'\nError: Room {room_number} is available')
+        Returns:
+            iterator: (hotel_name, room_number) tuples of free rooms
+        """
+        if location is None:
+            hotel_ids = list(self._room_index)
+        else:
+            hotel_ids = self._locations.hotel_ids(location)
+
+        for hotel_id in hotel_ids:
+            index = self._room_index.get(hotel_id)
+            hotel_name = self.hotel_ids.name(hotel_id)
+            hotel = None if hotel_name is None else \
+                self.hotels.get(hotel_name)
+            if index is None or hotel is None:
+                continue
 
-        self. \
-            hotels[hotel_name]['rooms'][room_number]['status'] \
-            = 'available'
-        print(f'\nRoom {room_number} cancelled successfully')
+            pools = [pool for (status, pool_type), pool
+                     in list(index.items())
+                     if status == 'available' and pool
+                     and room_type in (None, pool_type)]
+            calendars = self._calendars.get(hotel_id, {})
+            for pool in pools:
+                for room_number in pool:
+                    if check_in is not None:
+                        calendar = calendars.get(room_number)
+                        if calendar is not None:
+                            with self._read_lock(hotel_name):
+                                is_free = calendar.is_free(check_in,
+                                                           check_out)
+                            if not is_free:
+                                continue
+                    yield hotel_name, room_number
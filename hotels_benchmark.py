@@ -0,0 +1,97 @@
+"""
+Hotels Benchmark
+
+This program measures the memory used by the rooms of the
+Hotels when they are kept as dictionaries and when they are
+kept in the compact storage (byte columns)
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import tracemalloc
+
+from hotels import Hotels
+from room_storage import CompactRooms
+
+HOTELS = 200
+ROOMS_PER_HOTEL = 999
+
+
+def build_rooms_info():
+    """
+    This function builds the rooms information of one Hotel
+
+    Returns:
+        dict: The rooms information, numbered from 001
+    """
+    return {f'{number:03d}': {'status': 'available',
+                              'type': ('single', 'double')[number % 2]}
+            for number in range(1, ROOMS_PER_HOTEL + 1)}
+
+
+def measure_rooms(compact, rooms_info):
+    """
+    This function measures the memory used by the rooms storage alone
+
+    Args:
+        compact (bool): True to use the compact room storage
+        rooms_info (dict): The rooms information of one Hotel
+
+    Returns:
+        int: Bytes used by the rooms of all the Hotels
+    """
+    tracemalloc.start()
+    hotels_rooms = []
+    for _ in range(HOTELS):
+        rooms = CompactRooms() if compact else {}
+        for room_number, room_details in rooms_info.items():
+            rooms[room_number] = dict(room_details)
+        hotels_rooms.append(rooms)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def measure_hotels(compact, rooms_info):
+    """
+    This function measures the memory used by a Hotels object,
+    including its availability index
+
+    Args:
+        compact (bool): True to use the compact room storage
+        rooms_info (dict): The rooms information of one Hotel
+
+    Returns:
+        int: Bytes used by the Hotels object
+    """
+    tracemalloc.start()
+    hotels_obj = Hotels(compact=compact, sink=None)
+    for number in range(HOTELS):
+        hotels_obj.create_hotel(f'Hotel {number}', 'Monterrey',
+                                rooms_info)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    """
+    Main function, prints the memory used by each layout
+
+    Returns:
+        None
+    """
+    rooms_info = build_rooms_info()
+    room_count = HOTELS * ROOMS_PER_HOTEL
+    print(f'{room_count} rooms in {HOTELS} hotels')
+    print(f'{"layout":>8} {"rooms (B/room)":>16} {"total (B/room)":>16}')
+    for compact in (False, True):
+        rooms_size = measure_rooms(compact, rooms_info)
+        total = measure_hotels(compact, rooms_info)
+        layout = 'compact' if compact else 'dict'
+        print(f'{layout:>8} {rooms_size / room_count:>16.1f} '
+              f'{total / room_count:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,8 @@ following functions:
 - modify_hotel_information()
 - reserve_room()
 - cancel_reservation()
+- try_reserve_room()
+- try_cancel_room()
 
 It includes Test Cases with happy path,
 negative path and edge cases
@@ -19,8 +21,19 @@ Author:
     Julia Gabriela Pinedo (A01795315)
 """
 
+import io
+import json
+import os
+import tempfile
+import threading
 import unittest
+from contextlib import redirect_stdout
+from datetime import date
 from hotels import Hotels
+from room_map import RoomMap
+from room_storage import CompactRooms
+from sqlite_storage import SqliteStorage
+from views import AvailabilityView
 
 
 class HotelsTest(unittest.TestCase):
@@ -662,6 +675,571 @@ class HotelsTest(unittest.TestCase):
                 break
         self.assertTrue(modified_hotel_found)
 
+    # PART 3: This part of the Test Cases covers the availability
+    # index of the rooms of each Hotel.
+
+    def test_find_available_room(self):
+        # Dictionary with the rooms information
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'reserved', 'type': 'double'},
+            '103': {'status': 'available', 'type': 'double'}
+        }
+        self.hotels_obj.create_hotel('Hotel Jackson',
+                                     'Los Angeles',
+                                     rooms_info)
+        # Verifies the available room of each type is found
+        self.assertEqual(self.hotels_obj.find_available_room(
+            'Hotel Jackson', 'single'), '101')
+        self.assertEqual(self.hotels_obj.find_available_room(
+            'Hotel Jackson', 'double'), '103')
+        self.hotels_obj.reserve_room('Hotel Jackson', '103')
+        self.assertIsNone(self.hotels_obj.find_available_room(
+            'Hotel Jackson', 'double'))
+        self.hotels_obj.cancel_reservation('Hotel Jackson', '102')
+        self.assertEqual(self.hotels_obj.find_available_room(
+            'Hotel Jackson', 'double'), '102')
+
+    def test_list_rooms_after_modification(self):
+        # Dictionary with the rooms information
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'single'}
+        }
+        self.hotels_obj.create_hotel('Hoteel Jacksoon',
+                                     'Los Angeles',
+                                     rooms_info)
+        new_rooms_info = {'102': {'status': 'reserved', 'type': 'double'}}
+        self.hotels_obj.modify_hotel_information('Hoteel Jacksoon',
+                                                 'Hotel Jackson',
+                                                 None,
+                                                 new_rooms_info)
+        # Verifies the index follows the renamed Hotel and its rooms
+        self.assertEqual(self.hotels_obj.list_rooms('Hotel Jackson',
+                                                    'available'), ['101'])
+        self.assertEqual(self.hotels_obj.list_rooms('Hotel Jackson',
+                                                    'reserved',
+                                                    'double'), ['102'])
+        self.assertEqual(self.hotels_obj.list_rooms('Hotel Jackson',
+                                                    'reserved',
+                                                    'single'), [])
+
+    def test_find_available_room_booked(self):
+        self.hotels_obj.create_hotel_bulk('Hotel Jackson', 'Los Angeles',
+                                          room_range=range(101, 104))
+        self.hotels_obj.book_room('Hotel Jackson', '103', '2024-03-10',
+                                  '2024-03-12')
+        # Verifies the room with a booking of dates is skipped while
+        # other rooms can be reserved
+        reserved = []
+        room_number = self.hotels_obj.find_available_room('Hotel Jackson',
+                                                          'single')
+        while room_number is not None:
+            self.assertTrue(self.hotels_obj.try_reserve_room(
+                'Hotel Jackson', room_number))
+            reserved.append(room_number)
+            room_number = self.hotels_obj.find_available_room(
+                'Hotel Jackson', 'single')
+        self.assertEqual(sorted(reserved), ['101', '102'])
+
+    def test_find_available_room_deleted_hotel(self):
+        # Dictionary with the rooms information
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_obj.create_hotel('Hotel Jackson',
+                                     'Los Angeles',
+                                     rooms_info)
+        self.hotels_obj.delete_hotel('Hotel Jackson')
+        # Verifies no room is found for a deleted Hotel
+        self.assertIsNone(self.hotels_obj.find_available_room(
+            'Hotel Jackson', 'single'))
+
+    # PART 4: This part of the Test Cases covers the search of
+    # available rooms across Hotels.
+
+    def test_search_availability(self):
+        # Dictionaries with the rooms information
+        self.hotels_obj.create_hotel('Hotel Jackson',
+                                     'Los Angeles',
+                                     {'101': {'status': 'available',
+                                              'type': 'single'},
+                                      '102': {'status': 'reserved',
+                                              'type': 'single'},
+                                      '103': {'status': 'available',
+                                              'type': 'double'}})
+        self.hotels_obj.create_hotel('Hotel Hilton',
+                                     'San Diego',
+                                     {'201': {'status': 'available',
+                                              'type': 'single'}})
+        # Verifies the search filters by location and room type
+        self.assertEqual(sorted(self.hotels_obj.search_availability(
+            room_type='single')),
+            [('Hotel Hilton', '201'), ('Hotel Jackson', '101')])
+        self.assertEqual(list(self.hotels_obj.search_availability(
+            location='  los   angeles', room_type='double')),
+            [('Hotel Jackson', '103')])
+        self.assertEqual(len(list(self.hotels_obj.search_availability(
+            limit=2))), 2)
+
+    def test_search_availability_dates(self):
+        # Dictionary with the rooms information
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'single'}
+        }
+        self.hotels_obj.create_hotel('Hotel Jackson',
+                                     'Los Angeles',
+                                     rooms_info)
+        self.hotels_obj.book_room('Hotel Jackson', '101',
+                                  date(2024, 3, 10), date(2024, 3, 15))
+        # Verifies booked rooms are only skipped for overlapping dates
+        self.assertEqual(list(self.hotels_obj.search_availability(
+            check_in='2024-03-12', check_out='2024-03-13')),
+            [('Hotel Jackson', '102')])
+        self.assertEqual(len(list(self.hotels_obj.search_availability(
+            check_in='2024-03-15', check_out='2024-03-16'))), 2)
+
+    def test_search_availability_neg_path_1(self):
+        # Path 1: Check-out missing
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_obj.create_hotel('Hotel Jackson',
+                                     'Los Angeles',
+                                     rooms_info)
+        self.assertEqual(list(self.hotels_obj.search_availability(
+            check_in='2024-03-12')), [])
+
+    def test_search_availability_neg_path_2(self):
+        # Path 2: Check-out on or before the check-in
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_obj.create_hotel('Hotel Jackson', 'Los Angeles',
+                                     rooms_info)
+        stream = io.StringIO()
+        with redirect_stdout(stream):
+            self.assertEqual(list(self.hotels_obj.search_availability(
+                check_in='2024-03-12', check_out='2024-03-12')), [])
+            self.assertEqual(list(self.hotels_obj.search_availability(
+                check_in='2024-03-12', check_out='2024-03-10')), [])
+        self.assertEqual(stream.getvalue().count(
+            'Error: Check-out must be after check-in'), 2)
+
+    # PART 5: This part of the Test Cases covers the bulk creation of
+    # Hotels.
+
+    def test_create_hotel_bulk_range(self):
+        summary = self.hotels_obj.create_hotel_bulk(
+            'Hotel Jackson', 'Los Angeles', room_range=range(101, 111),
+            room_types=('single', 'double'))
+        # Verifies the rooms were created and indexed
+        self.assertTrue(summary.created)
+        self.assertEqual(summary.rooms_created, 10)
+        self.assertEqual(summary.rooms_by_type, {'single': 5, 'double': 5})
+        rooms = self.hotels_obj.hotels['Hotel Jackson']['rooms']
+        self.assertEqual(rooms['102'], {'status': 'available',
+                                        'type': 'double'})
+        self.assertEqual(len(self.hotels_obj.list_rooms(
+            'Hotel Jackson', 'available', 'single')), 5)
+
+    def test_create_hotel_bulk_rooms_info(self):
+        rooms_info = {
+            '101': {'status': 'reserved', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'double'}
+        }
+        summary = self.hotels_obj.create_hotel_bulk('Hotel Jackson',
+                                                    'Los Angeles',
+                                                    rooms_info)
+        # Verifies the rooms match the given information
+        self.assertEqual(summary.errors, [])
+        self.assertEqual(self.hotels_obj.hotels['Hotel Jackson']['rooms'],
+                         rooms_info)
+        self.assertEqual(self.hotels_obj.find_available_room(
+            'Hotel Jackson', 'double'), '102')
+
+    def test_create_hotel_bulk_neg_path_1(self):
+        # Path 1: One invalid room rejects the whole Hotel
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '1020': {'status': 'available', 'type': 'double'},
+            '103': {'status': 'available', 'type': 'suite'}
+        }
+        summary = self.hotels_obj.create_hotel_bulk('Hotel Jackson',
+                                                    'Los Angeles',
+                                                    rooms_info)
+        self.assertFalse(summary.created)
+        self.assertEqual(summary.errors,
+                         ['Invalid room number',
+                          'Invalid room type for room 103'])
+        self.assertEqual(len(self.hotels_obj.hotels), 0)
+
+    def test_create_hotel_bulk_neg_path_2(self):
+        # Path 2: Hotel already exists
+        self.hotels_obj.create_hotel_bulk('Hotel Jackson', 'Los Angeles',
+                                          room_range=range(101, 103))
+        summary = self.hotels_obj.create_hotel_bulk(
+            'Hotel Jackson', 'Los Angeles', room_range=range(201, 203))
+        self.assertFalse(summary.created)
+        self.assertEqual(summary.errors, ['Hotel Jackson already exists'])
+        self.assertNotIn('201',
+                         self.hotels_obj.hotels['Hotel Jackson']['rooms'])
+
+    def test_create_hotel_bulk_neg_path_3(self):
+        # Path 3: Range of rooms without room types
+        summary = self.hotels_obj.create_hotel_bulk(
+            'Hotel Jackson', 'Los Angeles', room_range=range(101, 103),
+            room_types=())
+        self.assertFalse(summary.created)
+        self.assertEqual(summary.errors, ['Room types cannot be empty'])
+        self.assertEqual(len(self.hotels_obj.hotels), 0)
+
+    def test_hotel_results(self):
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', rooms_info)
+        result = self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.assertTrue(result)
+        self.assertEqual(result.message, 'Room 101 reserved successfully')
+        result = self.hotels_obj.display_hotel_information('Hotel Uno')
+        self.assertIn('Status: reserved', result.message)
+
+    def test_hotel_results_neg_path_1(self):
+        # Path 1: Room that is already reserved
+        rooms_info = {'101': {'status': 'reserved', 'type': 'single'}}
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', rooms_info)
+        result = self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.assertFalse(result)
+        self.assertEqual(result.text, 'Error: Room 101 is not available')
+        result = self.hotels_obj.modify_hotel_information(
+            'Hotel Uno', new_room_info={'999': {'type': 'double'}})
+        self.assertEqual(result.text, 'Error: Hotel Uno information was '
+                                      'not fully modified')
+        self.assertEqual(result.data[0].text,
+                         'Error: Some rooms of Hotel Uno were not updated')
+
+    def test_try_reserve_room(self):
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', rooms_info)
+        self.assertTrue(self.hotels_obj.try_reserve_room('Hotel Uno',
+                                                         '101'))
+        # Verifies the second attempt loses
+        self.assertFalse(self.hotels_obj.try_reserve_room('Hotel Uno',
+                                                          '101'))
+        self.assertTrue(self.hotels_obj.try_cancel_room('Hotel Uno',
+                                                        '101'))
+        self.assertFalse(self.hotels_obj.try_cancel_room('Hotel Uno',
+                                                         '101'))
+
+    def test_try_reserve_room_threads(self):
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', rooms_info)
+        wins = []
+        threads = [threading.Thread(
+            target=lambda: wins.append(
+                self.hotels_obj.try_reserve_room('Hotel Uno', '101')))
+            for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Verifies only one thread won the room
+        self.assertEqual(wins.count(True), 1)
+
+    def test_try_reserve_room_neg_path_1(self):
+        # Path 1: Hotel or room that does not exist
+        self.assertFalse(self.hotels_obj.try_reserve_room('Hotel Dos',
+                                                          '101'))
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', {})
+        self.assertFalse(self.hotels_obj.try_reserve_room('Hotel Uno',
+                                                          '101'))
+        self.assertFalse(self.hotels_obj.try_cancel_room('Hotel Uno',
+                                                         '101'))
+
+    def test_book_room(self):
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                          room_range=range(101, 103))
+        # Verifies the dates can be given as 'YYYY-MM-DD'
+        self.assertTrue(self.hotels_obj.book_room('Hotel Uno', '101',
+                                                  '2030-01-02',
+                                                  '2030-01-04'))
+        self.assertFalse(self.hotels_obj.is_room_free(
+            'Hotel Uno', '101', '2030-01-03', '2030-01-05'))
+        self.assertTrue(self.hotels_obj.is_room_free(
+            'Hotel Uno', '102', '2030-01-02', '2030-01-04'))
+        self.assertTrue(self.hotels_obj.release_room(
+            'Hotel Uno', '101', '2030-01-02', date(2030, 1, 4)))
+
+    def test_book_room_neg_path_1(self):
+        # Path 1: Check-out before check-in or dates that are not valid
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                          room_range=range(101, 102))
+        result = self.hotels_obj.book_room('Hotel Uno', '101',
+                                           date(2025, 1, 10),
+                                           date(2025, 1, 5))
+        self.assertEqual(result.text,
+                         'Error: Check-out must be after check-in')
+        self.assertFalse(self.hotels_obj.try_book_room(
+            'Hotel Uno', '101', '2025-01-10', '2025-01-05'))
+        self.assertFalse(self.hotels_obj.book_room('Hotel Uno', '101',
+                                                   '2025-13-01',
+                                                   '2025-13-05'))
+        self.assertFalse(self.hotels_obj.is_room_free(
+            'Hotel Uno', '101', '2025-01-10', None))
+        # Verifies nothing was added to the calendar of the room
+        self.assertTrue(self.hotels_obj.is_room_free(
+            'Hotel Uno', '101', '2025-01-01', '2025-12-31'))
+
+    def test_create_hotel_room_neg_path_1(self):
+        # Path 1: Room number, status or type that is not valid
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', {})
+        result = self.hotels_obj.create_hotel_room('Hotel Uno', '1',
+                                                   'available', 'single')
+        self.assertEqual(result.text, 'Error: Invalid room number')
+        self.assertFalse(self.hotels_obj.create_hotel_room(
+            'Hotel Uno', '101', 'bogus', 'single'))
+        self.assertFalse(self.hotels_obj.create_hotel_room(
+            'Hotel Uno', '101', 'available', 'suite'))
+        self.assertEqual(len(self.hotels_obj.hotels['Hotel Uno']['rooms']),
+                         0)
+        self.assertEqual(self.hotels_obj.occupancy('Hotel Uno').total, 0)
+
+    def test_validate_hotel_information(self):
+        stream = io.StringIO()
+        # Verifies the validators are called on the class and print
+        # their errors
+        with redirect_stdout(stream):
+            self.assertTrue(Hotels.validate_hotel_location('Cancun'))
+            self.assertEqual(Hotels.validate_room_information(
+                '101', {'status': 'reserved'}), (True, 'reserved', None))
+            self.assertEqual(Hotels.validate_room_information(
+                '101', {'type': 'suite'}), (False, None, None))
+        self.assertEqual(stream.getvalue(),
+                         '\nError: Invalid room type for room 101\n')
+
+    def test_insert_hotel(self):
+        rooms_info = {
+            '101': {'status': 'reserved', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'double'}
+        }
+        self.assertTrue(self.hotels_obj.insert_hotel('Hotel Uno',
+                                                     'Monterrey',
+                                                     rooms_info))
+        # Verifies the rooms were stored and indexed
+        self.assertEqual(self.hotels_obj.hotels['Hotel Uno']['rooms'],
+                         rooms_info)
+        self.assertEqual(self.hotels_obj.list_rooms('Hotel Uno',
+                                                    'reserved'), ['101'])
+        self.assertFalse(self.hotels_obj.insert_hotel('Hotel Uno',
+                                                      'Monterrey', {}))
+
+
+    def test_hotel_ids(self):
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                          room_range=range(101, 103))
+        self.hotels_obj.create_hotel_bulk('Hotel Dos', 'Saltillo',
+                                          room_range=range(101, 103))
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.hotels_obj.modify_hotel_name('Hotel Uno', 'Hotel Once')
+        # Verifies the Hotel keeps its ID and its rooms after the rename
+        self.assertEqual(self.hotels_obj.hotel_ids.get('Hotel Once'), 1)
+        self.assertEqual(self.hotels_obj.hotels['Hotel Once']['hotel_id'],
+                         1)
+        self.assertEqual(self.hotels_obj.list_rooms('Hotel Once',
+                                                    'reserved'), ['101'])
+        self.assertTrue(self.hotels_obj.cancel_reservation('Hotel Once',
+                                                           '101'))
+        # Verifies the ID of a deleted Hotel is not given again
+        self.hotels_obj.delete_hotel('Hotel Dos')
+        self.hotels_obj.create_hotel('Hotel Dos', 'Saltillo', {})
+        self.assertEqual(self.hotels_obj.hotel_ids.get('Hotel Dos'), 3)
+
+    def test_hotels_in(self):
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                          room_range=range(101, 104))
+        self.hotels_obj.create_hotel_bulk('Hotel Dos', 'San  Pedro',
+                                          room_range=range(101, 103))
+        self.hotels_obj.create_hotel('Hotel Tres', 'monterrey', {})
+        self.hotels_obj.create_hotel_room('Hotel Tres', '101', 'available',
+                                          'single')
+        # Verifies the locations are compared without case and spacing
+        self.assertEqual(self.hotels_obj.hotels_in(' MONTERREY'),
+                         ['Hotel Uno', 'Hotel Tres'])
+        self.assertEqual(self.hotels_obj.location_room_counts(),
+                         {'monterrey': 4, 'san pedro': 2})
+        # Verifies the index follows renames, moves and removals
+        self.hotels_obj.modify_hotel_name('Hotel Uno', 'Hotel Once')
+        self.hotels_obj.modify_hotel_location('Hotel Dos', None,
+                                              'Monterrey')
+        self.hotels_obj.delete_hotel('Hotel Tres')
+        self.assertEqual(self.hotels_obj.hotels_in('monterrey'),
+                         ['Hotel Once', 'Hotel Dos'])
+        self.assertEqual(self.hotels_obj.location_room_count('Monterrey'),
+                         5)
+        self.assertEqual(self.hotels_obj.hotels_in('San Pedro'), [])
+
+    def test_hotels_in_neg_path_1(self):
+        # Path 1: Location without Hotels
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', {})
+        self.assertEqual(self.hotels_obj.hotels_in('Saltillo'), [])
+        self.assertEqual(self.hotels_obj.location_room_count('Saltillo'),
+                         0)
+        self.assertEqual(self.hotels_obj.location_room_count('Monterrey'),
+                         0)
+
+    def test_occupancy(self):
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                          room_range=range(101, 104),
+                                          room_types=('single', 'double'))
+        self.hotels_obj.create_hotel('Hotel Dos', 'Saltillo', {})
+        self.hotels_obj.create_hotel_room('Hotel Dos', '101', 'reserved',
+                                          'double')
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.hotels_obj.modify_hotel_rooms(
+            'Hotel Uno', None,
+            {'103': {'status': 'available', 'type': 'double'}})
+        occupancy = self.hotels_obj.occupancy('Hotel Uno')
+        self.assertEqual((occupancy.total, occupancy.reserved,
+                          occupancy.available), (3, 1, 2))
+        self.assertEqual(occupancy.by_type['double'],
+                         {'total': 2, 'reserved': 0, 'available': 2})
+        # Verifies the totals include every Hotel
+        self.assertEqual(self.hotels_obj.occupancy().reserved, 2)
+        self.assertEqual(self.hotels_obj.occupancy().rate, 0.5)
+        # Verifies the counters follow cancellations, renames and
+        # removals
+        self.hotels_obj.cancel_reservation('Hotel Uno', '101')
+        self.hotels_obj.modify_hotel_name('Hotel Uno', 'Hotel Once')
+        self.hotels_obj.delete_hotel('Hotel Dos')
+        self.assertEqual(list(self.hotels_obj.occupancy_by_hotel()),
+                         ['Hotel Once'])
+        occupancy = self.hotels_obj.occupancy()
+        self.assertEqual((occupancy.total, occupancy.reserved,
+                          occupancy.available), (3, 0, 3))
+
+    def test_occupancy_neg_path_1(self):
+        # Path 1: Hotel that does not exist or without rooms
+        self.hotels_obj.create_hotel('Hotel Uno', 'Monterrey', {})
+        self.assertIsNone(self.hotels_obj.occupancy('Hotel Dos'))
+        occupancy = self.hotels_obj.occupancy('Hotel Uno')
+        self.assertEqual((occupancy.total, occupancy.by_type), (0, {}))
+        self.assertEqual(occupancy.rate, 0.0)
+
+    def test_register_view(self):
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Cancun',
+                                          room_range=range(101, 103),
+                                          room_types=('double',))
+        view = self.hotels_obj.register_view(
+            AvailabilityView('Cancun', 'double', 'reserved'))
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.hotels_obj.modify_hotel_rooms(
+            'Hotel Uno', None,
+            {'102': {'status': 'reserved', 'type': 'single'}})
+        self.assertEqual(view.count, 1)
+        self.hotels_obj.modify_hotel_name('Hotel Uno', 'Hotel Once')
+        self.hotels_obj.cancel_reservation('Hotel Once', '101')
+        self.assertEqual(view.count, 0)
+
+    def test_display_hotel_information_paged(self):
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Cancun',
+                                          room_range=range(101, 111))
+        stream = io.StringIO()
+        result = self.hotels_obj.display_hotel_information(
+            'Hotel Uno', 'json', offset=8, stream=stream)
+        self.assertEqual(result.data, 4)
+        document = json.loads(stream.getvalue())
+        self.assertEqual(document['total_rooms'], 10)
+        self.assertEqual([room['room_number'] for room in document['rooms']],
+                         ['109', '110'])
+        result = self.hotels_obj.display_hotel_information('Hotel Uno',
+                                                           limit=1)
+        self.assertEqual(result.message.count('Room No.'), 1)
+
+    def test_display_hotel_information_paged_neg_path_1(self):
+        # Path 1: Output format or offset that is not valid
+        self.hotels_obj.create_hotel('Hotel Uno', 'Cancun', {})
+        result = self.hotels_obj.display_hotel_information('Hotel Uno',
+                                                           'xml')
+        self.assertEqual(result.text, 'Error: Invalid output format: xml')
+        self.assertFalse(self.hotels_obj.display_hotel_information(
+            'Hotel Uno', offset=-1))
+
+
+class CompactHotelsTest(HotelsTest):
+    """
+    Class to run the Hotels Test Cases with the compact room storage
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.hotels_obj = Hotels(compact=True)
+
+    def test_compact_rooms_storage(self):
+        # Dictionary with the rooms information
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '007': {'status': 'reserved', 'type': 'double'}
+        }
+        self.hotels_obj.create_hotel('Hotel Jackson',
+                                     'Los Angeles',
+                                     rooms_info)
+        rooms = self.hotels_obj.hotels['Hotel Jackson']['rooms']
+        # Verifies the rooms are stored as one byte per field
+        self.assertIsInstance(rooms, CompactRooms)
+        self.assertEqual(len(rooms.status), 102)
+        self.assertEqual(list(rooms), ['007', '101'])
+        self.assertEqual(rooms, rooms_info)
+        self.assertNotIn('102', rooms)
+
+
+class SqliteHotelsTest(HotelsTest):
+    """
+    Class to run the Hotels Test Cases with the SQLite storage
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.storage = SqliteStorage(':memory:')
+        self.hotels_obj = Hotels(storage=self.storage)
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.storage.close()
+
+
+class MappedHotelsTest(HotelsTest):
+    """
+    Class to run the Hotels Test Cases with the rooms in a room map
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.folder = tempfile.TemporaryDirectory()
+        self.room_map = RoomMap.create(
+            os.path.join(self.folder.name, 'rooms.map'), 16)
+        self.hotels_obj = Hotels(storage=self.room_map)
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.room_map.close()
+        self.folder.cleanup()
+
 
 # This part of the code prints the results from the Unit Tests performed
 if __name__ == '__main__':
@@ -0,0 +1,457 @@
+"""
+Journal
+
+This program handles an append-only journal (write-ahead log) of
+the operations that change the Hotels, Customers and Reservations,
+so the state can be recovered from the last snapshot and the
+operations logged after it
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import json
+import os
+import threading
+from datetime import date
+
+from snapshot import (encode_state, load_snapshot, write_file_atomically,
+                      write_snapshot)
+
+# Operations written to the journal, with the object that runs them
+JOURNAL_METHODS = {
+    'create_hotel': 'hotels',
+    'create_hotel_room': 'hotels',
+    'create_hotel_bulk': 'hotels',
+    'delete_hotel': 'hotels',
+    'modify_hotel_information': 'hotels',
+    'modify_hotel_name': 'hotels',
+    'modify_hotel_location': 'hotels',
+    'modify_hotel_rooms': 'hotels',
+    'reserve_room': 'hotels',
+    'cancel_reservation': 'hotels',
+    'book_room': 'hotels',
+    'release_room': 'hotels',
+    'create_customer': 'customers',
+    'delete_customer': 'customers',
+    'modify_customer_information': 'customers',
+    'modify_customer_name': 'customers',
+    'modify_customer_email': 'customers',
+    'modify_customer_phone': 'customers',
+    'create_customer_reservation': 'reservations',
+    'cancel_customer_reservation': 'reservations'
+}
+
+# Operations that may change the state even when they fail, since
+# they are made of several changes
+PARTIAL_METHODS = ('create_hotel', 'modify_hotel_information',
+                   'modify_hotel_rooms', 'modify_customer_information')
+
+
+def encode_value(value):
+    """
+    This function converts the arguments that JSON cannot store
+
+    Args:
+        value (object): The argument
+
+    Returns:
+        object: The date as 'YYYY-MM-DD', or the range as a list
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, range):
+        return list(value)
+    raise TypeError(f'{type(value).__name__} cannot be journaled')
+
+
+def read_journal(path):
+    """
+    This function reads the records of a journal. Reading stops at the
+    first record that is incomplete or damaged, which is the record
+    that was being written when the program stopped
+
+    Args:
+        path (str): The path of the journal file
+
+    Returns:
+        iterator: (seq, method_name, args, end) tuples, where end is
+        the offset of the file after the record
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, 'rb') as stream:
+        end = 0
+        for line in stream:
+            if not line.endswith(b'\n'):
+                return
+            try:
+                seq, method_name, args = json.loads(line)
+            except (TypeError, ValueError):
+                return
+            end += len(line)
+            yield seq, method_name, args, end
+
+
+def apply_record(reservations, method_name, args):
+    """
+    This function runs a journaled operation on the objects
+
+    Args:
+        reservations (Reservations): The Reservations object, which
+        holds the Hotels and Customers objects
+        method_name (str): The name of the method, from JOURNAL_METHODS
+        args (list): The arguments of the method
+
+    Returns:
+        object: The value returned by the method
+    """
+    target = {'hotels': reservations.hotels_instance,
+              'customers': reservations.customers_instance,
+              'reservations': reservations}[JOURNAL_METHODS[method_name]]
+    return getattr(target, method_name)(*args)
+
+
+def recover(reservations, snapshot_path, journal_path):
+    """
+    This function restores the state from the last snapshot (if any)
+    and runs the journal records written after it, without printing
+
+    Args:
+        reservations (Reservations): The empty Reservations object,
+        which holds the empty Hotels and Customers objects
+        snapshot_path (str): The path of the snapshot file
+        journal_path (str): The path of the journal file
+
+    Returns:
+        tuple: The number of the last record (int) and the number of
+        records that were run (int)
+    """
+    seq = 0
+    if os.path.exists(snapshot_path):
+        seq = load_snapshot(snapshot_path, reservations).seq
+
+    objects = (reservations, reservations.hotels_instance,
+               reservations.customers_instance)
+    sinks = [target.sink for target in objects]
+    for target in objects:
+        target.sink = None
+    replayed = 0
+    try:
+        for record_seq, method_name, args, _ in read_journal(journal_path):
+            if record_seq <= seq:
+                continue
+            apply_record(reservations, method_name, args)
+            seq = record_seq
+            replayed += 1
+    finally:
+        for target, sink in zip(objects, sinks):
+            target.sink = sink
+    return seq, replayed
+
+
+class Journal:
+    """
+    Class to append records to a journal file. Records are flushed to
+    disk in groups (group commit): once sync_every records are waiting,
+    and every sync_interval seconds, so only the records of the last
+    group can be lost when the program or the machine stops
+    """
+    def __init__(self, path, seq=0, sync_every=1, sync_interval=None):
+        """
+        Initializes the Journal object, a damaged record at the end of
+        the file is cut off
+
+        Args:
+            path (str): The path of the journal file
+            seq (int): The number of the last record already applied,
+            the file may have been compacted past it
+            sync_every (int): The number of records flushed together
+            sync_interval (float): The maximum seconds a record waits
+            to be flushed, None to flush only by count
+
+        Returns:
+            None
+        """
+        end = 0
+        for record_seq, _, _, end in read_journal(path):
+            seq = max(seq, record_seq)
+        if os.path.exists(path) and os.path.getsize(path) > end:
+            os.truncate(path, end)
+
+        self.path = path
+        self.seq = seq
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._descriptor = os.open(path, os.O_WRONLY | os.O_APPEND
+                                   | os.O_CREAT, 0o644)
+        # Records written since the last flush
+        self._pending = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._syncer = None
+        if sync_interval is not None:
+            self._syncer = threading.Thread(target=self._sync_loop,
+                                            daemon=True)
+            self._syncer.start()
+
+    def __enter__(self):
+        """
+        This method returns the journal at the start of a with block
+
+        Returns:
+            Journal: The journal
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        This method closes the journal at the end of a with block
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def append(self, method_name, args):
+        """
+        This method writes a record, which is flushed to disk with its
+        group
+
+        Args:
+            method_name (str): The name of the method
+            args (tuple): The arguments of the method
+
+        Returns:
+            int: The number of the record
+        """
+        with self._lock:
+            self.seq += 1
+            self._pending.append(json.dumps(
+                [self.seq, method_name, list(args)], default=encode_value,
+                separators=(',', ':')).encode('utf-8') + b'\n')
+            if len(self._pending) >= self.sync_every:
+                self._sync()
+            return self.seq
+
+    def sync(self):
+        """
+        This method flushes the waiting records to disk
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._sync()
+
+    def _sync(self):
+        """
+        This method writes the waiting records with one write and
+        flushes them to disk, the lock must be held
+
+        Returns:
+            None
+        """
+        if not self._pending:
+            return
+        os.write(self._descriptor, b''.join(self._pending))
+        os.fsync(self._descriptor)
+        self._pending = []
+
+    def _sync_loop(self):
+        """
+        This method flushes the waiting records every sync_interval
+        seconds until the journal is closed
+
+        Returns:
+            None
+        """
+        while not self._closed.wait(self.sync_interval):
+            self.sync()
+
+    def truncate(self, seq):
+        """
+        This method removes the records up to a number, once they are
+        kept in a snapshot. The remaining records are copied to a new
+        file that replaces the journal
+
+        Args:
+            seq (int): The number of the last record to be removed
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._sync()
+            os.close(self._descriptor)
+            with open(self.path, 'rb') as stream:
+                lines = [line for line in stream
+                         if json.loads(line)[0] > seq]
+            write_file_atomically(self.path, *lines)
+            self._descriptor = os.open(self.path,
+                                       os.O_WRONLY | os.O_APPEND)
+
+    def close(self):
+        """
+        This method flushes the waiting records and closes the journal
+
+        Returns:
+            None
+        """
+        self._closed.set()
+        if self._syncer is not None:
+            self._syncer.join()
+        with self._lock:
+            if self._descriptor is not None:
+                self._sync()
+                os.close(self._descriptor)
+                self._descriptor = None
+
+
+class JournaledReservations:
+    """
+    Class to run the operations that change the Hotels, Customers and
+    Reservations while writing them to a journal. The operations are
+    called as methods of this object (journaled.create_hotel(...)),
+    one at a time, so the journal keeps the order they were applied in.
+    On creation the state is recovered from the snapshot and the
+    journal, and compact() folds the journal into a new snapshot
+    """
+    def __init__(self, reservations, snapshot_path, journal_path,
+                 sync_every=1, sync_interval=None, compact_every=None):
+        """
+        Initializes the JournaledReservations object
+
+        Args:
+            reservations (Reservations): The empty Reservations object,
+            which holds the empty Hotels and Customers objects
+            snapshot_path (str): The path of the snapshot file
+            journal_path (str): The path of the journal file
+            sync_every (int): The number of records flushed together
+            sync_interval (float): The maximum seconds a record waits
+            to be flushed, None to flush only by count
+            compact_every (int): The number of records after which the
+            journal is compacted in the background, None to compact
+            only when compact() is called
+
+        Returns:
+            None
+        """
+        self.reservations_instance = reservations
+        self.snapshot_path = snapshot_path
+        seq, self.replayed = recover(reservations, snapshot_path,
+                                     journal_path)
+        self.journal = Journal(journal_path, seq, sync_every,
+                               sync_interval)
+        self.compact_every = compact_every
+        self._write_lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compacted_seq = seq
+        self._compactor = None
+
+    def __getattr__(self, method_name):
+        """
+        This method returns the journaled version of an operation
+
+        Args:
+            method_name (str): The name of the method
+
+        Returns:
+            function: The function that runs and journals the method
+        """
+        if method_name not in JOURNAL_METHODS:
+            raise AttributeError(method_name)
+
+        def run(*args):
+            return self.execute(method_name, *args)
+        return run
+
+    def __enter__(self):
+        """
+        This method returns the object at the start of a with block
+
+        Returns:
+            JournaledReservations: The object
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        This method closes the journal at the end of a with block
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def execute(self, method_name, *args):
+        """
+        This method runs an operation and writes it to the journal,
+        unless it failed without changing anything
+
+        Args:
+            method_name (str): The name of the method, from
+            JOURNAL_METHODS
+            args (tuple): The arguments of the method
+
+        Returns:
+            object: The value returned by the method
+        """
+        if method_name not in JOURNAL_METHODS:
+            raise ValueError(f'Unsupported operation: {method_name}')
+
+        with self._write_lock:
+            value = apply_record(self.reservations_instance, method_name,
+                                 args)
+            if value or method_name in PARTIAL_METHODS:
+                seq = self.journal.append(method_name, args)
+                if (self.compact_every is not None
+                        and seq - self._compacted_seq >= self.compact_every):
+                    self._compacted_seq = seq
+                    self.compact_in_background()
+        return value
+
+    def compact(self):
+        """
+        This method folds the journal into a new snapshot. Writes wait
+        only while the state is encoded, the snapshot is written and
+        the journal is cut while they continue
+
+        Returns:
+            SnapshotSummary: The summary of the new snapshot
+        """
+        with self._compact_lock:
+            with self._write_lock:
+                seq = self.journal.seq
+                state = encode_state(self.reservations_instance, seq)
+            summary = write_snapshot(self.snapshot_path, state)
+            self.journal.truncate(seq)
+        return summary
+
+    def compact_in_background(self):
+        """
+        This method starts compact() in a thread, unless a compaction
+        is already running
+
+        Returns:
+            Thread: The thread of the compaction, None if one was
+            already running
+        """
+        if self._compactor is not None and self._compactor.is_alive():
+            return None
+        self._compactor = threading.Thread(target=self.compact,
+                                           daemon=True)
+        self._compactor.start()
+        return self._compactor
+
+    def close(self):
+        """
+        This method waits for a running compaction and closes the
+        journal
+
+        Returns:
+            None
+        """
+        if self._compactor is not None:
+            self._compactor.join()
+        self.journal.close()
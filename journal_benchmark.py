@@ -0,0 +1,110 @@
+"""
+Journal Benchmark
+
+This program measures the reservations per second written
+through the journal for several group commit sizes, and the
+time taken to recover them with and without compaction
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import os
+import tempfile
+import time
+
+from customers import Customers
+from hotels import Hotels
+from journal import JournaledReservations
+from reservations import Reservations
+
+HOTELS = 100
+ROOMS_PER_HOTEL = 100
+RESERVATIONS = 10000
+GROUP_SIZES = [1, 10, 100, 1000]
+
+
+def open_journaled(folder, **options):
+    """
+    This function recovers objects that do not print from the files
+    of a folder
+
+    Args:
+        folder (str): The folder of the snapshot and journal files
+        options (dict): The options of JournaledReservations
+
+    Returns:
+        JournaledReservations: The journaled objects
+    """
+    return JournaledReservations(
+        Reservations(Hotels(sink=None), Customers(sink=None), sink=None),
+        os.path.join(folder, 'state.snap'),
+        os.path.join(folder, 'state.log'), **options)
+
+
+def write_reservations(journaled):
+    """
+    This function creates the Hotels, a customer and the reservations
+
+    Args:
+        journaled (JournaledReservations): The journaled objects
+
+    Returns:
+        float: The seconds taken by the reservations
+    """
+    for number in range(HOTELS):
+        journaled.create_hotel_bulk(f'Hotel {number}', 'Monterrey', None,
+                                    range(ROOMS_PER_HOTEL))
+    journaled.create_customer('4444', 'Jose Lopez', 'jlopez@gmail.com',
+                              '6643127401')
+    start = time.perf_counter()
+    for number in range(RESERVATIONS):
+        journaled.create_customer_reservation(
+            f'{number:06d}', '4444', f'Hotel {number % HOTELS}',
+            f'{number // HOTELS:03d}')
+    return time.perf_counter() - start
+
+
+def measure_recovery(folder, compact):
+    """
+    This function measures the time taken to recover the state
+
+    Args:
+        folder (str): The folder of the snapshot and journal files
+        compact (bool): True to fold the journal into a snapshot first
+
+    Returns:
+        float: The seconds taken by the recovery
+    """
+    if compact:
+        with open_journaled(folder) as journaled:
+            journaled.compact()
+    start = time.perf_counter()
+    with open_journaled(folder):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Main function, prints the throughput of each group size and the
+    recovery times
+
+    Returns:
+        None
+    """
+    print(f'{RESERVATIONS} reservations')
+    print(f'{"group":>6} {"reservations/s":>16}')
+    for group_size in GROUP_SIZES:
+        with tempfile.TemporaryDirectory() as folder:
+            with open_journaled(folder, sync_every=group_size) as journaled:
+                elapsed = write_reservations(journaled)
+            print(f'{group_size:>6} {RESERVATIONS / elapsed:>16.0f}')
+            if group_size == GROUP_SIZES[-1]:
+                replay = measure_recovery(folder, compact=False)
+                snapshot = measure_recovery(folder, compact=True)
+                print(f'recovery: {replay:.2f} s from the journal, '
+                      f'{snapshot:.2f} s from a snapshot')
+
+
+if __name__ == '__main__':
+    main()
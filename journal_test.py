@@ -0,0 +1,213 @@
+"""
+Journal Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following classes and functions:
+
+- Journal
+- JournaledReservations
+- recover()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from hotels import Hotels
+from customers import Customers
+from reservations import Reservations
+from journal import Journal, JournaledReservations, read_journal
+
+
+def new_reservations():
+    """
+    This function creates empty Hotels, Customers and Reservations
+    objects that do not print
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    return Reservations(Hotels(sink=None), Customers(sink=None),
+                        sink=None)
+
+
+class JournalTest(unittest.TestCase):
+    """
+    Class to handle the Journal Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.folder = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.folder.name, 'state.snap')
+        self.journal_path = os.path.join(self.folder.name, 'state.log')
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.folder.cleanup()
+
+    def open_journaled(self, **options):
+        """
+        This method recovers new objects from the files of the test
+
+        Returns:
+            JournaledReservations: The journaled objects
+        """
+        return JournaledReservations(new_reservations(),
+                                     self.snapshot_path,
+                                     self.journal_path, **options)
+
+    def fill(self, journaled):
+        """
+        This method runs a few operations on the journaled objects
+
+        Returns:
+            None
+        """
+        journaled.create_hotel('Hotel California', 'Tijuana',
+                               {'101': {'status': 'available',
+                                        'type': 'single'},
+                                '102': {'status': 'available',
+                                        'type': 'double'}})
+        journaled.create_customer('4444', 'Jose Lopez',
+                                  'jlopez@gmail.com', '6643127401')
+        journaled.create_customer_reservation('111111', '4444',
+                                              'Hotel California', '101')
+        journaled.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '102', '2024-05-01',
+            '2024-05-04')
+        journaled.modify_hotel_location('Hotel California', None,
+                                        'Rosarito')
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_recover_happy_path(self):
+        with self.open_journaled() as journaled:
+            self.fill(journaled)
+        with self.open_journaled() as journaled:
+            # Verifies the state was rebuilt from the journal alone
+            self.assertEqual(journaled.replayed, 5)
+            reservations_obj = journaled.reservations_instance
+            self.assertEqual(reservations_obj.hotels_instance.hotels
+                             ['Hotel California']['location'], 'Rosarito')
+            self.assertEqual(len(reservations_obj.reservations), 2)
+            self.assertFalse(reservations_obj.create_customer_reservation(
+                '333333', '4444', 'Hotel California', '102',
+                '2024-05-02', '2024-05-03'))
+
+    def test_compact_happy_path(self):
+        with self.open_journaled() as journaled:
+            self.fill(journaled)
+            summary = journaled.compact()
+            self.assertEqual(summary.seq, 5)
+            journaled.cancel_customer_reservation('111111')
+        # Verifies only the record after the snapshot is kept
+        self.assertEqual([record[:2] for record
+                          in read_journal(self.journal_path)],
+                         [(6, 'cancel_customer_reservation')])
+        with self.open_journaled() as journaled:
+            self.assertEqual(journaled.replayed, 1)
+            self.assertIsNone(journaled.reservations_instance.
+                              reservations.get('111111'))
+            journaled.create_customer('5555', 'Ana Perez',
+                                      'aperez@gmail.com', '6643127402')
+            self.assertEqual(journaled.journal.seq, 7)
+
+    def test_compact_every(self):
+        with self.open_journaled(compact_every=2) as journaled:
+            self.fill(journaled)
+        self.assertTrue(os.path.exists(self.snapshot_path))
+        with self.open_journaled() as journaled:
+            self.assertEqual(len(journaled.reservations_instance.
+                                 reservations), 2)
+
+    def test_group_commit(self):
+        with Journal(self.journal_path, sync_every=3) as journal:
+            journal.append('delete_hotel', ('Hotel Uno',))
+            journal.append('delete_hotel', ('Hotel Dos',))
+            # Verifies the records wait for their group
+            self.assertEqual(list(read_journal(self.journal_path)), [])
+            journal.append('delete_hotel', ('Hotel Tres',))
+            self.assertEqual(len(list(read_journal(self.journal_path))),
+                             3)
+
+    def test_group_commit_interval(self):
+        with Journal(self.journal_path, sync_every=100,
+                     sync_interval=0.01) as journal:
+            journal.append('delete_hotel', ('Hotel Uno',))
+            deadline = time.monotonic() + 5
+            while (not list(read_journal(self.journal_path))
+                   and time.monotonic() < deadline):
+                time.sleep(0.01)
+            self.assertEqual(len(list(read_journal(self.journal_path))),
+                             1)
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_recover_neg_path_1(self):
+        # Path 1: Record cut off by a crash
+        with self.open_journaled() as journaled:
+            self.fill(journaled)
+        with open(self.journal_path, 'ab') as stream:
+            stream.write(b'[6,"delete_hotel",["Hotel Cal')
+        with self.open_journaled() as journaled:
+            self.assertEqual(journaled.replayed, 5)
+            journaled.delete_customer('4444')
+        self.assertEqual([record[0] for record
+                          in read_journal(self.journal_path)],
+                         [1, 2, 3, 4, 5, 6])
+
+    def test_recover_neg_path_2(self):
+        # Path 2: Room update that fails for some of the rooms
+        with self.open_journaled() as journaled:
+            self.fill(journaled)
+            self.assertFalse(journaled.modify_hotel_rooms(
+                'Hotel California', None,
+                {'101': {'status': 'available', 'type': 'double'},
+                 '999': {'status': 'available', 'type': 'single'}}))
+        with self.open_journaled() as journaled:
+            # Verifies the rooms that were updated are replayed
+            self.assertEqual(journaled.replayed, 6)
+            self.assertEqual(journaled.reservations_instance.
+                             hotels_instance.hotels['Hotel California']
+                             ['rooms']['101']['type'], 'double')
+
+    def test_execute_neg_path_1(self):
+        # Path 1: Failed operations are not journaled
+        with self.open_journaled() as journaled:
+            self.assertFalse(journaled.delete_hotel('Hotel Dos'))
+            self.assertFalse(journaled.create_hotel_bulk(
+                'Hotel Dos', 'Monterrey', None, range(101, 103), ()))
+            with self.assertRaises(ValueError):
+                journaled.execute('find_hotel_reservations', 'Hotel Dos')
+            with self.assertRaises(AttributeError):
+                journaled.display_hotel_information('Hotel Dos')
+        self.assertEqual(list(read_journal(self.journal_path)), [])
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(JournalTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('JournalTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -0,0 +1,96 @@
+"""
+Location Benchmark
+
+This program measures the time taken to list the Hotels of a
+location with the location index and by scanning every Hotel,
+and the time taken to search the rooms of a location
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import time
+
+from hotels import Hotels, normalize_location
+
+HOTELS = 10000
+LOCATIONS = 100
+ROOMS_PER_HOTEL = 10
+LOOKUPS = 1000
+
+
+def location_name(number):
+    """
+    This function names a location with letters only, as the locations
+    of the Hotels cannot have digits
+
+    Args:
+        number (int): The number of the location
+
+    Returns:
+        str: The name of the location
+    """
+    return 'City ' + ''.join(chr(ord('a') + int(digit))
+                             for digit in str(number))
+
+
+def scan_hotels(hotels_obj, location):
+    """
+    This function lists the Hotels of a location by reading the
+    location of every Hotel
+
+    Args:
+        hotels_obj (Hotels): The Hotels object
+        location (str): The location
+
+    Returns:
+        list: The names of the Hotels of the location
+    """
+    location = normalize_location(location)
+    return [hotel_name for hotel_name, hotel in hotels_obj.hotels.items()
+            if normalize_location(hotel['location']) == location]
+
+
+def timed(operation):
+    """
+    This function measures the milliseconds taken by each lookup
+
+    Args:
+        operation (function): The function that looks up a location
+
+    Returns:
+        float: The milliseconds per lookup
+    """
+    start = time.perf_counter()
+    for number in range(LOOKUPS):
+        operation(location_name(number % LOCATIONS))
+    return (time.perf_counter() - start) * 1e3 / LOOKUPS
+
+
+def main():
+    """
+    Main function, prints the milliseconds per lookup of each method
+
+    Returns:
+        None
+    """
+    hotels_obj = Hotels(sink=None)
+    for number in range(HOTELS):
+        hotels_obj.create_hotel_bulk(f'Hotel {number}',
+                                     location_name(number % LOCATIONS),
+                                     room_range=range(ROOMS_PER_HOTEL))
+
+    operations = {
+        'hotels_in (index)': hotels_obj.hotels_in,
+        'scan of every Hotel':
+            lambda location: scan_hotels(hotels_obj, location),
+        'location_room_count': hotels_obj.location_room_count,
+        'search_availability':
+            lambda location: list(hotels_obj.search_availability(location))
+    }
+    print(f'{"method":<22} {"ms per lookup":>14}')
+    for method, operation in operations.items():
+        print(f'{method:<22} {timed(operation):>14.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Locking
+
+This program handles the locks used by the Hotels, Customers
+and Reservations classes when they are shared between threads
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import threading
+
+
+class NullLock:
+    """
+    Class to stand in for a lock (or a StripedLock) when the objects
+    are used by a single thread, entering it costs nothing
+    """
+    def __enter__(self):
+        """
+        This method enters the lock, which does nothing
+
+        Returns:
+            NullLock: The lock
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        This method leaves the lock, which does nothing
+
+        Returns:
+            None
+        """
+
+    def lock_for(self, key):
+        """
+        This method returns the lock of a key, the same null lock for
+        all of them
+
+        Args:
+            key (object): The key to be locked
+
+        Returns:
+            NullLock: The lock
+        """
+        return self
+
+
+NULL_LOCK = NullLock()
+
+
+class StripedLock:
+    """
+    Class to split a set of keys into a fixed number of stripes with
+    one lock each, so threads working on keys of different stripes do
+    not wait for each other, without one lock per key
+    """
+    def __init__(self, stripes=64):
+        """
+        Initializes the StripedLock object
+
+        Args:
+            stripes (int): The number of locks
+
+        Returns:
+            None
+        """
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def __len__(self):
+        """
+        This method returns the number of stripes
+
+        Returns:
+            int: The number of locks
+        """
+        return len(self._locks)
+
+    def lock_for(self, key):
+        """
+        This method returns the lock of the stripe of a key
+
+        Args:
+            key (object): The key to be locked
+
+        Returns:
+            RLock: The lock of the key
+        """
+        return self._locks[hash(key) % len(self._locks)]
+
+
+def make_lock(concurrent):
+    """
+    This function creates the lock of a structure that is shared by
+    all the keys
+
+    Args:
+        concurrent (bool): True if the structure is used by threads
+
+    Returns:
+        RLock: A reentrant lock, or NULL_LOCK when not concurrent
+    """
+    return threading.RLock() if concurrent else NULL_LOCK
+
+
+def make_striped_lock(concurrent, stripes=64):
+    """
+    This function creates the striped lock of a structure whose keys
+    can be locked separately
+
+    Args:
+        concurrent (bool): True if the structure is used by threads
+        stripes (int): The number of locks
+
+    Returns:
+        StripedLock: The striped lock, or NULL_LOCK when not concurrent
+    """
+    return StripedLock(stripes) if concurrent else NULL_LOCK
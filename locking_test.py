@@ -0,0 +1,79 @@
+"""
+Locking Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following classes and functions:
+
+- NullLock
+- StripedLock
+- make_lock()
+- make_striped_lock()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import unittest
+from locking import NULL_LOCK, StripedLock, make_lock, make_striped_lock
+
+
+class LockingTest(unittest.TestCase):
+    """
+    Class to handle the Locking Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.striped_lock = StripedLock(stripes=8)
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_lock_for_happy_path(self):
+        # Verifies a key always gets the same lock
+        self.assertIs(self.striped_lock.lock_for('Hotel Uno'),
+                      self.striped_lock.lock_for('Hotel Uno'))
+        self.assertIs(self.striped_lock.lock_for(('Hotel Uno', '101')),
+                      self.striped_lock.lock_for(('Hotel Uno', '101')))
+        self.assertEqual(len(self.striped_lock), 8)
+
+    def test_lock_for_reentrant(self):
+        lock = self.striped_lock.lock_for('1234')
+        with lock:
+            # Verifies the same thread can enter the lock again
+            with self.striped_lock.lock_for('1234'):
+                pass
+
+    def test_make_lock_happy_path(self):
+        self.assertIsInstance(make_striped_lock(True), StripedLock)
+        with make_lock(True):
+            pass
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_make_lock_neg_path_1(self):
+        # Path 1: Objects that are not shared by threads
+        self.assertIs(make_lock(False), NULL_LOCK)
+        self.assertIs(make_striped_lock(False), NULL_LOCK)
+        self.assertIs(NULL_LOCK.lock_for('1234'), NULL_LOCK)
+        with NULL_LOCK:
+            pass
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(LockingTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('LockingTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -0,0 +1,300 @@
+"""
+Name Index
+
+This program handles a search index over names, which answers
+case-insensitive prefix searches and fuzzy (trigram) searches
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import heapq
+from collections import Counter
+from bisect import bisect_left, insort
+
+# Number of index entries a fuzzy search reads to find candidates,
+# and number of candidate names it scores
+FUZZY_BUDGET = 100000
+FUZZY_CANDIDATES = 1000
+
+
+def normalize_name(name):
+    """
+    This function folds the case and the whitespace of a name
+
+    Args:
+        name (str): The name to be normalized
+
+    Returns:
+        str: The normalized name
+    """
+    return ' '.join(name.split()).casefold()
+
+
+def name_trigrams(name):
+    """
+    This function splits a normalized name into its trigrams, each
+    word padded so its first and last letters form trigrams too
+
+    Args:
+        name (str): The normalized name
+
+    Returns:
+        set: The trigrams of the name
+    """
+    trigrams = set()
+    for word in name.split():
+        padded = f'  {word} '
+        for start in range(len(padded) - 2):
+            trigrams.add(padded[start:start + 3])
+    return trigrams
+
+
+class SortedTerms:
+    """
+    Class to keep (term, key) tuples sorted in buckets of bounded size,
+    so insertions and removals only shift one bucket instead of the
+    whole list
+    """
+    def __init__(self, bucket_size=512):
+        """
+        Initializes the SortedTerms object
+
+        Args:
+            bucket_size (int): The size at which a bucket is split
+
+        Returns:
+            None
+        """
+        self._bucket_size = bucket_size
+        self._buckets = []
+        # Last (largest) item of each bucket
+        self._maxes = []
+
+    def __len__(self):
+        """
+        This method returns the number of stored items
+
+        Returns:
+            int: The number of items
+        """
+        return sum(len(bucket) for bucket in self._buckets)
+
+    def add(self, item):
+        """
+        This method inserts an item in order
+
+        Args:
+            item (tuple): The (term, key) tuple
+
+        Returns:
+            None
+        """
+        if not self._buckets:
+            self._buckets.append([item])
+            self._maxes.append(item)
+            return
+
+        number = bisect_left(self._maxes, item)
+        if number == len(self._buckets):
+            number -= 1
+        bucket = self._buckets[number]
+        insort(bucket, item)
+        self._maxes[number] = bucket[-1]
+        if len(bucket) > self._bucket_size:
+            half = len(bucket) // 2
+            self._buckets.insert(number + 1, bucket[half:])
+            del bucket[half:]
+            self._maxes.insert(number, bucket[-1])
+
+    def remove(self, item):
+        """
+        This method removes an item (if it is stored)
+
+        Args:
+            item (tuple): The (term, key) tuple
+
+        Returns:
+            None
+        """
+        number = bisect_left(self._maxes, item)
+        if number == len(self._buckets):
+            return
+        bucket = self._buckets[number]
+        position = bisect_left(bucket, item)
+        if position == len(bucket) or bucket[position] != item:
+            return
+        del bucket[position]
+        if bucket:
+            self._maxes[number] = bucket[-1]
+        else:
+            del self._buckets[number]
+            del self._maxes[number]
+
+    def iter_from(self, item):
+        """
+        This method iterates over the items from the first one that is
+        not lower than the given item
+
+        Args:
+            item (tuple): The item to start from
+
+        Returns:
+            iterator: The items in order
+        """
+        number = bisect_left(self._maxes, item)
+        for bucket_number in range(number, len(self._buckets)):
+            bucket = self._buckets[bucket_number]
+            start = (bisect_left(bucket, item)
+                     if bucket_number == number else 0)
+            yield from bucket[start:]
+
+
+class NameIndex:
+    """
+    Class to search names by prefix and by similarity. Every word of a
+    name starts a searchable term, so a prefix matches the beginning of
+    any word ('lop' finds 'Jose Lopez'), and the trigrams of the names
+    are indexed to rank names that are similar to a misspelled query
+    """
+    def __init__(self):
+        """
+        Initializes the NameIndex object
+
+        Returns:
+            None
+        """
+        self._names = {}
+        # Sorted (term, key) tuples, a term is a name from a word on
+        self._terms = SortedTerms()
+        self._trigrams = {}
+        self._trigram_counts = {}
+
+    def __len__(self):
+        """
+        This method returns the number of indexed names
+
+        Returns:
+            int: The number of names
+        """
+        return len(self._names)
+
+    @staticmethod
+    def _name_terms(name):
+        """
+        This method lists the terms of a normalized name
+
+        Args:
+            name (str): The normalized name
+
+        Returns:
+            list: The name starting from each of its words
+        """
+        words = name.split(' ')
+        return [' '.join(words[start:]) for start in range(len(words))]
+
+    def add(self, key, name):
+        """
+        This method indexes a name, replacing the previous name of the
+        key (if applicable)
+
+        Args:
+            key (str): The key the name belongs to
+            name (str): The name to be indexed
+
+        Returns:
+            None
+        """
+        if key in self._names:
+            self.remove(key)
+
+        name = normalize_name(name)
+        self._names[key] = name
+        for term in self._name_terms(name):
+            self._terms.add((term, key))
+        trigrams = name_trigrams(name)
+        self._trigram_counts[key] = len(trigrams)
+        for trigram in trigrams:
+            self._trigrams.setdefault(trigram, set()).add(key)
+
+    def remove(self, key):
+        """
+        This method removes the name of a key from the index
+
+        Args:
+            key (str): The key the name belongs to
+
+        Returns:
+            None
+        """
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+
+        for term in self._name_terms(name):
+            self._terms.remove((term, key))
+        del self._trigram_counts[key]
+        for trigram in name_trigrams(name):
+            keys = self._trigrams[trigram]
+            keys.discard(key)
+            if not keys:
+                del self._trigrams[trigram]
+
+    def prefix(self, query, limit=10):
+        """
+        This method finds the names with a word that starts with the
+        query, sorted alphabetically from the matching word
+
+        Args:
+            query (str): The prefix to be searched (case-insensitive)
+            limit (int): The maximum number of results
+
+        Returns:
+            list: The keys of the matching names
+        """
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        keys = {}
+        for term, key in self._terms.iter_from((query,)):
+            if len(keys) >= limit or not term.startswith(query):
+                break
+            keys[key] = None
+        return list(keys)
+
+    def fuzzy(self, query, limit=10):
+        """
+        This method finds the names most similar to the query, by the
+        share of trigrams they have in common (Jaccard similarity).
+        The rarest trigrams of the query are read first, up to
+        FUZZY_BUDGET index entries, and only the FUZZY_CANDIDATES names
+        that share the most of them are scored
+
+        Args:
+            query (str): The name to be searched (case-insensitive)
+            limit (int): The maximum number of results
+
+        Returns:
+            list: (key, score) tuples, from the most similar name
+        """
+        query_trigrams = name_trigrams(normalize_name(query))
+        postings = sorted((self._trigrams[trigram] for trigram
+                           in query_trigrams if trigram in self._trigrams),
+                          key=len)
+
+        counts = Counter()
+        read = 0
+        for keys in postings:
+            if read and read + len(keys) > FUZZY_BUDGET:
+                break
+            counts.update(keys)
+            read += len(keys)
+
+        scores = []
+        for key, _ in counts.most_common(FUZZY_CANDIDATES):
+            shared = sum(1 for keys in postings if key in keys)
+            total = (len(query_trigrams) + self._trigram_counts[key]
+                     - shared)
+            scores.append((shared / total, key))
+        return [(key, score) for score, key
+                in heapq.nlargest(limit, scores)]
@@ -0,0 +1,106 @@
+"""
+Name Index Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- add()
+- remove()
+- prefix()
+- fuzzy()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import unittest
+from name_index import NameIndex, SortedTerms
+
+
+class NameIndexTest(unittest.TestCase):
+    """
+    Class to handle the NameIndex Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.index_obj = NameIndex()
+        self.index_obj.add('1234', 'Jose Lopez')
+        self.index_obj.add('2345', 'Maria  LOPEZ Garcia')
+        self.index_obj.add('3456', 'Josefina Perez')
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_prefix_happy_path(self):
+        # Verifies the prefix matches the start of any word
+        self.assertEqual(self.index_obj.prefix('jose'), ['1234', '3456'])
+        self.assertEqual(sorted(self.index_obj.prefix('LOP')),
+                         ['1234', '2345'])
+        self.assertEqual(self.index_obj.prefix('lopez gar'), ['2345'])
+        self.assertEqual(self.index_obj.prefix('jose', limit=1), ['1234'])
+
+    def test_fuzzy_happy_path(self):
+        # Verifies a misspelled name ranks the closest name first
+        results = self.index_obj.fuzzy('Jose Lopes')
+        self.assertEqual(results[0][0], '1234')
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_add_replaces_name(self):
+        self.index_obj.add('1234', 'Pedro Ramirez')
+        # Verifies the previous name is no longer indexed
+        self.assertEqual(self.index_obj.prefix('jose'), ['3456'])
+        self.assertEqual(self.index_obj.prefix('ram'), ['1234'])
+        self.assertEqual(len(self.index_obj), 3)
+
+    def test_remove_happy_path(self):
+        self.index_obj.remove('2345')
+        # Verifies the name is no longer found
+        self.assertEqual(self.index_obj.prefix('maria'), [])
+        self.assertNotIn('2345', [key for key, _
+                                  in self.index_obj.fuzzy('Maria Garcia')])
+
+    def test_sorted_terms_buckets(self):
+        terms = SortedTerms(bucket_size=4)
+        for number in range(50, 0, -1):
+            terms.add((f'{number:02d}', str(number)))
+        terms.remove(('10', '10'))
+        # Verifies the items stay sorted across the split buckets
+        items = list(terms.iter_from(('05',)))
+        self.assertEqual(items[0], ('05', '5'))
+        self.assertNotIn(('10', '10'), items)
+        self.assertEqual(len(terms), 49)
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # some are missing/None.
+
+    def test_prefix_neg_path_1(self):
+        # Path 1: Empty prefix
+        self.assertEqual(self.index_obj.prefix('  '), [])
+
+    def test_fuzzy_neg_path_1(self):
+        # Path 1: Name without any known trigram
+        self.assertEqual(self.index_obj.fuzzy('xyz'), [])
+
+    def test_remove_neg_path_1(self):
+        # Path 1: Key that was never indexed
+        self.index_obj.remove('9999')
+        self.assertEqual(len(self.index_obj), 3)
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(NameIndexTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('NameIndexTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -0,0 +1,99 @@
+"""
+Occupancy Benchmark
+
+This program measures the time taken to read the occupancy of
+all the Hotels from the counters and by counting every room, and
+the time taken per reservation and cancellation with the counters
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import time
+
+from hotels import Hotels
+
+HOTEL_COUNTS = (100, 1000, 10000)
+ROOMS_PER_HOTEL = 100
+READS = 100
+OPERATIONS = 100000
+
+
+def scan_occupancy(hotels_obj):
+    """
+    This function counts the reserved and available rooms of all the
+    Hotels by reading every room
+
+    Args:
+        hotels_obj (Hotels): The Hotels object
+
+    Returns:
+        dict: The number of rooms by status
+    """
+    counts = {'reserved': 0, 'available': 0}
+    for hotel in hotels_obj.hotels.values():
+        for room in hotel['rooms'].values():
+            counts[room['status']] += 1
+    return counts
+
+
+def timed(operation, repeat):
+    """
+    This function measures the milliseconds taken by each call
+
+    Args:
+        operation (function): The function that is called
+        repeat (int): The number of calls
+
+    Returns:
+        float: The milliseconds per call
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    return (time.perf_counter() - start) * 1e3 / repeat
+
+
+def time_operations(hotels_obj, hotels):
+    """
+    This function reserves and cancels rooms of every Hotel
+
+    Args:
+        hotels_obj (Hotels): The Hotels object
+        hotels (int): The number of Hotels
+
+    Returns:
+        float: The microseconds per operation
+    """
+    start = time.perf_counter()
+    for number in range(OPERATIONS // 2):
+        hotel_name = f'Hotel {number % hotels}'
+        room_number = f'{number // hotels % ROOMS_PER_HOTEL:03d}'
+        hotels_obj.reserve_room(hotel_name, room_number)
+        hotels_obj.cancel_reservation(hotel_name, room_number)
+    return (time.perf_counter() - start) * 1e6 / OPERATIONS
+
+
+def main():
+    """
+    Main function, prints the milliseconds per occupancy read and the
+    microseconds per operation for each number of Hotels
+
+    Returns:
+        None
+    """
+    print(f'{"rooms":>9} {"counters (ms)":>14} {"scan (ms)":>10} '
+          f'{"reserve/cancel (us)":>20}')
+    for hotels in HOTEL_COUNTS:
+        hotels_obj = Hotels(sink=None)
+        for number in range(hotels):
+            hotels_obj.create_hotel_bulk(f'Hotel {number}', 'Monterrey',
+                                         room_range=range(ROOMS_PER_HOTEL))
+        counters = timed(hotels_obj.occupancy, READS)
+        scanned = timed(lambda: scan_occupancy(hotels_obj), READS)
+        operation = time_operations(hotels_obj, hotels)
+        print(f'{hotels * ROOMS_PER_HOTEL:>9} {counters:>14.4f} '
+              f'{scanned:>10.2f} {operation:>20.2f}')
+
+
+if __name__ == '__main__':
+    main()
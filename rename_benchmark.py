@@ -0,0 +1,77 @@
+"""
+Rename Benchmark
+
+This program measures the time taken to rename a Hotel and to
+look up its reservations under the new name, as the number of
+reservations of the Hotel grows
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import time
+from datetime import date, timedelta
+
+from customers import Customers
+from hotels import Hotels
+from reservations import Reservations
+
+RESERVATION_COUNTS = (1000, 10000, 100000)
+RENAMES = 1000
+
+
+def build_reservations(count):
+    """
+    This function creates a Hotel of 1000 rooms with one night booked
+    per reservation, all of them made by the same customer
+
+    Args:
+        count (int): The number of reservations
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    reservations_obj = Reservations(Hotels(sink=None), Customers(sink=None),
+                                    sink=None)
+    reservations_obj.hotels_instance.create_hotel_bulk(
+        'Hotel 0', 'Monterrey', room_range=range(1000))
+    reservations_obj.customers_instance.create_customer(
+        '0001', 'Ana Perez', 'aperez@gmail.com', '8112345678')
+    first_night = date(2024, 1, 1)
+    for number in range(count):
+        check_in = first_night + timedelta(days=number // 1000)
+        reservations_obj.create_customer_reservation(
+            f'{number:06d}', '0001', 'Hotel 0', f'{number % 1000:03d}',
+            check_in, check_in + timedelta(days=1))
+    return reservations_obj
+
+
+def main():
+    """
+    Main function, prints the time per rename and per lookup for each
+    number of reservations
+
+    Returns:
+        None
+    """
+    print(f'{"reservations":>12} {"rename (us)":>12} '
+          f'{"lookup after rename (ms)":>25} {"found":>7}')
+    for count in RESERVATION_COUNTS:
+        reservations_obj = build_reservations(count)
+        hotels_obj = reservations_obj.hotels_instance
+
+        start = time.perf_counter()
+        for number in range(RENAMES):
+            hotels_obj.modify_hotel_name(f'Hotel {number}',
+                                         f'Hotel {number + 1}')
+        renamed = (time.perf_counter() - start) / RENAMES
+
+        start = time.perf_counter()
+        found = reservations_obj.find_hotel_reservations(
+            f'Hotel {RENAMES}')
+        looked_up = time.perf_counter() - start
+        print(f'{count:>12} {renamed * 1e6:>12.1f} '
+              f'{looked_up * 1e3:>25.2f} {len(found):>7}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+"""
+Render
+
+This program handles the rendering of the information of the
+Hotels and the Customers as plain text or JSON lines, which are
+produced one at a time and can be written to any text stream in
+chunks, with paging over the rooms of a Hotel
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import json
+from itertools import islice
+from json.encoder import encode_basestring_ascii
+
+OUTPUT_FORMATS = ('text', 'json')
+# Number of lines joined into each write to a stream
+CHUNK_LINES = 4096
+
+
+def _check_output(output):
+    """
+    This function checks the output format
+
+    Args:
+        output (str): The output format, 'text' or 'json'
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the format is not valid
+    """
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f'Invalid output format: {output}')
+
+
+def detail_items(rooms):
+    """
+    This function reads the rooms of a Hotel as (field, value) pairs.
+    The compact and mapped rooms read them from their bytes, without
+    a dictionary per room
+
+    Args:
+        rooms (dict): The room details by room number
+
+    Returns:
+        iterator: (room_number, details) tuples, the details are the
+        (field, value) pairs of the room
+    """
+    if hasattr(rooms, 'detail_items'):
+        return rooms.detail_items()
+    return ((room_number, tuple(room_details.items()))
+            for room_number, room_details in rooms.items())
+
+
+def page_rooms(rooms, offset=0, limit=None):
+    """
+    This function selects a page of the rooms of a Hotel
+
+    Args:
+        rooms (dict): The room details by room number
+        offset (int): The number of rooms skipped (if applicable)
+        limit (int): The largest number of rooms, None for all the
+        rooms after the offset (if applicable)
+
+    Returns:
+        iterator: The (room number, (field, value) pairs) of the page
+
+    Raises:
+        ValueError: If the offset or the limit are negative
+    """
+    if offset < 0:
+        raise ValueError(f'Invalid offset: {offset}')
+    if limit is not None and limit < 0:
+        raise ValueError(f'Invalid limit: {limit}')
+    stop = None if limit is None else offset + limit
+    return islice(detail_items(rooms), offset, stop)
+
+
+def hotel_lines(hotel_name, location, rooms, output='text', offset=0,
+                limit=None):
+    """
+    This function renders the information of a Hotel and a page of its
+    rooms. The JSON lines join into a single document
+
+    Args:
+        hotel_name (str): The name of the Hotel
+        location (str): The location of the Hotel
+        rooms (dict): The room details by room number
+        output (str): The output format, 'text' or 'json'
+        (if applicable)
+        offset (int): The number of rooms skipped (if applicable)
+        limit (int): The largest number of rooms (if applicable)
+
+    Returns:
+        generator: The lines, without line breaks
+
+    Raises:
+        ValueError: If the format, the offset or the limit are not valid
+    """
+    _check_output(output)
+    page = page_rooms(rooms, offset, limit)
+    if output == 'json':
+        return _hotel_json(hotel_name, location, len(rooms), offset, page)
+    return _hotel_text(hotel_name, location, page)
+
+
+def _hotel_text(hotel_name, location, page):
+    """
+    This function renders a Hotel as plain text
+
+    Args:
+        hotel_name (str): The name of the Hotel
+        location (str): The location of the Hotel
+        page (iterator): The (room number, (field, value) pairs)
+        rendered
+
+    Returns:
+        generator: The lines, without line breaks
+    """
+    yield f'{hotel_name} Information:'
+    yield f'Location: {location}'
+    yield 'Rooms:'
+    # The rooms share a few details, each is rendered once
+    rendered = {}
+    for room_number, details in page:
+        yield f'    Room No.: {room_number}'
+        lines = rendered.get(details)
+        if lines is None:
+            lines = rendered[details] = [
+                f'      {key.capitalize()}: {value}'
+                for key, value in details]
+        yield from lines
+
+def _hotel_json(hotel_name, location, total_rooms, offset, page):
+    """
+    This function renders a Hotel as a JSON document with one room
+    per line
+
+    Args:
+        hotel_name (str): The name of the Hotel
+        location (str): The location of the Hotel
+        total_rooms (int): The number of rooms of the Hotel
+        offset (int): The number of rooms skipped
+        page (iterator): The (room number, (field, value) pairs)
+        rendered
+
+    Returns:
+        generator: The lines, without line breaks
+    """
+    header = json.dumps({'hotel_name': hotel_name, 'location': location,
+                         'total_rooms': total_rooms, 'offset': offset})
+    yield header[:-1] + ', "rooms": ['
+    previous = None
+    rendered = {}
+    for room_number, details in page:
+        if previous is not None:
+            yield previous + ','
+        fields = rendered.get(details)
+        if fields is None:
+            fields = rendered[details] = ''.join(
+                f', {encode_basestring_ascii(key)}: '
+                f'{encode_basestring_ascii(str(value))}'
+                for key, value in details)
+        previous = (f'  {{"room_number": '
+                    f'{encode_basestring_ascii(room_number)}{fields}}}')
+    if previous is not None:
+        yield previous
+    yield ']}'
+
+
+def customer_lines(customer_id, customer, output='text'):
+    """
+    This function renders the information of a Customer
+
+    Args:
+        customer_id (str): The ID of the Customer
+        customer (dict): The name, e-mail and phone of the Customer
+        output (str): The output format, 'text' or 'json'
+        (if applicable)
+
+    Returns:
+        list: The lines, without line breaks
+
+    Raises:
+        ValueError: If the format is not valid
+    """
+    _check_output(output)
+    if output == 'json':
+        return [json.dumps({'customer_id': customer_id,
+                            'name': customer['name'],
+                            'email': customer['email'],
+                            'phone': customer['phone']})]
+    return ['Customer Information:',
+            f'Customer ID: {customer_id}',
+            f'Name: {customer["name"]}',
+            f'E-mail: {customer["email"]}',
+            f'Phone: {customer["phone"]}']
+
+
+def write_lines(lines, stream, chunk_lines=CHUNK_LINES):
+    """
+    This function writes lines to a text stream, joining them into
+    chunks so a large Hotel takes few writes
+
+    Args:
+        lines (iterable): The lines, without line breaks
+        stream (file): The text stream to write to
+        chunk_lines (int): The number of lines of each write
+        (if applicable)
+
+    Returns:
+        int: The number of lines written
+    """
+    written = 0
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_lines))
+        if not chunk:
+            return written
+        stream.write('\n'.join(chunk) + '\n')
+        written += len(chunk)
@@ -0,0 +1,76 @@
+"""
+Render Benchmark
+
+This program measures the time taken to write the information of
+10 Hotels of 1000 rooms (10000 rooms) to a text stream, as plain
+text and as JSON, for each room storage
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import io
+import time
+
+from hotels import Hotels
+
+HOTELS = 10
+REPEAT = 20
+
+
+def build_hotels(compact):
+    """
+    This function creates the Hotels, with single and double rooms in
+    turn
+
+    Args:
+        compact (bool): True to keep the rooms in byte columns
+
+    Returns:
+        Hotels: The Hotels object
+    """
+    hotels_obj = Hotels(compact=compact, sink=None)
+    for number in range(HOTELS):
+        hotels_obj.create_hotel_bulk(f'Hotel {number}', 'Cancun',
+                                     room_range=range(1000),
+                                     room_types=('single', 'double'))
+    return hotels_obj
+
+
+def time_dump(hotels_obj, output):
+    """
+    This function measures the milliseconds taken to write all the
+    Hotels to a text stream
+
+    Args:
+        hotels_obj (Hotels): The Hotels object
+        output (str): The output format, 'text' or 'json'
+
+    Returns:
+        float: The milliseconds per dump of the 10000 rooms
+    """
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        stream = io.StringIO()
+        for number in range(HOTELS):
+            hotels_obj.display_hotel_information(f'Hotel {number}', output,
+                                                 stream=stream)
+    return (time.perf_counter() - start) * 1e3 / REPEAT
+
+
+def main():
+    """
+    Main function, prints the milliseconds per dump of each storage
+    and output format
+
+    Returns:
+        None
+    """
+    print(f'{"storage":<12} {"text (ms)":>10} {"json (ms)":>10}')
+    for storage, compact in (('dict', False), ('compact', True)):
+        hotels_obj = build_hotels(compact)
+        print(f'{storage:<12} {time_dump(hotels_obj, "text"):>10.2f} '
+              f'{time_dump(hotels_obj, "json"):>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
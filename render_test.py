@@ -0,0 +1,129 @@
+"""
+Render Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- hotel_lines()
+- customer_lines()
+- write_lines()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import io
+import json
+import unittest
+from render import customer_lines, hotel_lines, write_lines
+from room_storage import CompactRooms
+
+
+class RenderTest(unittest.TestCase):
+    """
+    Class to handle the Render Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.rooms = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'reserved', 'type': 'double'},
+            '103': {'status': 'available', 'type': 'single'}
+        }
+        self.customer = {'name': 'Ana Perez', 'email': 'aperez@gmail.com',
+                         'phone': '8112345678'}
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_hotel_lines_happy_path(self):
+        lines = list(hotel_lines('Hotel Uno', 'Cancun', self.rooms,
+                                 offset=1, limit=1))
+        self.assertEqual(lines, ['Hotel Uno Information:',
+                                 'Location: Cancun', 'Rooms:',
+                                 '    Room No.: 102',
+                                 '      Status: reserved',
+                                 '      Type: double'])
+        # Verifies the compact rooms render the same lines from their
+        # columns
+        compact = CompactRooms()
+        compact.update(self.rooms)
+        self.assertEqual(list(hotel_lines('Hotel Uno', 'Cancun', compact,
+                                          offset=1, limit=1)), lines)
+
+    def test_hotel_json_happy_path(self):
+        lines = list(hotel_lines('Hotel Uno', 'Cancun', self.rooms, 'json',
+                                 offset=1))
+        document = json.loads('\n'.join(lines))
+        self.assertEqual((document['total_rooms'], document['offset']),
+                         (3, 1))
+        self.assertEqual(document['rooms'],
+                         [{'room_number': '102', 'status': 'reserved',
+                           'type': 'double'},
+                          {'room_number': '103', 'status': 'available',
+                           'type': 'single'}])
+        # Verifies the compact rooms render the same document
+        compact = CompactRooms()
+        compact.update(self.rooms)
+        self.assertEqual(list(hotel_lines('Hotel Uno', 'Cancun', compact,
+                                          'json', offset=1)), lines)
+
+    def test_customer_lines_happy_path(self):
+        self.assertEqual(customer_lines('0001', self.customer)[1:3],
+                         ['Customer ID: 0001', 'Name: Ana Perez'])
+        document = json.loads(customer_lines('0001', self.customer,
+                                             'json')[0])
+        self.assertEqual(document['email'], 'aperez@gmail.com')
+
+    def test_write_lines_happy_path(self):
+        stream = io.StringIO()
+        written = write_lines(hotel_lines('Hotel Uno', 'Cancun',
+                                          self.rooms), stream,
+                              chunk_lines=4)
+        self.assertEqual(written, 12)
+        self.assertEqual(stream.getvalue().count('\n'), 12)
+        self.assertTrue(stream.getvalue().startswith(
+            'Hotel Uno Information:\nLocation: Cancun\n'))
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_hotel_lines_neg_path_1(self):
+        # Path 1: Output format, offset or limit that is not valid
+        with self.assertRaises(ValueError):
+            hotel_lines('Hotel Uno', 'Cancun', self.rooms, 'xml')
+        with self.assertRaises(ValueError):
+            hotel_lines('Hotel Uno', 'Cancun', self.rooms, offset=-1)
+        with self.assertRaises(ValueError):
+            hotel_lines('Hotel Uno', 'Cancun', self.rooms, limit=-1)
+
+    def test_hotel_json_neg_path_1(self):
+        # Path 1: Page after the last room
+        lines = list(hotel_lines('Hotel Uno', 'Cancun', self.rooms, 'json',
+                                 offset=5))
+        self.assertEqual(json.loads('\n'.join(lines))['rooms'], [])
+
+    def test_write_lines_neg_path_1(self):
+        # Path 1: No lines
+        stream = io.StringIO()
+        self.assertEqual(write_lines([], stream), 0)
+        self.assertEqual(stream.getvalue(), '')
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(RenderTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('RenderTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
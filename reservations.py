@@ -9,27 +9,229 @@ Author:
 """
 from hotels import Hotels
 from customers import Customers
+from events import CONSOLE_SINK, EventEmitter
+from locking import make_striped_lock
+from room_calendar import stay_dates_error
 
 
-class Reservations:
+class ReservationStore:
+    """
+    Class to store the reservations keyed by their reservation ID.
+    In concurrent mode each customer, Hotel and room bucket of the
+    indexes is changed under the lock of its stripe, so threads that
+    work on different Hotels and customers do not wait for each other
+    """
+    def __init__(self, concurrent=False):
+        """
+        Initializes the ReservationStore object
+
+        Args:
+            concurrent (bool): True if the store is shared by threads
+
+        Returns:
+            None
+        """
+        self._by_id = {}
+        self._by_customer = {}
+        self._by_hotel = {}
+        self._by_room = {}
+        self._concurrent = concurrent
+        self._locks = make_striped_lock(concurrent)
+
+    def __len__(self):
+        """
+        This method returns the number of stored reservations
+
+        Returns:
+            int: The number of reservations
+        """
+        return len(self._by_id)
+
+    def __iter__(self):
+        """
+        This method iterates over the stored reservations
+
+        Returns:
+            iterator: The reservation dictionaries in creation order
+        """
+        if self._concurrent:
+            # Iterates over a copy, other threads may change the store
+            return iter(list(self._by_id.values()))
+        return iter(self._by_id.values())
+
+    def __contains__(self, reservation_id):
+        """
+        This method checks whether a reservation ID is stored
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            bool: True if the reservation exists, False otherwise
+        """
+        return reservation_id in self._by_id
+
+    def get(self, reservation_id):
+        """
+        This method looks up a reservation by its ID
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            dict: The reservation data, None if it does not exist
+        """
+        return self._by_id.get(reservation_id)
+
+    def add(self, reservation):
+        """
+        This method stores a reservation under its ID, unless the ID
+        is already used
+
+        Args:
+            reservation (dict): The reservation data, it must contain
+            the 'reservation_id' key
+
+        Returns:
+            bool: True if the reservation was stored, False otherwise
+        """
+        reservation_id = reservation['reservation_id']
+        # Claims the ID in one step, so only one thread can store it
+        if self._by_id.setdefault(reservation_id,
+                                  reservation) is not reservation:
+            return False
+
+        for index, key in self._index_keys(reservation):
+            with self._locks.lock_for(key):
+                index.setdefault(key, {})[reservation_id] = reservation
+        return True
+
+    def remove(self, reservation_id):
+        """
+        This method removes a reservation by its ID
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            dict: The removed reservation data, None if it does not
+            exist
+        """
+        reservation = self._by_id.pop(reservation_id, None)
+        if reservation is None:
+            return None
+
+        for index, key in self._index_keys(reservation):
+            with self._locks.lock_for(key):
+                bucket = index.get(key, {})
+                bucket.pop(reservation_id, None)
+                if not bucket:
+                    index.pop(key, None)
+        return reservation
+
+    def _index_keys(self, reservation):
+        """
+        This method lists the secondary indexes of a reservation
+        together with the key it is stored under in each of them
+
+        Args:
+            reservation (dict): The reservation data
+
+        Returns:
+            tuple: Pairs of (index, key)
+        """
+        return ((self._by_customer, reservation['customer_id']),
+                (self._by_hotel, reservation['hotel_id']),
+                (self._by_room, (reservation['hotel_id'],
+                                 reservation['room_number'])))
+
+    def for_customer(self, customer_id):
+        """
+        This method lists the reservations held by a customer
+
+        Args:
+            customer_id (str): The ID of the customer
+
+        Returns:
+            list: The reservation dictionaries of the customer
+        """
+        return list(self._by_customer.get(customer_id, {}).values())
+
+    def for_hotel(self, hotel_id):
+        """
+        This method lists the reservations made in a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            list: The reservation dictionaries of the Hotel
+        """
+        return list(self._by_hotel.get(hotel_id, {}).values())
+
+    def for_room(self, hotel_id, room_number):
+        """
+        This method lists the reservations made for a room of a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            room_number (str): The number of the room
+
+        Returns:
+            list: The reservation dictionaries of the room
+        """
+        return list(self._by_room.get((hotel_id, room_number),
+                                      {}).values())
+
+
+class Reservations(EventEmitter):
     """
     Class to handle the reservations operations
     """
-    def __init__(self, hotels: Hotels, customers: Customers):
+    def __init__(self, hotels: Hotels, customers: Customers,
+                 sink=CONSOLE_SINK, concurrent=False, storage=None):
         """
         Initialize the Reservations object
 
+        Args:
+            hotels (Hotels): The Hotels object
+            customers (Customers): The Customers object
+            sink (object): The sink the results are sent to, None to
+            discard them
+            concurrent (bool): True if the object is shared by threads
+            storage (SqliteStorage): The database the reservations are
+            kept in, the bookings of the reservations already stored in
+            it are added to the calendars of the rooms (if applicable)
+
         Returns:
             None
         """
         self.hotels_instance = hotels
         self.customers_instance = customers
-        self.reservations = []
+        if storage is None:
+            self.reservations = ReservationStore(concurrent)
+        else:
+            self.reservations = storage.reservations
+        self.sink = sink
+        self.concurrent = concurrent
+        for reservation in self.reservations:
+            hotels.hotel_ids.retire(reservation['hotel_id'])
+            # The bookings of deleted Hotels are not given to a new
+            # Hotel with the same name
+            if reservation['check_in'] is not None and \
+                    not self.hotel_deleted(reservation):
+                hotels.try_book_room(self.current_hotel_name(reservation),
+                                     reservation['room_number'],
+                                     reservation['check_in'],
+                                     reservation['check_out'])
 
     def create_customer_reservation(self, reservation_id, customer_id,
-                                    hotel_name, room_number):
+                                    hotel_name, room_number,
+                                    check_in=None, check_out=None):
         """
-        This method handles the reservation of a room from a Hotel
+        This method handles the reservation of a room from a Hotel.
+        When no dates are given the room status is reserved, otherwise
+        the room is booked for the given date range
 
         Args:
             reservation_id (str): The ID of the reservation
@@ -37,56 +239,155 @@ class Reservations:
             hotel_name (str): The name of the Hotel in which the
             reservation has been created
             room_number (str): The number of the reserved room
+            check_in (str or date): The first night of the stay as
+            'YYYY-MM-DD' (if applicable)
+            check_out (str or date): The day the stay ends as
+            'YYYY-MM-DD' (if applicable)
 
         Returns:
-            None
+            Result: The outcome of the reservation, its data is the
+            stored reservation
         """
-        if not self.validate_reservation_number(reservation_id):
-            return
+        error = (self.reservation_number_error(reservation_id)
+                 or self.new_reservation_error(reservation_id)
+                 or self.created_customer_id_error(customer_id)
+                 or self.hotels_instance.existing_hotel_error(hotel_name))
+        if error is not None:
+            return self._fail(error)
 
-        for reservation in self.reservations:
-            if reservation['reservation_id'] == reservation_id:
-                print('\nError: Reservation already created')
-                return
+        if (room_number not in self.
+                hotels_instance.hotels[hotel_name]['rooms']):
+            return self._fail('Room %s does not exist', room_number)
 
-        if not self.validate_created_customer_id(customer_id):
-            return
+        hotel_id = self.hotels_instance.hotel_ids.get(hotel_name)
+        if check_in is None and check_out is None:
+            return self._reserve_room_status(reservation_id, customer_id,
+                                             hotel_id, hotel_name,
+                                             room_number)
 
-        if hotel_name.strip() == '':
-            print('\nError: Hotel name cannot be empty')
-            return
+        error, check_in, check_out = \
+            self.stay_dates_error(check_in, check_out)
+        if error is not None:
+            return self._fail(error)
 
-        if hotel_name not in self.hotels_instance.hotels:
-            print(f'\nError: {hotel_name} does not exist')
-            return
+        result = self.hotels_instance.book_room(hotel_name, room_number,
+                                                check_in, check_out)
+        if not result:
+            return result
 
-        if (room_number not in self.
-                hotels_instance.hotels[hotel_name]['rooms']):
-            print(f'\nError: Room {room_number} does not exist')
-            return
-
-        if (self.hotels_instance.hotels[hotel_name]['rooms']
-                [room_number]['status'] == 'available'):
-            # Reserve the room
-            self.hotels_instance.reserve_room(hotel_name, room_number)
-            # Store the reservation data
-            reservation_data = {
-                'reservation_id': reservation_id,
-                'customer_id': customer_id,
-                'hotel_name': hotel_name,
-                'room_number': room_number
-            }
-            self.reservations.append(reservation_data)
-            # Print the customer information
+        return self._store_reservation(reservation_id, customer_id,
+                                       hotel_id, hotel_name, room_number,
+                                       check_in, check_out)
+
+    def _reserve_room_status(self, reservation_id, customer_id,
+                             hotel_id, hotel_name, room_number):
+        """
+        This method reserves a room without dates by changing its
+        status, as reservations were handled before date ranges
+
+        Args:
+            reservation_id (str): The ID of the reservation
+            customer_id (str): The ID of the customer
+            hotel_id (int): The ID of the Hotel
+            hotel_name (str): The name of the Hotel
+            room_number (str): The number of the reserved room
+
+        Returns:
+            Result: The outcome of the reservation
+        """
+        # Reserve the room, the status is checked and changed in one
+        # step so only one caller can win the room
+        if not self.hotels_instance.try_reserve_room(hotel_name,
+                                                     room_number):
+            return self._fail('Room %s not available', room_number)
+
+        return self._store_reservation(reservation_id, customer_id,
+                                       hotel_id, hotel_name, room_number)
+
+    def _store_reservation(self, reservation_id, customer_id, hotel_id,
+                           hotel_name, room_number, check_in=None,
+                           check_out=None):
+        """
+        This method stores the data of a reservation already made
+
+        Args:
+            reservation_id (str): The ID of the reservation
+            customer_id (str): The ID of the customer
+            hotel_id (int): The ID of the Hotel
+            hotel_name (str): The name of the Hotel
+            room_number (str): The number of the reserved room
+            check_in (date): The first night of the stay (if applicable)
+            check_out (date): The day the stay ends (if applicable)
+
+        Returns:
+            Result: The outcome of the reservation, its data is the
+            stored reservation
+        """
+        # Store the reservation data
+        reservation_data = {
+            'reservation_id': reservation_id,
+            'customer_id': customer_id,
+            'hotel_id': hotel_id,
+            'hotel_name': hotel_name,
+            'room_number': room_number,
+            'check_in': check_in,
+            'check_out': check_out
+        }
+        if not self.reservations.add(reservation_data):
+            # Another thread stored the same ID first, the room is
+            # given back
+            if check_in is None:
+                self.hotels_instance.try_cancel_room(hotel_name,
+                                                     room_number)
+            else:
+                self.hotels_instance.try_release_room(
+                    hotel_name, room_number, check_in, check_out)
+            return self._fail('Reservation already created')
+
+        # Show the customer information, which is only rendered when
+        # there is a sink to send it to
+        if self.customers_instance.sink is not None:
             self.customers_instance.\
                 display_customer_information(customer_id)
-            print(f'\nReservation successfully created. '
-                  f'ID: {reservation_id}')
-        else:
-            print(f'\nError: Room {room_number} not available')
+        return self._succeed('Reservation successfully created. ID: %s',
+                             reservation_id, data=reservation_data)
+
+    def validate_stay_dates(self, check_in, check_out):
+        """
+        This method validates the check-in and check-out dates of a
+        reservation
+
+        Args:
+            check_in (str or date): The first night of the stay
+            check_out (str or date): The day the stay ends
+
+        Returns:
+            bool: True if the dates are valid, False otherwise
+            check_in: The check-in date
+            check_out: The check-out date
+        """
+        error, check_in, check_out = self.stay_dates_error(check_in,
+                                                           check_out)
+        return self._report(error), check_in, check_out
 
     @staticmethod
-    def validate_reservation_number(reservation_id):
+    def stay_dates_error(check_in, check_out):
+        """
+        This method checks the check-in and check-out dates of a
+        reservation without printing
+
+        Args:
+            check_in (str or date): The first night of the stay
+            check_out (str or date): The day the stay ends
+
+        Returns:
+            str: The error found, None if the dates are valid
+            check_in: The check-in date (None if invalid)
+            check_out: The check-out date (None if invalid)
+        """
+        return stay_dates_error(check_in, check_out)
+
+    def validate_reservation_number(self, reservation_id):
         """
         This method validates that the reservation number is valid
 
@@ -94,19 +395,45 @@ class Reservations:
             reservation_id (str): The ID of the reservation
 
         Returns:
-            None
+            bool: True if the reservation ID is valid, False otherwise
+        """
+        return self._report(self.reservation_number_error(reservation_id))
+
+    @staticmethod
+    def reservation_number_error(reservation_id):
+        """
+        This method checks the reservation number without printing
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            str: The error found, None if the reservation ID is valid
         """
         if reservation_id.strip() == '':
-            print('\nError: Reservation ID cannot be empty')
-            return False
+            return 'Reservation ID cannot be empty'
 
         if (not isinstance(reservation_id, str)
                 or len(reservation_id) != 6
                 or not reservation_id.isdigit()):
-            print('\nError: Invalid reservation ID')
-            return False
+            return 'Invalid reservation ID'
 
-        return True
+        return None
+
+    def new_reservation_error(self, reservation_id):
+        """
+        This method checks that the reservation ID is not used yet
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            str: The error found, None if the reservation ID is free
+        """
+        if reservation_id in self.reservations:
+            return 'Reservation already created'
+
+        return None
 
     def validate_created_customer_id(self, customer_id):
         """
@@ -118,21 +445,31 @@ class Reservations:
         Returns:
             bool: True if the ID entered is valid, False otherwise
         """
+        return self._report(self.created_customer_id_error(customer_id))
+
+    def created_customer_id_error(self, customer_id):
+        """
+        This function checks that the customer ID entered exists
+        without printing
+
+        Args:
+            customer_id (str): The customer ID to be checked
+
+        Returns:
+            str: The error found, None if the ID entered is valid
+        """
         if customer_id.strip() == '':
-            print('\nError: Customer ID cannot be empty')
-            return False
+            return 'Customer ID cannot be empty'
 
         if (customer_id not in self.customers_instance.
                 customers.keys()):
-            print(f'\nError: ID {customer_id} does not exist')
-            return False
+            return f'ID {customer_id} does not exist'
 
         if (not isinstance(customer_id, str) or len(customer_id) != 4
                 or not customer_id.isdigit()):
-            print('\nError: Invalid Customer ID entered')
-            return False
+            return 'Invalid Customer ID entered'
 
-        return True
+        return None
 
     def cancel_customer_reservation(self, reservation_id):
         """
@@ -142,25 +479,133 @@ class Reservations:
             reservation_id (str): The ID of the reservation
 
         Returns:
-            None
+            Result: The outcome of the cancellation, its data is the
+            removed reservation
         """
-        if not self.validate_reservation_number(reservation_id):
-            return
+        error = self.reservation_number_error(reservation_id)
+        if error is not None:
+            return self._fail(error)
 
-        for reservation in self.reservations:
-            if reservation_id not in reservation['reservation_id']:
-                print('\nError: Reservation does not exist')
-                return
-
-            if reservation['reservation_id'] == reservation_id:
-                hotel_name = reservation['hotel_name']
-                room_number = reservation['room_number']
-
-                if (self.hotels_instance.hotels[hotel_name]['rooms']
-                        [room_number]['status'] == 'reserved'):
-                    self.hotels_instance.\
-                     cancel_reservation(hotel_name, room_number)
-                    print(f'\nReservation successfully removed. '
-                          f'ID: {reservation_id}')
-                    self.reservations.remove(reservation)
-                    return
+        # The reservation is taken out first, so when several threads
+        # cancel it only one of them gives the room back
+        reservation = self.reservations.remove(reservation_id)
+        if reservation is None:
+            return self._fail('Reservation does not exist')
+
+        if self.hotel_deleted(reservation):
+            # The room went away with its Hotel, a new Hotel with the
+            # same name does not own it
+            return self._succeed('Reservation successfully removed. '
+                                 'ID: %s', reservation_id, data=reservation)
+
+        hotel_name = self.current_hotel_name(reservation)
+        room_number = reservation['room_number']
+
+        if reservation['check_in'] is not None:
+            result = self.hotels_instance.release_room(
+                hotel_name, room_number, reservation['check_in'],
+                reservation['check_out'])
+        else:
+            result = self.hotels_instance.cancel_reservation(hotel_name,
+                                                             room_number)
+        if not result:
+            self.reservations.add(reservation)
+            return result
+
+        return self._succeed('Reservation successfully removed. ID: %s',
+                             reservation_id, data=reservation)
+
+    def find_customer_reservations(self, customer_id):
+        """
+        This method finds the reservations held by a customer
+
+        Args:
+            customer_id (str): The ID of the customer
+
+        Returns:
+            list: The reservation dictionaries of the customer
+        """
+        return self._with_hotel_names(
+            self.reservations.for_customer(customer_id))
+
+    def find_hotel_reservations(self, hotel_name):
+        """
+        This method finds the reservations made in a Hotel
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            list: The reservation dictionaries of the Hotel
+        """
+        hotel_id = self.hotels_instance.hotel_ids.get(hotel_name)
+        if hotel_id is None:
+            return []
+        return self._with_hotel_names(self.reservations.for_hotel(hotel_id))
+
+    def find_room_reservations(self, hotel_name, room_number):
+        """
+        This method finds the reservations made for a room of a Hotel
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            room_number (str): The number of the room
+
+        Returns:
+            list: The reservation dictionaries of the room
+        """
+        hotel_id = self.hotels_instance.hotel_ids.get(hotel_name)
+        if hotel_id is None:
+            return []
+        return self._with_hotel_names(
+            self.reservations.for_room(hotel_id, room_number))
+
+    def current_hotel_name(self, reservation):
+        """
+        This method finds the current name of the Hotel of a
+        reservation by its ID. A reservation keeps the name the Hotel
+        had when it was made, which is updated here if the Hotel was
+        renamed since
+
+        Args:
+            reservation (dict): The reservation data
+
+        Returns:
+            str: The name of the Hotel
+        """
+        hotel_name = self.hotels_instance.hotel_ids.name(
+            reservation['hotel_id'])
+        if hotel_name is None:
+            # The Hotel was deleted, the last name known is kept
+            return reservation['hotel_name']
+        if reservation['hotel_name'] != hotel_name:
+            reservation['hotel_name'] = hotel_name
+        return hotel_name
+
+    def hotel_deleted(self, reservation):
+        """
+        This method checks whether the Hotel of a reservation was
+        deleted, even if another Hotel has taken its name since
+
+        Args:
+            reservation (dict): The reservation data
+
+        Returns:
+            bool: True if the Hotel was deleted, False otherwise
+        """
+        return self.hotels_instance.hotel_ids.name(
+            reservation['hotel_id']) is None
+
+    def _with_hotel_names(self, reservations):
+        """
+        This method updates the Hotel names of the reservations found
+
+        Args:
+            reservations (list): The reservation dictionaries
+
+        Returns:
+            list: The same reservations
+        """
+        for reservation in reservations:
+            self.current_hotel_name(reservation)
+        return reservations
@@ -0,0 +1,215 @@
+"""
+Reservations Async
+
+This program handles an asyncio interface to the reservations
+(creation, cancellation, lookups and search), so they can be used
+from an event loop
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import asyncio
+import functools
+
+
+class AsyncReservations:
+    """
+    Class to run the operations of a Reservations object from
+    coroutines. Writes to a Hotel wait for the async lock of that
+    Hotel, so they run one at a time per Hotel, while reads never
+    wait. Operations run in an executor, so the objects must be in
+    concurrent mode, unless they are run inline on the event loop.
+    The locks are kept by Hotel ID, so they still hold when a Hotel
+    is renamed
+    """
+    def __init__(self, reservations, executor=None, inline=False):
+        """
+        Initializes the AsyncReservations object
+
+        Args:
+            reservations (Reservations): The Reservations object, its
+            results should go to no sink or a buffered one, so the
+            event loop is not blocked by printing
+            executor (Executor): The executor the operations run in,
+            None for the default executor of the event loop
+            (if applicable)
+            inline (bool): True to run the operations on the event
+            loop, which blocks it while they run. Meant for tests and
+            benchmarks of objects that are not in concurrent mode
+            (if applicable)
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the operations run in an executor and the
+            objects are not in concurrent mode
+        """
+        if not inline and not all(
+                instance.concurrent for instance in
+                (reservations, reservations.hotels_instance,
+                 reservations.customers_instance)):
+            raise ValueError('The objects must be in concurrent mode to '
+                             'run in an executor')
+        self.reservations_instance = reservations
+        self.hotels_instance = reservations.hotels_instance
+        self.executor = executor
+        self.inline = inline
+        self._hotel_locks = {}
+
+    def _hotel_lock(self, hotel_id):
+        """
+        This method returns the async lock of a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel, None for the Hotels
+            that do not exist
+
+        Returns:
+            Lock: The lock of the Hotel
+        """
+        lock = self._hotel_locks.get(hotel_id)
+        if lock is None:
+            lock = self._hotel_locks[hotel_id] = asyncio.Lock()
+        return lock
+
+    async def _run(self, method, *args):
+        """
+        This method runs a synchronous method in the executor, or on
+        the event loop when run inline
+
+        Args:
+            method (function): The method to be run
+            args (tuple): The arguments of the method
+
+        Returns:
+            object: The value returned by the method
+        """
+        if self.inline:
+            return method(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor,
+                                          functools.partial(method, *args))
+
+    async def create(self, reservation_id, customer_id, hotel_name,
+                     room_number, check_in=None, check_out=None):
+        """
+        This method creates a reservation once no other write to the
+        same Hotel is running
+
+        Args:
+            reservation_id (str): The ID of the reservation
+            customer_id (str): The ID of the customer
+            hotel_name (str): The name of the Hotel
+            room_number (str): The number of the reserved room
+            check_in (str or date): The first night of the stay
+            (if applicable)
+            check_out (str or date): The day the stay ends
+            (if applicable)
+
+        Returns:
+            Result: The outcome of the reservation
+        """
+        async with self._hotel_lock(
+                self.hotels_instance.hotel_ids.get(hotel_name)):
+            return await self._run(
+                self.reservations_instance.create_customer_reservation,
+                reservation_id, customer_id, hotel_name, room_number,
+                check_in, check_out)
+
+    async def cancel(self, reservation_id):
+        """
+        This method cancels a reservation once no other write to its
+        Hotel is running
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            Result: The outcome of the cancellation
+        """
+        reservation = self.reservations_instance.reservations.get(
+            reservation_id)
+        if reservation is None:
+            return await self._run(
+                self.reservations_instance.cancel_customer_reservation,
+                reservation_id)
+
+        async with self._hotel_lock(reservation['hotel_id']):
+            return await self._run(
+                self.reservations_instance.cancel_customer_reservation,
+                reservation_id)
+
+    async def create_many(self, requests, concurrency=100):
+        """
+        This method creates many reservations at once, with at most
+        concurrency of them running at the same time
+
+        Args:
+            requests (list): Tuples with the arguments of create
+            concurrency (int): The maximum number of reservations in
+            progress
+
+        Returns:
+            list: The outcome of each reservation, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create_one(args):
+            async with semaphore:
+                return await self.create(*args)
+
+        return await asyncio.gather(*(create_one(args)
+                                      for args in requests))
+
+    async def find_customer_reservations(self, customer_id):
+        """
+        This method finds the reservations held by a customer
+
+        Args:
+            customer_id (str): The ID of the customer
+
+        Returns:
+            list: The reservations of the customer
+        """
+        return await self._run(
+            self.reservations_instance.find_customer_reservations,
+            customer_id)
+
+    async def find_hotel_reservations(self, hotel_name):
+        """
+        This method finds the reservations made in a Hotel
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            list: The reservations of the Hotel
+        """
+        return await self._run(
+            self.reservations_instance.find_hotel_reservations,
+            hotel_name)
+
+    async def search(self, location=None, room_type=None, check_in=None,
+                     check_out=None, limit=None):
+        """
+        This method searches the available rooms across all the Hotels
+
+        Args:
+            location (str): The location of the Hotels (if applicable)
+            room_type (str): The type of room (if applicable)
+            check_in (str or date): The first night of the stay
+            (if applicable)
+            check_out (str or date): The day the stay ends
+            (if applicable)
+            limit (int): The maximum number of results (if applicable)
+
+        Returns:
+            list: (hotel_name, room_number) tuples of free rooms
+        """
+        def search_rooms():
+            return list(self.hotels_instance.search_availability(
+                location, room_type, check_in, check_out, limit))
+
+        return await self._run(search_rooms)
+
@@ -0,0 +1,187 @@
+"""
+Reservations Async Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- create()
+- cancel()
+- create_many()
+- find_customer_reservations()
+- search()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from hotels import Hotels
+from customers import Customers
+from reservations import Reservations
+from reservations_async import AsyncReservations
+
+
+class ReservationsAsyncTest(unittest.TestCase):
+    """
+    Class to handle the AsyncReservations Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.hotels_obj = Hotels(sink=None, concurrent=True)
+        self.customers_obj = Customers(sink=None, concurrent=True)
+        self.hotels_obj.create_hotel('Hotel California', 'Tijuana',
+                                     {'101': {'status': 'available',
+                                              'type': 'single'},
+                                      '102': {'status': 'available',
+                                              'type': 'double'}})
+        self.customers_obj.create_customer('4444', 'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj = Reservations(self.hotels_obj,
+                                             self.customers_obj,
+                                             sink=None, concurrent=True)
+        self.async_obj = AsyncReservations(self.reservations_obj)
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_create_happy_path(self):
+        result = asyncio.run(self.async_obj.create(
+            '111111', '4444', 'Hotel California', '101'))
+        self.assertTrue(result)
+        reservations = asyncio.run(
+            self.async_obj.find_customer_reservations('4444'))
+        self.assertEqual([reservation['room_number'] for reservation
+                          in reservations], ['101'])
+
+    def test_cancel_happy_path(self):
+        asyncio.run(self.async_obj.create('111111', '4444',
+                                          'Hotel California', '101'))
+        self.assertTrue(asyncio.run(self.async_obj.cancel('111111')))
+        self.assertEqual(len(self.reservations_obj.reservations), 0)
+
+    def test_search_happy_path(self):
+        rooms = asyncio.run(self.async_obj.search(room_type='double'))
+        self.assertEqual(rooms, [('Hotel California', '102')])
+
+    def test_create_many_happy_path(self):
+        requests = [(f'{number:06d}', '4444', 'Hotel California',
+                     room_number)
+                    for number, room_number in enumerate(['101', '102'] * 5)]
+        results = asyncio.run(self.async_obj.create_many(requests,
+                                                         concurrency=3))
+        # Verifies each room was reserved once
+        self.assertEqual(sum(1 for result in results if result), 2)
+        self.assertEqual(len(results), 10)
+
+    def test_create_many_executor(self):
+        requests = [(f'{number:06d}', '4444', 'Hotel California',
+                     room_number)
+                    for number, room_number in enumerate(['101', '102'] * 5)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            async_obj = AsyncReservations(self.reservations_obj, executor)
+            results = asyncio.run(async_obj.create_many(requests))
+        self.assertEqual(sum(1 for result in results if result), 2)
+
+    def test_create_default_executor(self):
+        threads = []
+        self.reservations_obj.sink = SimpleNamespace(
+            emit=lambda result: threads.append(threading.get_ident()))
+        # Verifies the operations run off the event loop unless they are
+        # run inline
+        asyncio.run(self.async_obj.create('111111', '4444',
+                                          'Hotel California', '101'))
+        self.assertNotIn(threading.get_ident(), threads)
+        inline_obj = AsyncReservations(self.reservations_obj, inline=True)
+        asyncio.run(inline_obj.cancel('111111'))
+        self.assertEqual(threads[-1], threading.get_ident())
+
+    def test_cancel_after_rename(self):
+        asyncio.run(self.async_obj.create('111111', '4444',
+                                          'Hotel California', '101'))
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+        create = self.reservations_obj.create_customer_reservation
+        cancel = self.reservations_obj.cancel_customer_reservation
+
+        def slow_create(*args):
+            calls.append('create')
+            started.set()
+            release.wait(5)
+            return create(*args)
+
+        def record_cancel(*args):
+            calls.append('cancel')
+            return cancel(*args)
+
+        self.reservations_obj.create_customer_reservation = slow_create
+        self.reservations_obj.cancel_customer_reservation = record_cancel
+
+        async def rename_while_creating():
+            creating = asyncio.create_task(self.async_obj.create(
+                '222222', '4444', 'Hotel California', '102'))
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait, 5)
+            self.hotels_obj.modify_hotel_name('Hotel California',
+                                              'Hotel Baja')
+            cancelling = asyncio.create_task(self.async_obj.cancel('111111'))
+            await asyncio.sleep(0.05)
+            # Verifies the cancel waits for the write that started under
+            # the old name of the Hotel
+            self.assertEqual(calls, ['create'])
+            release.set()
+            return await asyncio.gather(creating, cancelling)
+
+        results = asyncio.run(rename_while_creating())
+        self.assertEqual(calls, ['create', 'cancel'])
+        self.assertTrue(results[1])
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_create_neg_path_1(self):
+        # Path 1: Hotel that does not exist
+        result = asyncio.run(self.async_obj.create(
+            '111111', '4444', 'Hotel Dos', '101'))
+        self.assertFalse(result)
+        self.assertEqual(result.message, 'Hotel Dos does not exist')
+
+    def test_init_neg_path_1(self):
+        # Path 1: Objects that are not in concurrent mode, which only
+        # run inline
+        reservations_obj = Reservations(Hotels(sink=None),
+                                        Customers(sink=None), sink=None)
+        with self.assertRaises(ValueError):
+            AsyncReservations(reservations_obj)
+        inline_obj = AsyncReservations(reservations_obj, inline=True)
+        self.assertEqual(asyncio.run(inline_obj.search()), [])
+
+    def test_cancel_neg_path_1(self):
+        # Path 1: Reservation that does not exist
+        result = asyncio.run(self.async_obj.cancel('999999'))
+        self.assertFalse(result)
+        self.assertEqual(result.message, 'Reservation does not exist')
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(ReservationsAsyncTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('ReservationsAsyncTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -0,0 +1,105 @@
+"""
+Reservations Benchmark
+
+This program measures the latency of creating and cancelling
+reservations while the reservations store grows from 1k to 1M
+reservations, with the results discarded and with the results
+printed (to the null device)
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import os
+import time
+
+from hotels import Hotels
+from customers import Customers
+from events import ConsoleSink
+from reservations import Reservations
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+OPERATIONS = 1_000
+
+
+def fill_reservations(reservations_obj, size):
+    """
+    This function fills the reservations store with placeholder
+    reservations until it reaches the given size
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+        size (int): The number of reservations to be stored
+
+    Returns:
+        None
+    """
+    for number in range(len(reservations_obj.reservations), size):
+        reservations_obj.reservations.add({
+            'reservation_id': f'{number:07d}',
+            'customer_id': '0000',
+            # No Hotel is given the ID 0, so the filler stays apart
+            # from the Hotel being measured
+            'hotel_id': 0,
+            'hotel_name': 'Filler Hotel',
+            'room_number': '000',
+            'check_in': None,
+            'check_out': None
+        })
+
+
+def measure_create_cancel(reservations_obj):
+    """
+    This function measures the mean latency of creating and
+    cancelling a reservation through the public API
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+
+    Returns:
+        float: The mean latency of a create/cancel pair in microseconds
+    """
+    start = time.perf_counter()
+    for number in range(OPERATIONS):
+        reservation_id = f'{900000 + number:06d}'
+        reservations_obj.create_customer_reservation(reservation_id,
+                                                     '1000',
+                                                     'Hotel Benchmark',
+                                                     '101')
+        reservations_obj.cancel_customer_reservation(reservation_id)
+    elapsed = time.perf_counter() - start
+    return elapsed / OPERATIONS * 1_000_000
+
+
+def main():
+    """
+    Main function, prints the latency for each store size
+
+    Returns:
+        None
+    """
+    hotels_obj = Hotels(sink=None)
+    customers_obj = Customers(sink=None)
+    reservations_obj = Reservations(hotels_obj, customers_obj, sink=None)
+    hotels_obj.create_hotel('Hotel Benchmark', 'Monterrey',
+                            {'101': {'status': 'available',
+                                     'type': 'single'}})
+    customers_obj.create_customer('1000', 'Benchmark Customer',
+                                  'benchmark@gmail.com', '8112345678')
+
+    print(f'{"reservations":>12} {"no sink (us)":>14} '
+          f'{"console (us)":>14}')
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        console_sink = ConsoleSink(devnull)
+        for size in SIZES:
+            fill_reservations(reservations_obj, size)
+            latencies = []
+            for sink in (None, console_sink):
+                hotels_obj.sink = customers_obj.sink = sink
+                reservations_obj.sink = sink
+                latencies.append(measure_create_cancel(reservations_obj))
+            print(f'{size:>12} {latencies[0]:>14.2f} '
+                  f'{latencies[1]:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""
+Reservations Stress Benchmark
+
+This program runs many threads that try to reserve the same
+rooms at the same time, reports the throughput and checks that
+no room was reserved twice
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import random
+import sys
+import threading
+import time
+from datetime import date
+
+from hotels import Hotels
+from customers import Customers
+from reservations import Reservations
+
+THREADS = 8
+ROOMS = 100
+ATTEMPTS = 5_000
+HOTEL_NAME = 'Hotel Stress'
+CHECK_IN = date(2024, 3, 10)
+CHECK_OUT = date(2024, 3, 15)
+
+
+def build_reservations():
+    """
+    This function builds a Hotel with ROOMS available rooms and one
+    customer in concurrent mode, without a sink for the results
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    hotels_obj = Hotels(sink=None, concurrent=True)
+    customers_obj = Customers(sink=None, concurrent=True)
+    hotels_obj.create_hotel(HOTEL_NAME, 'Monterrey',
+                            {f'{number:03d}': {'status': 'available',
+                                               'type': 'single'}
+                             for number in range(1, ROOMS + 1)})
+    customers_obj.create_customer('1000', 'Stress Customer',
+                                  'stress@gmail.com', '8112345678')
+    return Reservations(hotels_obj, customers_obj, sink=None,
+                        concurrent=True)
+
+
+def run_threads(worker):
+    """
+    This function runs the worker in THREADS threads and waits for
+    all of them
+
+    Args:
+        worker (function): The function run by each thread, it gets
+        the number of the thread
+
+    Returns:
+        float: Seconds taken by the threads
+    """
+    threads = [threading.Thread(target=worker, args=(number,))
+               for number in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def race(reservations_obj, dated):
+    """
+    This function makes every thread try to reserve random rooms until
+    all of them are taken
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+        dated (bool): True to book the rooms for the same date range,
+        False to reserve them by status
+
+    Returns:
+        float: Seconds taken by the threads
+        list: The number of rooms won by each thread
+    """
+    wins = [0] * THREADS
+    dates = (CHECK_IN, CHECK_OUT) if dated else (None, None)
+
+    def worker(number):
+        randomizer = random.Random(number)
+        for attempt in range(ATTEMPTS):
+            room_number = f'{randomizer.randint(1, ROOMS):03d}'
+            reservation_id = f'{number * ATTEMPTS + attempt:06d}'
+            if reservations_obj.create_customer_reservation(
+                    reservation_id, '1000', HOTEL_NAME, room_number,
+                    *dates):
+                wins[number] += 1
+
+    return run_threads(worker), wins
+
+
+def churn(reservations_obj):
+    """
+    This function makes every thread reserve and cancel random rooms,
+    so rooms are won and released while other threads want them
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+
+    Returns:
+        float: Seconds taken by the threads
+    """
+    def worker(number):
+        randomizer = random.Random(number)
+        for attempt in range(ATTEMPTS):
+            room_number = f'{randomizer.randint(1, ROOMS):03d}'
+            reservation_id = f'{number * ATTEMPTS + attempt:06d}'
+            if reservations_obj.create_customer_reservation(
+                    reservation_id, '1000', HOTEL_NAME, room_number):
+                reservations_obj.cancel_customer_reservation(
+                    reservation_id)
+
+    return run_threads(worker)
+
+
+def check_race(reservations_obj, wins):
+    """
+    This function checks that each room was won by one thread only
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+        wins (list): The number of rooms won by each thread
+
+    Returns:
+        list: The problems found
+    """
+    problems = []
+    if sum(wins) != ROOMS:
+        problems.append(f'{sum(wins)} wins for {ROOMS} rooms')
+    if len(reservations_obj.reservations) != ROOMS:
+        problems.append(f'{len(reservations_obj.reservations)} '
+                        f'reservations stored for {ROOMS} rooms')
+    for number in range(1, ROOMS + 1):
+        room_reservations = reservations_obj.find_room_reservations(
+            HOTEL_NAME, f'{number:03d}')
+        if len(room_reservations) > 1:
+            problems.append(f'Room {number:03d} reserved '
+                            f'{len(room_reservations)} times')
+    return problems
+
+
+def main():
+    """
+    Main function, prints the throughput of each scenario and the
+    double bookings found
+
+    Returns:
+        None
+    """
+    # Switches threads as often as possible to provoke races
+    sys.setswitchinterval(1e-6)
+    operations = THREADS * ATTEMPTS
+    print(f'{THREADS} threads, {ROOMS} rooms, {operations} attempts')
+    print(f'{"scenario":>10} {"ops/s":>10} {"problems":>10}')
+    for dated in (False, True):
+        reservations_obj = build_reservations()
+        elapsed, wins = race(reservations_obj, dated)
+        problems = check_race(reservations_obj, wins)
+        scenario = 'dates' if dated else 'status'
+        print(f'{scenario:>10} {operations / elapsed:>10.0f} '
+              f'{len(problems):>10}')
+        for problem in problems:
+            print(f'    {problem}')
+
+    reservations_obj = build_reservations()
+    elapsed = churn(reservations_obj)
+    hotels_obj = reservations_obj.hotels_instance
+    left = len(reservations_obj.reservations) + len(
+        hotels_obj.list_rooms(HOTEL_NAME, 'reserved'))
+    print(f'{"churn":>10} {operations / elapsed:>10.0f} {left:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -15,10 +15,14 @@ Author:
     Julia Gabriela Pinedo (A01795315)
 """
 
+import threading
 import unittest
+from datetime import date
 from hotels import Hotels
 from customers import Customers
+from events import CollectingSink
 from reservations import Reservations
+from sqlite_storage import SqliteStorage
 
 
 class ReservationsTest(unittest.TestCase):
@@ -348,6 +352,439 @@ class ReservationsTest(unittest.TestCase):
                 break
         self.assertTrue(reservation_found)
 
+    # PART 3: This part of the Test Cases covers the reservations
+    # store, which is keyed by the reservation ID.
+
+    def test_reservation_store_lookup(self):
+        # Create a Hotel
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'double'}
+        }
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        # Create a Customer
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation('111111',
+                                                          '4444',
+                                                          'Hotel California',
+                                                          '101')
+        # Verifies the reservation is found by its ID
+        self.assertIn('111111', self.reservations_obj.reservations)
+        self.assertEqual(
+            self.reservations_obj.reservations.get('111111')['room_number'],
+            '101')
+        self.assertIsNone(self.reservations_obj.reservations.get('222222'))
+
+    def test_cancel_customer_reservation_not_first(self):
+        # Create a Hotel
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'double'}
+        }
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        # Create a Customer
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        # Create two Reservations and cancel the second one
+        self.reservations_obj.create_customer_reservation('111111',
+                                                          '4444',
+                                                          'Hotel California',
+                                                          '101')
+        self.reservations_obj.create_customer_reservation('222222',
+                                                          '4444',
+                                                          'Hotel California',
+                                                          '102')
+        self.reservations_obj.cancel_customer_reservation('222222')
+        # Verifies only the second reservation was removed
+        self.assertIn('111111', self.reservations_obj.reservations)
+        self.assertNotIn('222222', self.reservations_obj.reservations)
+        self.assertEqual(self.hotels_cls.hotels['Hotel California']
+                         ['rooms']['102']['status'], 'available')
+
+    def test_find_reservations_by_customer_hotel_and_room(self):
+        # Create a Hotel
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'double'}
+        }
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        # Create two Customers
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.customers_cls.create_customer('5555',
+                                           'Ana Perez',
+                                           'aperez@gmail.com',
+                                           '6643127402')
+        self.reservations_obj.create_customer_reservation('111111',
+                                                          '4444',
+                                                          'Hotel California',
+                                                          '101')
+        self.reservations_obj.create_customer_reservation('222222',
+                                                          '5555',
+                                                          'Hotel California',
+                                                          '102')
+        # Verifies the lookups use the indexed reservations
+        customer_reservations = \
+            self.reservations_obj.find_customer_reservations('4444')
+        self.assertEqual([reservation['reservation_id'] for reservation
+                          in customer_reservations], ['111111'])
+        self.assertEqual(len(self.reservations_obj.
+                             find_hotel_reservations('Hotel California')),
+                         2)
+        room_reservations = self.reservations_obj.\
+            find_room_reservations('Hotel California', '102')
+        self.assertEqual(room_reservations[0]['customer_id'], '5555')
+
+    def test_find_reservations_after_cancel(self):
+        # Create a Hotel
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        # Create a Customer
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation('111111',
+                                                          '4444',
+                                                          'Hotel California',
+                                                          '101')
+        self.reservations_obj.cancel_customer_reservation('111111')
+        # Verifies the indexes no longer return the reservation
+        self.assertEqual(
+            self.reservations_obj.find_customer_reservations('4444'), [])
+        self.assertEqual(
+            self.reservations_obj.find_hotel_reservations('Hotel California'),
+            [])
+        self.assertEqual(self.reservations_obj.
+                         find_room_reservations('Hotel California', '101'),
+                         [])
+
+    def test_find_reservations_after_rename(self):
+        # Create a Hotel
+        rooms_info = {
+            '101': {'status': 'available', 'type': 'single'},
+            '102': {'status': 'available', 'type': 'double'}
+        }
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        # Create a Customer
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101')
+        self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '102',
+            '2024-03-10', '2024-03-15')
+        self.hotels_cls.modify_hotel_name('Hotel California',
+                                          'Hotel Tijuana')
+        # Verifies the reservations follow the Hotel to its new name
+        reservations = \
+            self.reservations_obj.find_hotel_reservations('Hotel Tijuana')
+        self.assertEqual([reservation['hotel_name'] for reservation
+                          in reservations], ['Hotel Tijuana'] * 2)
+        self.assertEqual(self.reservations_obj.
+                         find_hotel_reservations('Hotel California'), [])
+        self.assertTrue(
+            self.reservations_obj.cancel_customer_reservation('111111'))
+        self.assertTrue(
+            self.reservations_obj.cancel_customer_reservation('222222'))
+        self.assertEqual(self.hotels_cls.hotels['Hotel Tijuana']
+                         ['rooms']['101']['status'], 'available')
+        self.assertTrue(self.hotels_cls.is_room_free(
+            'Hotel Tijuana', '102', date(2024, 3, 10), date(2024, 3, 15)))
+
+    def test_cancel_after_hotel_recreated(self):
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California', 'Tijuana',
+                                     rooms_info)
+        self.customers_cls.create_customer('4444', 'Jose Lopez',
+                                           'jlopez@gmail.com', '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101')
+        self.hotels_cls.delete_hotel('Hotel California')
+        self.hotels_cls.create_hotel('Hotel California', 'Tijuana',
+                                     {'101': {'status': 'available',
+                                              'type': 'single'}})
+        self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '101')
+        # Verifies the old reservation does not free the room of the
+        # new Hotel
+        self.assertTrue(
+            self.reservations_obj.cancel_customer_reservation('111111'))
+        self.assertEqual(self.hotels_cls.hotels['Hotel California']
+                         ['rooms']['101']['status'], 'reserved')
+        self.assertEqual([reservation['reservation_id'] for reservation in
+                          self.reservations_obj.find_hotel_reservations(
+                              'Hotel California')], ['222222'])
+
+    # PART 4: This part of the Test Cases covers the reservations
+    # made for a date range.
+
+    def test_create_dated_reservation(self):
+        # Create a Hotel
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        # Create a Customer
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101',
+            '2024-03-10', '2024-03-15')
+        # The same room can be booked for the following dates
+        self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '101',
+            '2024-03-15', '2024-03-18')
+        # But not for overlapping dates
+        self.reservations_obj.create_customer_reservation(
+            '333333', '4444', 'Hotel California', '101',
+            '2024-03-12', '2024-03-16')
+        self.assertIn('111111', self.reservations_obj.reservations)
+        self.assertIn('222222', self.reservations_obj.reservations)
+        self.assertNotIn('333333', self.reservations_obj.reservations)
+        # Verifies the room status is not changed by dated bookings
+        self.assertEqual(self.hotels_cls.hotels['Hotel California']
+                         ['rooms']['101']['status'], 'available')
+
+    def test_cancel_dated_reservation(self):
+        # Create a Hotel
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        # Create a Customer
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101',
+            '2024-03-10', '2024-03-15')
+        self.reservations_obj.cancel_customer_reservation('111111')
+        # Verifies the dates can be booked again
+        self.assertNotIn('111111', self.reservations_obj.reservations)
+        self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '101',
+            '2024-03-12', '2024-03-14')
+        self.assertIn('222222', self.reservations_obj.reservations)
+
+    def test_create_dated_reservation_neg_path_1(self):
+        # Path 1: Check-out before check-in
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101',
+            '2024-03-15', '2024-03-10')
+        self.assertEqual(len(self.reservations_obj.reservations), 0)
+
+    def test_create_dated_reservation_neg_path_2(self):
+        # Path 2: Room held without dates
+        rooms_info = {'101': {'status': 'reserved', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101',
+            '2024-03-10', '2024-03-15')
+        self.assertEqual(len(self.reservations_obj.reservations), 0)
+
+    def test_create_dated_reservation_neg_path_3(self):
+        # Path 3: Room booked for dates, then reserved without dates
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101',
+            '2024-03-10', '2024-03-15')
+        result = self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '101')
+        self.assertFalse(result)
+        self.assertNotIn('222222', self.reservations_obj.reservations)
+        self.assertEqual(self.hotels_cls.hotels['Hotel California']
+                         ['rooms']['101']['status'], 'available')
+        # Verifies the room can be held again once the booking is gone
+        self.reservations_obj.cancel_customer_reservation('111111')
+        self.assertTrue(self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '101'))
+
+    def test_create_reservation_result(self):
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        result = self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101')
+        self.assertTrue(result)
+        self.assertEqual(result.data['reservation_id'], '111111')
+        # The room is not available anymore
+        result = self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '101')
+        self.assertFalse(result)
+        self.assertEqual(result.message, 'Room 101 not available')
+        # Cancelling returns the removed reservation
+        result = self.reservations_obj.cancel_customer_reservation(
+            '111111')
+        self.assertTrue(result)
+        self.assertEqual(result.data['room_number'], '101')
+
+    def test_create_reservation_customer_display(self):
+        self.hotels_cls.create_hotel_bulk('Hotel California', 'Tijuana',
+                                          room_range=range(101, 103))
+        self.customers_cls.create_customer('4444', 'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.customers_cls.sink = CollectingSink()
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101')
+        self.assertTrue(self.customers_cls.sink.results[-1].message
+                        .startswith('Customer Information:'))
+        # Verifies the customer is not rendered without a sink
+        displayed = []
+        self.customers_cls.sink = None
+        self.customers_cls.display_customer_information = displayed.append
+        self.assertTrue(self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '102'))
+        self.assertEqual(displayed, [])
+
+    def test_create_reservation_result_neg_path_1(self):
+        # Path 1: Check-out before check-in
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        result = self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101',
+            '2024-03-15', '2024-03-10')
+        self.assertFalse(result)
+        self.assertEqual(result.message,
+                         'Check-out must be after check-in')
+
+    def test_concurrent_reservations(self):
+        hotels_obj = Hotels(sink=None, concurrent=True)
+        customers_obj = Customers(sink=None, concurrent=True)
+        reservations_obj = Reservations(hotels_obj, customers_obj,
+                                        sink=None, concurrent=True)
+        hotels_obj.create_hotel('Hotel California', 'Tijuana',
+                                {'101': {'status': 'available',
+                                         'type': 'single'},
+                                 '102': {'status': 'available',
+                                         'type': 'single'}})
+        customers_obj.create_customer('4444', 'Jose Lopez',
+                                      'jlopez@gmail.com', '6643127401')
+        results = []
+
+        def reserve(room_number):
+            results.append(reservations_obj.create_customer_reservation(
+                '111111', '4444', 'Hotel California', room_number))
+
+        threads = [threading.Thread(target=reserve, args=(room_number,))
+                   for room_number in ('101', '102') * 8]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Verifies the reservation ID was used once, and the room of
+        # the threads that lost it was given back
+        self.assertEqual(sum(1 for result in results if result), 1)
+        self.assertEqual(len(reservations_obj.reservations), 1)
+        self.assertEqual(len(hotels_obj.list_rooms('Hotel California',
+                                                   'reserved')), 1)
+
+    def test_concurrent_cancel_neg_path_1(self):
+        # Path 1: Reservation cancelled twice
+        rooms_info = {'101': {'status': 'available', 'type': 'single'}}
+        self.hotels_cls.create_hotel('Hotel California',
+                                     'Tijuana',
+                                     rooms_info)
+        self.customers_cls.create_customer('4444',
+                                           'Jose Lopez',
+                                           'jlopez@gmail.com',
+                                           '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101')
+        self.assertTrue(
+            self.reservations_obj.cancel_customer_reservation('111111'))
+        self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '101')
+        # Verifies the second cancellation does not free the new
+        # reservation of the room
+        self.assertFalse(
+            self.reservations_obj.cancel_customer_reservation('111111'))
+        self.assertEqual(self.hotels_cls.hotels['Hotel California']
+                         ['rooms']['101']['status'], 'reserved')
+
+
+class SqliteReservationsTest(ReservationsTest):
+    """
+    Class to run the Reservations Test Cases with the SQLite storage
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.storage = SqliteStorage(':memory:')
+        self.hotels_cls = Hotels(storage=self.storage)
+        self.customers_cls = Customers(storage=self.storage)
+        self.reservations_obj = Reservations(self.hotels_cls,
+                                             self.customers_cls,
+                                             storage=self.storage)
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.storage.close()
+
 
 # This part of the code prints the results from the Unit Tests performed
 if __name__ == '__main__':
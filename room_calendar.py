@@ -0,0 +1,148 @@
+"""
+Room Calendar
+
+This program handles the bookings of a single room as
+date ranges (check-in, check-out)
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+
+def as_date(value):
+    """
+    This function converts a date given as 'YYYY-MM-DD' into a date
+
+    Args:
+        value (str or date): The date to be converted
+
+    Returns:
+        date: The converted date
+
+    Raises:
+        TypeError, ValueError: If the value is not a valid date
+    """
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def stay_dates_error(check_in, check_out):
+    """
+    This function checks the check-in and check-out dates of a stay
+    without printing
+
+    Args:
+        check_in (str or date): The first night of the stay
+        check_out (str or date): The day the stay ends
+
+    Returns:
+        str: The error found, None if the dates are valid
+        check_in: The check-in date (None if invalid)
+        check_out: The check-out date (None if invalid)
+    """
+    try:
+        check_in = as_date(check_in)
+        check_out = as_date(check_out)
+    except (TypeError, ValueError):
+        return 'Invalid reservation dates', None, None
+
+    if check_out <= check_in:
+        return 'Check-out must be after check-in', None, None
+
+    return None, check_in, check_out
+
+
+class RoomCalendar:
+    """
+    Class to keep the bookings of a room as half-open date ranges
+    [check_in, check_out), sorted by check-in date. Since the bookings
+    of a room never overlap, overlap checks only need to look at the
+    neighbours of the requested range, which are found by bisection
+    """
+    def __init__(self):
+        """
+        Initializes the RoomCalendar object
+
+        Returns:
+            None
+        """
+        self._check_ins = []
+        self._check_outs = []
+
+    def __len__(self):
+        """
+        This method returns the number of bookings of the room
+
+        Returns:
+            int: The number of bookings
+        """
+        return len(self._check_ins)
+
+    def __iter__(self):
+        """
+        This method iterates over the bookings of the room
+
+        Returns:
+            iterator: (check_in, check_out) tuples sorted by check-in
+        """
+        return iter(list(zip(self._check_ins, self._check_outs)))
+
+    def is_free(self, check_in, check_out):
+        """
+        This method checks whether the room is free for a date range
+
+        Args:
+            check_in (date): The first night of the stay
+            check_out (date): The day the stay ends (not included)
+
+        Returns:
+            bool: True if no booking overlaps the range, False otherwise
+        """
+        position = bisect_right(self._check_ins, check_in)
+        if position > 0 and self._check_outs[position - 1] > check_in:
+            return False
+        if (position < len(self._check_ins)
+                and self._check_ins[position] < check_out):
+            return False
+        return True
+
+    def add(self, check_in, check_out):
+        """
+        This method books the room for a date range (if it is free)
+
+        Args:
+            check_in (date): The first night of the stay
+            check_out (date): The day the stay ends (not included)
+
+        Returns:
+            bool: True if the booking was added, False otherwise
+        """
+        if not self.is_free(check_in, check_out):
+            return False
+        position = bisect_right(self._check_ins, check_in)
+        self._check_ins.insert(position, check_in)
+        self._check_outs.insert(position, check_out)
+        return True
+
+    def remove(self, check_in, check_out):
+        """
+        This method removes the booking of a date range
+
+        Args:
+            check_in (date): The first night of the stay
+            check_out (date): The day the stay ends (not included)
+
+        Returns:
+            bool: True if the booking was removed, False otherwise
+        """
+        position = bisect_left(self._check_ins, check_in)
+        if (position == len(self._check_ins)
+                or self._check_ins[position] != check_in
+                or self._check_outs[position] != check_out):
+            return False
+        del self._check_ins[position]
+        del self._check_outs[position]
+        return True
@@ -0,0 +1,94 @@
+"""
+Room Calendar Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- is_free()
+- add()
+- remove()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import unittest
+from datetime import date
+from room_calendar import RoomCalendar
+
+
+class RoomCalendarTest(unittest.TestCase):
+    """
+    Class to handle the RoomCalendar Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.calendar_obj = RoomCalendar()
+        self.calendar_obj.add(date(2024, 3, 10), date(2024, 3, 15))
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_add_happy_path(self):
+        # Books the nights right before and right after the booking
+        self.assertTrue(self.calendar_obj.add(date(2024, 3, 5),
+                                              date(2024, 3, 10)))
+        self.assertTrue(self.calendar_obj.add(date(2024, 3, 15),
+                                              date(2024, 3, 20)))
+        # Verifies the bookings are kept in check-in order
+        self.assertEqual([check_in.day for check_in, _
+                          in self.calendar_obj], [5, 10, 15])
+
+    def test_remove_happy_path(self):
+        self.assertTrue(self.calendar_obj.remove(date(2024, 3, 10),
+                                                 date(2024, 3, 15)))
+        # Verifies the dates are free again
+        self.assertTrue(self.calendar_obj.is_free(date(2024, 3, 10),
+                                                  date(2024, 3, 15)))
+        self.assertEqual(len(self.calendar_obj), 0)
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # some are missing/None.
+
+    def test_add_neg_path_1(self):
+        # Path 1: Range starts inside the existing booking
+        self.assertFalse(self.calendar_obj.add(date(2024, 3, 14),
+                                               date(2024, 3, 16)))
+        self.assertEqual(len(self.calendar_obj), 1)
+
+    def test_add_neg_path_2(self):
+        # Path 2: Range ends inside the existing booking
+        self.assertFalse(self.calendar_obj.add(date(2024, 3, 8),
+                                               date(2024, 3, 11)))
+        self.assertEqual(len(self.calendar_obj), 1)
+
+    def test_add_neg_path_3(self):
+        # Path 3: Range covers the existing booking
+        self.assertFalse(self.calendar_obj.add(date(2024, 3, 1),
+                                               date(2024, 3, 31)))
+        self.assertEqual(len(self.calendar_obj), 1)
+
+    def test_remove_neg_path_1(self):
+        # Path 1: Range that was never booked
+        self.assertFalse(self.calendar_obj.remove(date(2024, 3, 10),
+                                                  date(2024, 3, 12)))
+        self.assertEqual(len(self.calendar_obj), 1)
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(RoomCalendarTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('RoomCalendarTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -0,0 +1,1016 @@
+"""
+Room Map
+
+This program handles a binary file with the rooms of the Hotels,
+opened with mmap. The file has a fixed layout: a header, a
+directory of Hotels (ID, name, location and number of rooms of each
+status and type) and 1000 bytes per Hotel, one per room number,
+so opening it does not read the rooms and several processes can
+share the same pages of memory
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import mmap
+import os
+import struct
+from collections.abc import MutableMapping
+
+from room_storage import ROOM_NUMBERS, room_slot
+
+MAP_MAGIC = b'HOTELMAP'
+MAP_VERSION = 3
+# Magic, version and number of Hotel slots
+HEADER = struct.Struct('<8sII')
+# Room numbers have 3 digits
+ROOM_SLOTS = 1000
+
+# One byte per room holds its status and type, 0 marks an empty slot
+ROOM_CODES = {('reserved', 'single'): 1, ('reserved', 'double'): 2,
+              ('available', 'single'): 3, ('available', 'double'): 4}
+ROOM_DETAILS = {code: details for details, code in ROOM_CODES.items()}
+DETAIL_ITEMS = {code: (('status', status), ('type', room_type))
+                for code, (status, room_type) in ROOM_DETAILS.items()}
+
+# Each directory entry holds the ID, the name and the location of a
+# Hotel, and the number of its rooms with each byte, so they are not
+# counted when the map is opened. The ID of a free entry is 0
+ENTRY_ID = struct.Struct('<I')
+TEXT_SIZE = 126
+ROOM_COUNT = struct.Struct('<H')
+ROOM_COUNTS = struct.Struct(f'<{len(ROOM_CODES)}H')
+ENTRY_SIZE = ENTRY_ID.size + 2 * TEXT_SIZE + ROOM_COUNTS.size
+
+
+def encode_text(text):
+    """
+    This function encodes a name or location for the directory
+
+    Args:
+        text (str): The name or location
+
+    Returns:
+        bytes: The text padded to TEXT_SIZE bytes
+
+    Raises:
+        ValueError: If the text does not fit
+    """
+    data = text.encode('utf-8')
+    if len(data) > TEXT_SIZE:
+        raise ValueError(f'{text} is longer than {TEXT_SIZE} bytes')
+    return data.ljust(TEXT_SIZE, b'\0')
+
+
+def decode_text(data):
+    """
+    This function decodes a name or location of the directory
+
+    Args:
+        data (bytes): The padded text
+
+    Returns:
+        str: The text
+    """
+    return data.rstrip(b'\0').decode('utf-8')
+
+
+def write_code(buffer, counts, offset, code):
+    """
+    This function writes the byte of a room and updates the number of
+    rooms with each byte in the directory entry of its Hotel
+
+    Args:
+        buffer (mmap): The mapped file
+        counts (int): The offset of the room counts of the Hotel
+        offset (int): The offset of the byte of the room
+        code (int): The byte from ROOM_CODES, 0 to remove the room
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If a count leaves the 0 to ROOM_SLOTS range, which
+        means the room bytes were written without their counts
+    """
+    previous = buffer[offset]
+    if previous == code:
+        return
+    changes = []
+    for changed_code, step in ((previous, -1), (code, 1)):
+        if changed_code:
+            count_offset = counts + (changed_code - 1) * ROOM_COUNT.size
+            count = ROOM_COUNT.unpack_from(buffer, count_offset)[0] + step
+            if not 0 <= count <= ROOM_SLOTS:
+                raise ValueError(
+                    f'Invalid count of rooms {ROOM_DETAILS[changed_code]}: '
+                    f'{count}, the room bytes do not match their counts')
+            changes.append((count_offset, count))
+    for count_offset, count in changes:
+        ROOM_COUNT.pack_into(buffer, count_offset, count)
+    buffer[offset] = code
+
+
+class RoomMap:
+    """
+    Class to open a room map file. The room bytes are read and written
+    in the mapped memory, so the changes of a writer are seen by the
+    processes that opened the file read-only. The directory is read
+    when the file is opened, so Hotels added later are only seen by the
+    processes that open it again
+    """
+    def __init__(self, path, writable=True):
+        """
+        Initializes the RoomMap object
+
+        Args:
+            path (str): The path of the room map file
+            writable (bool): False to open the file read-only
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the file is not a room map or has another
+            version
+        """
+        self.writable = writable
+        descriptor = os.open(path, os.O_RDWR if writable else os.O_RDONLY)
+        try:
+            self.buffer = mmap.mmap(
+                descriptor, 0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        finally:
+            os.close(descriptor)
+
+        magic, version, capacity = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAP_MAGIC:
+            self.buffer.close()
+            raise ValueError(f'{path} is not a room map file')
+        if version != MAP_VERSION:
+            self.buffer.close()
+            raise ValueError(f'Unsupported room map version: {version}')
+
+        self.capacity = capacity
+        self.data_offset = HEADER.size + capacity * ENTRY_SIZE
+        # Slot of each Hotel, and the free slots with the first one last
+        self.slots = {}
+        self._free = []
+        self._next_id = 1
+        for slot in range(capacity):
+            hotel_id = self.hotel_id(slot)
+            if hotel_id:
+                offset = self._entry_offset(slot) + ENTRY_ID.size
+                self.slots[decode_text(
+                    self.buffer[offset:offset + TEXT_SIZE])] = slot
+                self._next_id = max(self._next_id, hotel_id + 1)
+            else:
+                self._free.append(slot)
+        self._free.reverse()
+        self.hotels = MappedHotels(self)
+
+    @staticmethod
+    def create(path, capacity):
+        """
+        This function creates an empty room map file
+
+        Args:
+            path (str): The path of the room map file
+            capacity (int): The maximum number of Hotels
+
+        Returns:
+            RoomMap: The room map, open for writing
+        """
+        with open(path, 'wb') as stream:
+            stream.write(HEADER.pack(MAP_MAGIC, MAP_VERSION, capacity))
+            stream.truncate(HEADER.size
+                            + capacity * (ENTRY_SIZE + ROOM_SLOTS))
+        return RoomMap(path)
+
+    def __enter__(self):
+        """
+        This method returns the room map at the start of a with block
+
+        Returns:
+            RoomMap: The room map
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        This method closes the room map at the end of a with block
+
+        Returns:
+            None
+        """
+        self.close()
+
+    @staticmethod
+    def _entry_offset(slot):
+        """
+        This method finds the directory entry of a Hotel slot
+
+        Args:
+            slot (int): The slot of the Hotel
+
+        Returns:
+            int: The offset of the entry in the file
+        """
+        return HEADER.size + slot * ENTRY_SIZE
+
+    def counts_offset(self, slot):
+        """
+        This method finds the room counts of a Hotel slot
+
+        Args:
+            slot (int): The slot of the Hotel
+
+        Returns:
+            int: The offset of the counts in the file
+        """
+        return self._entry_offset(slot) + ENTRY_SIZE - ROOM_COUNTS.size
+
+    def write_rooms(self, slot, codes):
+        """
+        This method writes the bytes of all the rooms of a Hotel at
+        once, with their counts
+
+        Args:
+            slot (int): The slot of the Hotel
+            codes (bytes): The byte of each room slot, ROOM_SLOTS long
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the bytes are not ROOM_SLOTS long
+        """
+        if len(codes) != ROOM_SLOTS:
+            raise ValueError(f'Expected {ROOM_SLOTS} room bytes, '
+                             f'got {len(codes)}')
+        offset = self.rooms_offset(slot)
+        self.buffer[offset:offset + ROOM_SLOTS] = codes
+        ROOM_COUNTS.pack_into(self.buffer, self.counts_offset(slot),
+                              *(codes.count(code)
+                                for code in sorted(ROOM_DETAILS)))
+
+    def rooms_offset(self, slot):
+        """
+        This method finds the room bytes of a Hotel slot
+
+        Args:
+            slot (int): The slot of the Hotel
+
+        Returns:
+            int: The offset of the room 000 of the Hotel in the file
+        """
+        return self.data_offset + slot * ROOM_SLOTS
+
+    def hotel_id(self, slot):
+        """
+        This method reads the ID of a Hotel
+
+        Args:
+            slot (int): The slot of the Hotel
+
+        Returns:
+            int: The ID of the Hotel, 0 if the slot is free
+        """
+        return ENTRY_ID.unpack_from(self.buffer,
+                                    self._entry_offset(slot))[0]
+
+    def location(self, slot):
+        """
+        This method reads the location of a Hotel
+
+        Args:
+            slot (int): The slot of the Hotel
+
+        Returns:
+            str: The location of the Hotel
+        """
+        offset = self._entry_offset(slot) + ENTRY_ID.size + TEXT_SIZE
+        return decode_text(self.buffer[offset:offset + TEXT_SIZE])
+
+    def set_location(self, slot, location):
+        """
+        This method writes the location of a Hotel
+
+        Args:
+            slot (int): The slot of the Hotel
+            location (str): The new location
+
+        Returns:
+            None
+        """
+        offset = self._entry_offset(slot) + ENTRY_ID.size + TEXT_SIZE
+        self.buffer[offset:offset + TEXT_SIZE] = encode_text(location)
+
+    def add_hotel(self, hotel_name, location, hotel_id=None):
+        """
+        This method writes a Hotel without rooms in a free slot
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            location (str): The location of the Hotel
+            hotel_id (int): The ID of the Hotel, a new ID is given if
+            it is None (if applicable)
+
+        Returns:
+            int: The slot of the Hotel
+
+        Raises:
+            ValueError: If the map is full or the texts do not fit
+        """
+        if not self._free:
+            raise ValueError(f'The room map is full ({self.capacity} '
+                             'Hotels)')
+        if hotel_id is None:
+            hotel_id = self._next_id
+        self._next_id = max(self._next_id, hotel_id + 1)
+        entry = (ENTRY_ID.pack(hotel_id) + encode_text(hotel_name)
+                 + encode_text(location) + bytes(ROOM_COUNTS.size))
+        slot = self._free.pop()
+        offset = self._entry_offset(slot)
+        self.buffer[offset:offset + ENTRY_SIZE] = entry
+        self.slots[hotel_name] = slot
+        return slot
+
+    def rename_hotel(self, hotel_name, new_hotel_name):
+        """
+        This method writes the new name of a Hotel, which keeps its
+        slot and rooms
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            new_hotel_name (str): The new name of the Hotel
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the new name does not fit
+        """
+        name = encode_text(new_hotel_name)
+        slot = self.slots.pop(hotel_name)
+        offset = self._entry_offset(slot) + ENTRY_ID.size
+        self.buffer[offset:offset + TEXT_SIZE] = name
+        self.slots[new_hotel_name] = slot
+
+    def remove_hotel(self, hotel_name):
+        """
+        This method removes a Hotel and its rooms, its slot is used by
+        the next Hotel added
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            None
+        """
+        slot = self.slots.pop(hotel_name)
+        offset = self._entry_offset(slot)
+        self.buffer[offset:offset + ENTRY_SIZE] = bytes(ENTRY_SIZE)
+        offset = self.rooms_offset(slot)
+        self.buffer[offset:offset + ROOM_SLOTS] = bytes(ROOM_SLOTS)
+        self._free.append(slot)
+
+    def flush(self):
+        """
+        This method writes the changed pages to the file
+
+        Returns:
+            None
+        """
+        self.buffer.flush()
+
+    def close(self):
+        """
+        This method writes the changed pages and closes the file
+
+        Returns:
+            None
+        """
+        if not self.buffer.closed:
+            if self.writable:
+                self.buffer.flush()
+            self.buffer.close()
+
+
+class MappedRoom(MutableMapping):
+    """
+    Class to view the byte of one room as a dictionary with the
+    'status' and 'type' keys
+    """
+    __slots__ = ('_buffer', '_counts', '_offset')
+
+    def __init__(self, buffer, counts, offset):
+        """
+        Initializes the MappedRoom object
+
+        Args:
+            buffer (mmap): The mapped file
+            counts (int): The offset of the room counts of the Hotel
+            offset (int): The offset of the byte of the room
+
+        Returns:
+            None
+        """
+        self._buffer = buffer
+        self._counts = counts
+        self._offset = offset
+
+    def __getitem__(self, field):
+        """
+        This method reads a field of the room
+
+        Args:
+            field (str): 'status' or 'type'
+
+        Returns:
+            str: The value of the field
+        """
+        status, room_type = ROOM_DETAILS[self._buffer[self._offset]]
+        if field == 'status':
+            return status
+        if field == 'type':
+            return room_type
+        raise KeyError(field)
+
+    def __setitem__(self, field, value):
+        """
+        This method writes a field of the room
+
+        Args:
+            field (str): 'status' or 'type'
+            value (str): The new value of the field
+
+        Returns:
+            None
+        """
+        status, room_type = ROOM_DETAILS[self._buffer[self._offset]]
+        if field == 'status':
+            status = value
+        elif field == 'type':
+            room_type = value
+        else:
+            raise KeyError(field)
+        write_code(self._buffer, self._counts, self._offset,
+                   ROOM_CODES[(status, room_type)])
+
+    def __delitem__(self, field):
+        """
+        This method rejects removing a field, every room keeps both
+
+        Args:
+            field (str): The field to be removed
+
+        Returns:
+            None
+        """
+        raise TypeError('Room fields cannot be removed')
+
+    def __iter__(self):
+        """
+        This method iterates over the fields of the room
+
+        Returns:
+            iterator: The field names
+        """
+        return iter(('status', 'type'))
+
+    def __len__(self):
+        """
+        This method returns the number of fields of the room
+
+        Returns:
+            int: The number of fields
+        """
+        return 2
+
+    def __repr__(self):
+        """
+        This method represents the room as a dictionary
+
+        Returns:
+            str: The representation of the room
+        """
+        return repr(dict(self))
+
+
+class MappedRooms(MutableMapping):
+    """
+    Class to view the room bytes of a Hotel as the dictionary of room
+    dictionaries it replaces
+    """
+    def __init__(self, room_map, slot):
+        """
+        Initializes the MappedRooms object
+
+        Args:
+            room_map (RoomMap): The room map of the Hotel
+            slot (int): The slot of the Hotel
+
+        Returns:
+            None
+        """
+        self._buffer = room_map.buffer
+        self._counts = room_map.counts_offset(slot)
+        self._start = room_map.rooms_offset(slot)
+
+    def codes(self):
+        """
+        This method reads the bytes of all the rooms
+
+        Returns:
+            bytes: The byte of each room slot
+        """
+        return self._buffer[self._start:self._start + ROOM_SLOTS]
+
+    def count(self, code):
+        """
+        This method reads the number of rooms with the given byte from
+        the directory entry of the Hotel
+
+        Args:
+            code (int): The byte from ROOM_CODES
+
+        Returns:
+            int: The number of rooms
+        """
+        return ROOM_COUNT.unpack_from(
+            self._buffer, self._counts + (code - 1) * ROOM_COUNT.size)[0]
+
+    def find(self, code):
+        """
+        This method finds a room with the given byte
+
+        Args:
+            code (int): The byte from ROOM_CODES
+
+        Returns:
+            str: The number of the first room found, None if none
+        """
+        position = self._buffer.find(bytes((code,)), self._start,
+                                     self._start + ROOM_SLOTS)
+        return None if position < 0 else f'{position - self._start:03d}'
+
+    def pools(self):
+        """
+        This method returns the availability index of the rooms, which
+        reads the room bytes instead of keeping the room numbers
+
+        Returns:
+            dict: The MappedPool of each (status, type)
+        """
+        return {details: MappedPool(self, code)
+                for details, code in ROOM_CODES.items()}
+
+    def __getitem__(self, room_number):
+        """
+        This method returns a view of a room
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            MappedRoom: The view of the room
+        """
+        offset = self._start + room_slot(room_number)
+        if not self._buffer[offset]:
+            raise KeyError(room_number)
+        return MappedRoom(self._buffer, self._counts, offset)
+
+    def __setitem__(self, room_number, room_details):
+        """
+        This method stores a room
+
+        Args:
+            room_number (str): The room number
+            room_details (dict): The 'status' and 'type' of the room
+
+        Returns:
+            None
+        """
+        write_code(self._buffer, self._counts,
+                   self._start + room_slot(room_number),
+                   ROOM_CODES[(room_details['status'], room_details['type'])])
+
+    def __delitem__(self, room_number):
+        """
+        This method removes a room
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            None
+        """
+        offset = self._start + room_slot(room_number)
+        if not self._buffer[offset]:
+            raise KeyError(room_number)
+        write_code(self._buffer, self._counts, offset, 0)
+
+    def __contains__(self, room_number):
+        """
+        This method checks whether a room exists
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            bool: True if the room exists, False otherwise
+        """
+        try:
+            slot = room_slot(room_number)
+        except KeyError:
+            return False
+        return self._buffer[self._start + slot] != 0
+
+    def __iter__(self):
+        """
+        This method iterates over the room numbers in ascending order
+
+        Returns:
+            iterator: The room numbers
+        """
+        return iter([f'{slot:03d}' for slot, code
+                     in enumerate(self.codes()) if code])
+
+    def __len__(self):
+        """
+        This method returns the number of rooms
+
+        Returns:
+            int: The number of rooms
+        """
+        return sum(ROOM_COUNTS.unpack_from(self._buffer, self._counts))
+
+    def items(self):
+        """
+        This method reads all the rooms at once. The room dictionaries
+        are copies, changes to them are not stored
+
+        Returns:
+            list: (room_number, room_details) tuples in ascending order
+        """
+        return [(f'{slot:03d}', dict(zip(('status', 'type'),
+                                         ROOM_DETAILS[code])))
+                for slot, code in enumerate(self.codes()) if code]
+
+    def detail_items(self):
+        """
+        This method reads the rooms one at a time, without a
+        dictionary per room
+
+        Returns:
+            iterator: (room_number, details) tuples in ascending order,
+            the details are the ('status', value) and ('type', value)
+            pairs of the room
+        """
+        return ((room_number, DETAIL_ITEMS[code])
+                for room_number, code in zip(ROOM_NUMBERS, self.codes())
+                if code)
+
+    def __repr__(self):
+        """
+        This method represents the rooms as a dictionary
+
+        Returns:
+            str: The representation of the rooms
+        """
+        return repr(dict(self.items()))
+
+
+class MappedPool:
+    """
+    Class to view the rooms of a Hotel with a given status and type as
+    a RoomPool. The pool reads the room bytes, which the room views
+    change, so adding and removing rooms does nothing
+    """
+    __slots__ = ('_rooms', '_code')
+
+    def __init__(self, rooms, code):
+        """
+        Initializes the MappedPool object
+
+        Args:
+            rooms (MappedRooms): The rooms of the Hotel
+            code (int): The byte of the rooms of the pool
+
+        Returns:
+            None
+        """
+        self._rooms = rooms
+        self._code = code
+
+    def __len__(self):
+        """
+        This method returns the number of rooms in the pool
+
+        Returns:
+            int: The number of rooms
+        """
+        return self._rooms.count(self._code)
+
+    def __iter__(self):
+        """
+        This method iterates over the rooms in the pool
+
+        Returns:
+            iterator: The room numbers
+        """
+        return iter([f'{slot:03d}' for slot, code
+                     in enumerate(self._rooms.codes())
+                     if code == self._code])
+
+    def __contains__(self, room_number):
+        """
+        This method checks whether a room is in the pool
+
+        Args:
+            room_number (str): The number of the room
+
+        Returns:
+            bool: True if the room is in the pool, False otherwise
+        """
+        return (room_number in self._rooms and
+                ROOM_CODES[tuple(self._rooms[room_number].values())]
+                == self._code)
+
+    def add(self, room_number):
+        """
+        This method does nothing, the room is in the pool once its
+        byte is written
+
+        Args:
+            room_number (str): The number of the room
+
+        Returns:
+            None
+        """
+
+    def discard(self, room_number):
+        """
+        This method does nothing, the room leaves the pool once its
+        byte is written
+
+        Args:
+            room_number (str): The number of the room
+
+        Returns:
+            None
+        """
+
+    def pick(self):
+        """
+        This method returns a room of the pool
+
+        Returns:
+            str: A room number, None if the pool is empty
+        """
+        return self._rooms.find(self._code)
+
+
+class MappedHotel(MutableMapping):
+    """
+    Class to view a Hotel of the room map as a dictionary with the
+    'hotel_id', 'location' and 'rooms' keys
+    """
+    __slots__ = ('_room_map', '_slot')
+
+    def __init__(self, room_map, slot):
+        """
+        Initializes the MappedHotel object
+
+        Args:
+            room_map (RoomMap): The room map of the Hotel
+            slot (int): The slot of the Hotel
+
+        Returns:
+            None
+        """
+        self._room_map = room_map
+        self._slot = slot
+
+    def __getitem__(self, field):
+        """
+        This method reads the ID, the location or the rooms of the
+        Hotel
+
+        Args:
+            field (str): 'hotel_id', 'location' or 'rooms'
+
+        Returns:
+            object: The ID (int), the location (str) or the rooms
+            (MappedRooms)
+        """
+        if field == 'rooms':
+            return MappedRooms(self._room_map, self._slot)
+        if field == 'hotel_id':
+            return self._room_map.hotel_id(self._slot)
+        if field == 'location':
+            return self._room_map.location(self._slot)
+        raise KeyError(field)
+
+    def __setitem__(self, field, value):
+        """
+        This method writes the location of the Hotel
+
+        Args:
+            field (str): 'location'
+            value (str): The new location
+
+        Returns:
+            None
+        """
+        if field != 'location':
+            raise TypeError(f'{field} cannot be replaced')
+        self._room_map.set_location(self._slot, value)
+
+    def __delitem__(self, field):
+        """
+        This method rejects removing a field, every Hotel keeps both
+
+        Args:
+            field (str): The field to be removed
+
+        Returns:
+            None
+        """
+        raise TypeError('Hotel fields cannot be removed')
+
+    def __iter__(self):
+        """
+        This method iterates over the fields of the Hotel
+
+        Returns:
+            iterator: The field names
+        """
+        return iter(('hotel_id', 'location', 'rooms'))
+
+    def __len__(self):
+        """
+        This method returns the number of fields of the Hotel
+
+        Returns:
+            int: The number of fields
+        """
+        return 3
+
+    def __repr__(self):
+        """
+        This method represents the Hotel as a dictionary
+
+        Returns:
+            str: The representation of the Hotel
+        """
+        return repr({'hotel_id': self['hotel_id'],
+                     'location': self['location'], 'rooms': self['rooms']})
+
+
+class MappedHotels(MutableMapping):
+    """
+    Class to view the Hotels of a room map as the dictionary of Hotel
+    dictionaries it replaces
+    """
+    def __init__(self, room_map):
+        """
+        Initializes the MappedHotels object
+
+        Args:
+            room_map (RoomMap): The room map
+
+        Returns:
+            None
+        """
+        self._room_map = room_map
+
+    def __getitem__(self, hotel_name):
+        """
+        This method returns a view of a Hotel
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            MappedHotel: The view of the Hotel
+        """
+        return MappedHotel(self._room_map, self._room_map.slots[hotel_name])
+
+    def __setitem__(self, hotel_name, hotel):
+        """
+        This method stores a Hotel with its rooms, replacing the Hotel
+        with the same name (if any)
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            hotel (dict): The 'location' and 'rooms' of the Hotel, and
+            its 'hotel_id' (if applicable)
+
+        Returns:
+            None
+        """
+        rooms_info = list(hotel['rooms'].items())
+        if hotel_name in self._room_map.slots:
+            del self[hotel_name]
+        rooms = MappedRooms(self._room_map, self._room_map.add_hotel(
+            hotel_name, hotel['location'], hotel.get('hotel_id')))
+        for room_number, room_details in rooms_info:
+            rooms[room_number] = room_details
+
+    def __delitem__(self, hotel_name):
+        """
+        This method removes a Hotel and its rooms
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            None
+        """
+        self._room_map.remove_hotel(hotel_name)
+
+    def rename(self, hotel_name, new_hotel_name):
+        """
+        This method changes the name of a Hotel in the directory,
+        without copying its rooms, replacing the Hotel with the new
+        name (if any)
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            new_hotel_name (str): The new name of the Hotel
+
+        Returns:
+            None
+        """
+        if hotel_name not in self._room_map.slots:
+            raise KeyError(hotel_name)
+        if new_hotel_name != hotel_name and \
+                new_hotel_name in self._room_map.slots:
+            del self[new_hotel_name]
+        self._room_map.rename_hotel(hotel_name, new_hotel_name)
+
+    def pop(self, hotel_name, *default):
+        """
+        This method removes a Hotel and returns a copy of it, which can
+        be stored again under another name. The next Hotel added takes
+        the freed slot, so a renamed Hotel keeps its room bytes in the
+        same place
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            default (object): The value returned if the Hotel does not
+            exist (if applicable)
+
+        Returns:
+            dict: The 'hotel_id', 'location' and 'rooms' of the Hotel
+        """
+        if hotel_name not in self._room_map.slots:
+            if default:
+                return default[0]
+            raise KeyError(hotel_name)
+        hotel = self[hotel_name]
+        copy = {'hotel_id': hotel['hotel_id'],
+                'location': hotel['location'],
+                'rooms': dict(hotel['rooms'].items())}
+        del self[hotel_name]
+        return copy
+
+    def __contains__(self, hotel_name):
+        """
+        This method checks whether a Hotel exists
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            bool: True if the Hotel exists, False otherwise
+        """
+        return hotel_name in self._room_map.slots
+
+    def __iter__(self):
+        """
+        This method iterates over the Hotel names
+
+        Returns:
+            iterator: The Hotel names
+        """
+        return iter(list(self._room_map.slots))
+
+    def __len__(self):
+        """
+        This method returns the number of Hotels
+
+        Returns:
+            int: The number of Hotels
+        """
+        return len(self._room_map.slots)
+
+    def __repr__(self):
+        """
+        This method represents the Hotels as a dictionary
+
+        Returns:
+            str: The representation of the Hotels
+        """
+        return repr(dict(self.items()))
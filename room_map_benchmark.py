@@ -0,0 +1,116 @@
+"""
+Room Map Benchmark
+
+This program measures the time taken to open a room map file
+and index its Hotels for several numbers of rooms, next to the
+time taken to load the same rooms from a snapshot, and the
+reservations per second served from the mapped file
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import os
+import tempfile
+import time
+
+from customers import Customers
+from hotels import Hotels
+from reservations import Reservations
+from room_map import ROOM_CODES, ROOM_SLOTS, RoomMap
+from snapshot import load_snapshot, save_snapshot
+
+HOTEL_COUNTS = (100, 1000, 5000)
+OPERATIONS = 100000
+
+
+def build_map(path, hotels):
+    """
+    This function writes a room map with 1000 available rooms per
+    Hotel, half single and half double
+
+    Args:
+        path (str): The path of the room map file
+        hotels (int): The number of Hotels
+
+    Returns:
+        None
+    """
+    rooms = (bytes((ROOM_CODES[('available', 'single')],)) * 500
+             + bytes((ROOM_CODES[('available', 'double')],)) * 500)
+    with RoomMap.create(path, hotels) as room_map:
+        for number in range(hotels):
+            room_map.write_rooms(
+                room_map.add_hotel(f'Hotel {number}', 'Monterrey'), rooms)
+
+
+def time_snapshot(path, room_map):
+    """
+    This function saves the rooms of a room map in a snapshot and
+    measures the time taken to load it
+
+    Args:
+        path (str): The path of the snapshot file
+        room_map (RoomMap): The room map
+
+    Returns:
+        float: The seconds taken to load the snapshot
+    """
+    save_snapshot(path, Reservations(Hotels(sink=None, storage=room_map),
+                                     Customers(sink=None), sink=None))
+    reservations_obj = Reservations(Hotels(sink=None), Customers(sink=None),
+                                    sink=None)
+    start = time.perf_counter()
+    load_snapshot(path, reservations_obj)
+    return time.perf_counter() - start
+
+
+def time_operations(hotels_obj, hotels):
+    """
+    This function reserves and cancels rooms of every Hotel
+
+    Args:
+        hotels_obj (Hotels): The Hotels object
+        hotels (int): The number of Hotels
+
+    Returns:
+        float: The operations per second
+    """
+    start = time.perf_counter()
+    for number in range(OPERATIONS // 2):
+        hotel_name = f'Hotel {number % hotels}'
+        room_number = f'{number // hotels % ROOM_SLOTS:03d}'
+        hotels_obj.reserve_room(hotel_name, room_number)
+        hotels_obj.cancel_reservation(hotel_name, room_number)
+    return OPERATIONS / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Main function, prints the start time and the operations per
+    second for each number of rooms
+
+    Returns:
+        None
+    """
+    print(f'{"rooms":>9} {"map open (s)":>13} {"snapshot (s)":>13} '
+          f'{"reserve/cancel (op/s)":>22}')
+    with tempfile.TemporaryDirectory() as folder:
+        for hotels in HOTEL_COUNTS:
+            path = os.path.join(folder, f'rooms-{hotels}.map')
+            build_map(path, hotels)
+
+            start = time.perf_counter()
+            room_map = RoomMap(path)
+            hotels_obj = Hotels(sink=None, storage=room_map)
+            opened = time.perf_counter() - start
+
+            loaded = time_snapshot(
+                os.path.join(folder, f'rooms-{hotels}.snap'), room_map)
+            rate = time_operations(hotels_obj, hotels)
+            room_map.close()
+            print(f'{hotels * ROOM_SLOTS:>9} {opened:>13.4f} '
+                  f'{loaded:>13.3f} {rate:>22.0f}')
+
+
+if __name__ == '__main__':
+    main()
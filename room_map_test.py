@@ -0,0 +1,256 @@
+"""
+Room Map Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following classes:
+
+- RoomMap
+- MappedHotels
+- MappedRooms
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import os
+import tempfile
+import unittest
+from hotels import Hotels
+from room_map import MAP_MAGIC, MAP_VERSION, HEADER, ROOM_CODES, RoomMap
+
+
+class RoomMapTest(unittest.TestCase):
+    """
+    Class to handle the RoomMap Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'rooms.map')
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.folder.cleanup()
+
+    def create_hotels(self, room_map):
+        """
+        This method creates two Hotels in a room map
+
+        Returns:
+            Hotels: The Hotels object
+        """
+        hotels_obj = Hotels(sink=None, storage=room_map)
+        hotels_obj.create_hotel(
+            'Hotel California', 'Tijuana',
+            {'101': {'status': 'available', 'type': 'single'},
+             '102': {'status': 'available', 'type': 'double'}})
+        hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                     room_range=range(0, 1000))
+        return hotels_obj
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_reopen_happy_path(self):
+        with RoomMap.create(self.path, 4) as room_map:
+            hotels_obj = self.create_hotels(room_map)
+            hotels_obj.reserve_room('Hotel California', '101')
+            hotels_obj.reserve_room('Hotel Uno', '999')
+
+        with RoomMap(self.path, writable=False) as room_map:
+            hotels_obj = Hotels(sink=None, storage=room_map)
+            self.assertEqual(list(room_map.hotels),
+                             ['Hotel California', 'Hotel Uno'])
+            self.assertEqual(room_map.hotels['Hotel California'],
+                             {'hotel_id': 1, 'location': 'Tijuana',
+                              'rooms': {
+                                  '101': {'status': 'reserved',
+                                          'type': 'single'},
+                                  '102': {'status': 'available',
+                                          'type': 'double'}}})
+            self.assertEqual(hotels_obj.list_rooms('Hotel Uno', 'reserved'),
+                             ['999'])
+            self.assertEqual(hotels_obj.find_available_room(
+                'Hotel California', 'double'), '102')
+            self.assertIsNone(hotels_obj.find_available_room(
+                'Hotel California', 'single'))
+
+    def test_shared_pages_happy_path(self):
+        with RoomMap.create(self.path, 4) as room_map:
+            hotels_obj = self.create_hotels(room_map)
+            with RoomMap(self.path, writable=False) as reader:
+                reader_obj = Hotels(sink=None, storage=reader)
+                # Verifies the reader sees the rooms changed by the writer
+                self.assertTrue(hotels_obj.reserve_room('Hotel Uno', '500'))
+                self.assertEqual(reader_obj.list_rooms(
+                    'Hotel Uno', 'reserved'), ['500'])
+                self.assertTrue(hotels_obj.cancel_reservation('Hotel Uno',
+                                                              '500'))
+                self.assertEqual(reader_obj.list_rooms(
+                    'Hotel Uno', 'reserved'), [])
+
+    def test_reuse_slot_happy_path(self):
+        with RoomMap.create(self.path, 2) as room_map:
+            hotels_obj = self.create_hotels(room_map)
+            hotels_obj.delete_hotel('Hotel California')
+            hotels_obj.create_hotel_bulk('Hotel Dos', 'Saltillo',
+                                         room_range=range(201, 203))
+            self.assertEqual(room_map.slots, {'Hotel Uno': 1,
+                                              'Hotel Dos': 0})
+            self.assertEqual(list(room_map.hotels['Hotel Dos']['rooms']),
+                             ['201', '202'])
+
+    def test_rename_hotel_happy_path(self):
+        with RoomMap.create(self.path, 2) as room_map:
+            hotels_obj = self.create_hotels(room_map)
+            hotels_obj.reserve_room('Hotel Uno', '500')
+            hotels_obj.modify_hotel_name('Hotel Uno', 'Hotel Dos')
+            self.assertEqual(room_map.slots, {'Hotel California': 0,
+                                              'Hotel Dos': 1})
+
+        # Verifies the Hotel keeps its slot, ID and rooms
+        with RoomMap(self.path, writable=False) as room_map:
+            hotels_obj = Hotels(sink=None, storage=room_map)
+            self.assertEqual(room_map.slots, {'Hotel California': 0,
+                                              'Hotel Dos': 1})
+            self.assertEqual(room_map.hotels['Hotel Dos']['hotel_id'], 2)
+            self.assertEqual(hotels_obj.list_rooms('Hotel Dos', 'reserved'),
+                             ['500'])
+
+    def test_room_counts_happy_path(self):
+        with RoomMap.create(self.path, 2) as room_map:
+            hotels_obj = self.create_hotels(room_map)
+            rooms = room_map.hotels['Hotel California']['rooms']
+            rooms['101']['type'] = 'double'
+            rooms['103'] = {'status': 'reserved', 'type': 'single'}
+            del rooms['102']
+            hotels_obj.delete_hotel('Hotel Uno')
+            hotels_obj.create_hotel_bulk('Hotel Dos', 'Saltillo',
+                                         room_range=range(201, 203))
+
+        # Verifies the counts kept in the directory follow every room
+        # written, and start again when a slot is reused
+        with RoomMap(self.path, writable=False) as room_map:
+            hotels_obj = Hotels(sink=None, storage=room_map)
+            self.assertEqual(len(room_map.hotels['Hotel California']
+                                 ['rooms']), 2)
+            self.assertEqual(len(room_map.hotels['Hotel Dos']['rooms']), 2)
+            occupancy = hotels_obj.occupancy('Hotel California')
+            self.assertEqual((occupancy.reserved, occupancy.available),
+                             (1, 1))
+            self.assertEqual(hotels_obj.occupancy('Hotel Dos').available,
+                             2)
+
+    def test_detail_items_happy_path(self):
+        with RoomMap.create(self.path, 2) as room_map:
+            self.create_hotels(room_map)
+            rooms = room_map.hotels['Hotel California']['rooms']
+            # Verifies the rooms are read from the codes in the same
+            # order and with the same details as items()
+            self.assertEqual(list(rooms.detail_items()),
+                             [(room_number, tuple(details.items()))
+                              for room_number, details in rooms.items()])
+
+    def test_write_rooms_happy_path(self):
+        codes = (bytes((ROOM_CODES[('available', 'single')],)) * 600
+                 + bytes((ROOM_CODES[('reserved', 'double')],)) * 400)
+        with RoomMap.create(self.path, 1) as room_map:
+            room_map.write_rooms(room_map.add_hotel('Hotel Uno',
+                                                    'Monterrey'), codes)
+            hotels_obj = Hotels(sink=None, storage=room_map)
+            # Verifies the counts match the rooms written at once
+            self.assertEqual(len(room_map.hotels['Hotel Uno']['rooms']),
+                             1000)
+            self.assertTrue(hotels_obj.reserve_room('Hotel Uno', '000'))
+            occupancy = hotels_obj.occupancy('Hotel Uno')
+            self.assertEqual((occupancy.reserved, occupancy.available),
+                             (401, 599))
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_open_neg_path_1(self):
+        # Path 1: File that is not a room map or has another version
+        with open(self.path, 'wb') as stream:
+            stream.write(HEADER.pack(b'NOTAMAP!', 1, 0))
+        with self.assertRaises(ValueError):
+            RoomMap(self.path)
+        with open(self.path, 'wb') as stream:
+            stream.write(HEADER.pack(MAP_MAGIC, MAP_VERSION + 1, 0))
+        with self.assertRaises(ValueError):
+            RoomMap(self.path)
+
+    def test_add_hotel_neg_path_1(self):
+        # Path 1: Map full or name too long
+        with RoomMap.create(self.path, 1) as room_map:
+            with self.assertRaises(ValueError):
+                room_map.add_hotel('Hotel ' * 30, 'Monterrey')
+            room_map.add_hotel('Hotel Uno', 'Monterrey')
+            with self.assertRaises(ValueError):
+                room_map.add_hotel('Hotel Dos', 'Monterrey')
+
+    def test_read_only_neg_path_1(self):
+        # Path 1: Write on a map opened read-only
+        RoomMap.create(self.path, 1).close()
+        with RoomMap(self.path, writable=False) as room_map:
+            with self.assertRaises(TypeError):
+                room_map.add_hotel('Hotel Uno', 'Monterrey')
+
+    def test_rooms_neg_path_1(self):
+        # Path 1: Room or field that does not exist
+        with RoomMap.create(self.path, 1) as room_map:
+            room_map.hotels['Hotel Uno'] = {
+                'location': 'Monterrey',
+                'rooms': {'101': {'status': 'available', 'type': 'single'}}}
+            rooms = room_map.hotels['Hotel Uno']['rooms']
+            self.assertNotIn('102', rooms)
+            self.assertNotIn('abc', rooms)
+            with self.assertRaises(KeyError):
+                del rooms['102']
+            with self.assertRaises(KeyError):
+                rooms['101']['price'] = 100
+            with self.assertRaises(TypeError):
+                del rooms['101']['status']
+            with self.assertRaises(KeyError):
+                room_map.hotels.pop('Hotel Dos')
+            # Verifies the room byte of an available single room
+            self.assertEqual(
+                room_map.buffer[room_map.rooms_offset(0) + 101], 3)
+
+    def test_write_rooms_neg_path_1(self):
+        # Path 1: Room bytes of the wrong size, or written without
+        # their counts
+        with RoomMap.create(self.path, 1) as room_map:
+            slot = room_map.add_hotel('Hotel Uno', 'Monterrey')
+            with self.assertRaises(ValueError):
+                room_map.write_rooms(slot, bytes(10))
+            offset = room_map.rooms_offset(slot)
+            room_map.buffer[offset] = ROOM_CODES[('available', 'single')]
+            rooms = room_map.hotels['Hotel Uno']['rooms']
+            with self.assertRaises(ValueError):
+                rooms['000']['status'] = 'reserved'
+            self.assertEqual(rooms['000']['status'], 'available')
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(RoomMapTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('RoomMapTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -0,0 +1,290 @@
+"""
+Room Storage
+
+This program handles a compact storage for the rooms of a
+Hotel, where the status and type of each room are kept as
+one byte each in columns indexed by the room number
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+from collections.abc import MutableMapping
+
+# Byte codes of the room fields, 0 marks an empty slot
+STATUS_CODES = {'reserved': 1, 'available': 2}
+TYPE_CODES = {'single': 1, 'double': 2}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+
+ROOM_FIELDS = ('status', 'type')
+# Room number of each slot, and the (field, value) pairs of the rooms
+# of each (status, type) code, shared by the rooms that are rendered
+ROOM_NUMBERS = tuple(f'{slot:03d}' for slot in range(1000))
+DETAIL_ITEMS = {(status, room_type): (('status', STATUS_NAMES[status]),
+                                      ('type', TYPE_NAMES[room_type]))
+                for status in STATUS_NAMES for room_type in TYPE_NAMES}
+
+
+def room_slot(room_number):
+    """
+    This function converts a 3 digit room number into its slot
+
+    Args:
+        room_number (str): The room number
+
+    Returns:
+        int: The slot of the room
+
+    Raises:
+        KeyError: If the room number does not have 3 digits
+    """
+    if (not isinstance(room_number, str) or len(room_number) != 3
+            or not room_number.isdigit()):
+        raise KeyError(room_number)
+    return int(room_number)
+
+
+class CompactRoom(MutableMapping):
+    """
+    Class to view the fields of one room of a CompactRooms storage
+    as a dictionary with the 'status' and 'type' keys
+    """
+    __slots__ = ('_rooms', '_slot')
+
+    def __init__(self, rooms, slot):
+        """
+        Initializes the CompactRoom object
+
+        Args:
+            rooms (CompactRooms): The storage that holds the room
+            slot (int): The slot of the room
+
+        Returns:
+            None
+        """
+        self._rooms = rooms
+        self._slot = slot
+
+    def __getitem__(self, field):
+        """
+        This method reads a field of the room
+
+        Args:
+            field (str): 'status' or 'type'
+
+        Returns:
+            str: The value of the field
+        """
+        if field == 'status':
+            return STATUS_NAMES[self._rooms.status[self._slot]]
+        if field == 'type':
+            return TYPE_NAMES[self._rooms.types[self._slot]]
+        raise KeyError(field)
+
+    def __setitem__(self, field, value):
+        """
+        This method writes a field of the room
+
+        Args:
+            field (str): 'status' or 'type'
+            value (str): The new value of the field
+
+        Returns:
+            None
+        """
+        if field == 'status':
+            self._rooms.status[self._slot] = STATUS_CODES[value]
+        elif field == 'type':
+            self._rooms.types[self._slot] = TYPE_CODES[value]
+        else:
+            raise KeyError(field)
+
+    def __delitem__(self, field):
+        """
+        This method rejects removing a field, every room keeps both
+
+        Args:
+            field (str): The field to be removed
+
+        Returns:
+            None
+        """
+        raise TypeError('Room fields cannot be removed')
+
+    def __iter__(self):
+        """
+        This method iterates over the fields of the room
+
+        Returns:
+            iterator: The field names
+        """
+        return iter(ROOM_FIELDS)
+
+    def __len__(self):
+        """
+        This method returns the number of fields of the room
+
+        Returns:
+            int: The number of fields
+        """
+        return len(ROOM_FIELDS)
+
+    def __repr__(self):
+        """
+        This method represents the room as a dictionary
+
+        Returns:
+            str: The representation of the room
+        """
+        return repr(dict(self))
+
+
+class CompactRooms(MutableMapping):
+    """
+    Class to keep the rooms of a Hotel as two byte columns (status
+    and type) indexed by the room number, which behaves as the
+    dictionary of room dictionaries it replaces
+    """
+    def __init__(self, status=None, types=None):
+        """
+        Initializes the CompactRooms object
+
+        Args:
+            status (bytearray): The status column (if applicable)
+            types (bytearray): The type column (if applicable)
+
+        Returns:
+            None
+        """
+        self.status = bytearray() if status is None else status
+        self.types = bytearray() if types is None else types
+        self._count = sum(1 for code in self.status if code)
+
+    def __getitem__(self, room_number):
+        """
+        This method returns a view of a room
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            CompactRoom: The view of the room
+        """
+        slot = room_slot(room_number)
+        if slot >= len(self.status) or not self.status[slot]:
+            raise KeyError(room_number)
+        return CompactRoom(self, slot)
+
+    def __setitem__(self, room_number, room_details):
+        """
+        This method stores a room
+
+        Args:
+            room_number (str): The room number
+            room_details (dict): The 'status' and 'type' of the room
+
+        Returns:
+            None
+        """
+        slot = room_slot(room_number)
+        status = STATUS_CODES[room_details['status']]
+        room_type = TYPE_CODES[room_details['type']]
+        if slot >= len(self.status):
+            missing = slot + 1 - len(self.status)
+            self.status.extend(bytes(missing))
+            self.types.extend(bytes(missing))
+        if not self.status[slot]:
+            self._count += 1
+        self.status[slot] = status
+        self.types[slot] = room_type
+
+    def __delitem__(self, room_number):
+        """
+        This method removes a room
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            None
+        """
+        slot = room_slot(room_number)
+        if slot >= len(self.status) or not self.status[slot]:
+            raise KeyError(room_number)
+        self.status[slot] = 0
+        self.types[slot] = 0
+        self._count -= 1
+
+    def __contains__(self, room_number):
+        """
+        This method checks whether a room exists
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            bool: True if the room exists, False otherwise
+        """
+        try:
+            slot = room_slot(room_number)
+        except KeyError:
+            return False
+        return slot < len(self.status) and self.status[slot] != 0
+
+    def __iter__(self):
+        """
+        This method iterates over the room numbers in ascending order
+
+        Returns:
+            iterator: The room numbers
+        """
+        for slot, code in enumerate(self.status):
+            if code:
+                yield f'{slot:03d}'
+
+    def __len__(self):
+        """
+        This method returns the number of rooms
+
+        Returns:
+            int: The number of rooms
+        """
+        return self._count
+
+    def items(self):
+        """
+        This method reads all the rooms at once, without a view per
+        room. The room dictionaries are copies, changes to them are not
+        stored
+
+        Returns:
+            list: (room_number, room_details) tuples in ascending order
+        """
+        return [(f'{slot:03d}', {'status': STATUS_NAMES[code],
+                                 'type': TYPE_NAMES[room_type]})
+                for slot, (code, room_type)
+                in enumerate(zip(self.status, self.types)) if code]
+
+    def detail_items(self):
+        """
+        This method reads the rooms from the columns one at a time,
+        without a dictionary per room
+
+        Returns:
+            iterator: (room_number, details) tuples in ascending order,
+            the details are the ('status', value) and ('type', value)
+            pairs of the room
+        """
+        return ((room_number, DETAIL_ITEMS[(code, room_type)])
+                for room_number, code, room_type
+                in zip(ROOM_NUMBERS, self.status, self.types) if code)
+
+    def __repr__(self):
+        """
+        This method represents the rooms as a dictionary
+
+        Returns:
+            str: The representation of the rooms
+        """
+        return repr({room_number: dict(room)
+                     for room_number, room in self.items()})
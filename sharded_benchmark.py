@@ -0,0 +1,121 @@
+"""
+Sharded Benchmark
+
+This program measures the reservations per second of the sharded
+engine for 1, 2, 4 and 8 shards (processes), next to a single
+Reservations object in the same process
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import time
+
+from customers import Customers
+from hotels import Hotels
+from reservations import Reservations
+from sharded_engine import ShardedReservations
+
+SHARD_COUNTS = [1, 2, 4, 8]
+HOTELS = 256
+ROOMS_PER_HOTEL = 100
+BATCH_SIZE = 2_000
+
+
+def build_requests():
+    """
+    This function builds a reservation request for every room of
+    every Hotel, spread over the Hotels
+
+    Returns:
+        list: ('create_customer_reservation', args) tuples
+    """
+    requests = []
+    for room in range(1, ROOMS_PER_HOTEL + 1):
+        for hotel in range(HOTELS):
+            reservation_id = f'{len(requests):06d}'
+            requests.append(('create_customer_reservation',
+                             (reservation_id, '1000', f'Hotel {hotel}',
+                              f'{room:03d}')))
+    return requests
+
+
+def rooms_info():
+    """
+    This function builds the rooms of one Hotel
+
+    Returns:
+        dict: The room details by room number
+    """
+    return {f'{room:03d}': {'status': 'available', 'type': 'single'}
+            for room in range(1, ROOMS_PER_HOTEL + 1)}
+
+
+def measure_single(requests):
+    """
+    This function measures the reservations per second of a single
+    Reservations object
+
+    Args:
+        requests (list): The reservation requests
+
+    Returns:
+        float: Reservations per second
+    """
+    hotels_obj = Hotels(sink=None)
+    customers_obj = Customers(sink=None)
+    customers_obj.create_customer('1000', 'Bench Customer',
+                                  'bench@gmail.com', '8112345678')
+    reservations_obj = Reservations(hotels_obj, customers_obj, sink=None)
+    for hotel in range(HOTELS):
+        hotels_obj.create_hotel(f'Hotel {hotel}', 'Monterrey', rooms_info())
+
+    start = time.perf_counter()
+    for _, args in requests:
+        reservations_obj.create_customer_reservation(*args)
+    return len(requests) / (time.perf_counter() - start)
+
+
+def measure_sharded(requests, shards):
+    """
+    This function measures the reservations per second of the sharded
+    engine, sending the requests in batches
+
+    Args:
+        requests (list): The reservation requests
+        shards (int): The number of shards
+
+    Returns:
+        float: Reservations per second
+    """
+    customers_obj = Customers(sink=None)
+    customers_obj.create_customer('1000', 'Bench Customer',
+                                  'bench@gmail.com', '8112345678')
+    with ShardedReservations(shards, customers_obj) as engine:
+        engine.execute_many([('create_hotel', (f'Hotel {hotel}',
+                                               'Monterrey', rooms_info()))
+                             for hotel in range(HOTELS)])
+        start = time.perf_counter()
+        for first in range(0, len(requests), BATCH_SIZE):
+            engine.execute_many(requests[first:first + BATCH_SIZE])
+        elapsed = time.perf_counter() - start
+    return len(requests) / elapsed
+
+
+def main():
+    """
+    Main function, prints the reservations per second of each setup
+
+    Returns:
+        None
+    """
+    requests = build_requests()
+    print(f'{len(requests)} reservations in {HOTELS} hotels, '
+          f'batches of {BATCH_SIZE}')
+    print(f'{"shards":>8} {"reservations/s":>15}')
+    print(f'{"none":>8} {measure_single(requests):>15.0f}')
+    for shards in SHARD_COUNTS:
+        print(f'{shards:>8} {measure_sharded(requests, shards):>15.0f}')
+
+
+if __name__ == '__main__':
+    main()
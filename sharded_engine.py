@@ -0,0 +1,433 @@
+"""
+Sharded Engine
+
+This program handles a reservations engine split into worker
+processes (shards). Each Hotel belongs to the shard given by the
+hash of its name, which keeps the Hotel and its reservations,
+while the customers are copied to every shard
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import multiprocessing
+import os
+import zlib
+from collections.abc import Iterator
+
+from customers import Customers
+from events import Result
+from hotels import Hotels
+from reservations import Reservations
+
+# Requests a shard accepts, with the object of the shard that runs them
+SHARD_METHODS = {
+    'create_hotel': 'hotels',
+    'create_hotel_bulk': 'hotels',
+    'delete_hotel': 'hotels',
+    'search_availability': 'hotels',
+    'insert_customer': 'customers',
+    'create_customer_reservation': 'reservations',
+    'cancel_customer_reservation': 'reservations',
+    'find_customer_reservations': 'reservations',
+    'find_hotel_reservations': 'reservations',
+    'find_room_reservations': 'reservations'
+}
+
+
+def shard_for(hotel_name, shards):
+    """
+    This function chooses the shard of a Hotel. CRC-32 is used instead
+    of hash() because it gives the same value in every process
+
+    Args:
+        hotel_name (str): The name of the Hotel
+        shards (int): The number of shards
+
+    Returns:
+        int: The number of the shard
+    """
+    return zlib.crc32(hotel_name.encode('utf-8')) % shards
+
+
+def run_request(objects, method_name, args):
+    """
+    This function runs one request on the objects of a shard
+
+    Args:
+        objects (dict): The Hotels, Customers and Reservations objects
+        of the shard
+        method_name (str): The name of the method, from SHARD_METHODS
+        args (tuple): The arguments of the method
+
+    Returns:
+        object: The value returned by the method, iterators are read
+        into lists so they can be sent back
+    """
+    method = getattr(objects[SHARD_METHODS[method_name]], method_name)
+    value = method(*args)
+    if isinstance(value, Iterator):
+        value = list(value)
+    return value
+
+
+def serve_shard(connection, customers_info):
+    """
+    This function runs in the process of a shard. It answers batches
+    of requests until it receives None
+
+    Args:
+        connection (Connection): The end of the pipe of the shard
+        customers_info (dict): The information of the customers by ID
+
+    Returns:
+        None
+    """
+    hotels_obj = Hotels(sink=None)
+    customers_obj = Customers(sink=None)
+    for customer_id, info in customers_info.items():
+        customers_obj.insert_customer(customer_id, info['name'],
+                                      info['email'], info['phone'])
+    objects = {
+        'hotels': hotels_obj,
+        'customers': customers_obj,
+        'reservations': Reservations(hotels_obj, customers_obj, sink=None)
+    }
+
+    while True:
+        batch = connection.recv()
+        if batch is None:
+            break
+        replies = []
+        for method_name, args in batch:
+            try:
+                replies.append((True, run_request(objects, method_name,
+                                                  args)))
+            except (AttributeError, KeyError, TypeError,
+                    ValueError) as error:
+                replies.append((False, error))
+        connection.send(replies)
+    connection.close()
+
+
+class ShardedReservations:
+    """
+    Class to route the Hotels and reservations operations to the shard
+    of each Hotel. The customers are kept by the front-end, which is
+    the only one that changes them, and copied to the shards
+    """
+    def __init__(self, shards=None, customers=None):
+        """
+        Initializes the ShardedReservations object
+
+        Args:
+            shards (int): The number of worker processes, the number
+            of CPUs when not given
+            customers (Customers): The customers to be copied to the
+            shards (if applicable)
+
+        Returns:
+            None
+        """
+        self.shards = shards or os.cpu_count() or 1
+        self.customers_instance = \
+            customers if customers is not None else Customers(sink=None)
+        # Shard of each reservation ID, kept to route cancellations
+        self._reservation_shards = {}
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self):
+        """
+        This method starts the shards at the start of a with block
+
+        Returns:
+            ShardedReservations: The engine
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        This method stops the shards at the end of a with block
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def start(self):
+        """
+        This method starts one process per shard, each with a copy of
+        the customers
+
+        Returns:
+            None
+        """
+        customers_info = {customer_id: dict(info) for customer_id, info
+                          in self.customers_instance.customers.items()}
+        for _ in range(self.shards):
+            connection, shard_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=serve_shard, args=(shard_connection,
+                                          customers_info),
+                daemon=True)
+            process.start()
+            shard_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def close(self):
+        """
+        This method stops the shards
+
+        Returns:
+            None
+        """
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def execute_many(self, requests):
+        """
+        This method runs a list of requests. The requests of each shard
+        are sent as one batch, and all the shards work at the same time
+
+        Args:
+            requests (list): (method_name, args) tuples, the first
+            argument of the Hotel requests is the Hotel name and the
+            shard of the reservation requests is found by the method
+
+        Returns:
+            list: The values returned for each request, in order
+        """
+        batches = [[] for _ in range(self.shards)]
+        positions = [[] for _ in range(self.shards)]
+        values = [None] * len(requests)
+        for position, (method_name, args) in enumerate(requests):
+            shard = self._route(method_name, args)
+            if isinstance(shard, Result):
+                values[position] = shard
+                continue
+            batches[shard].append((method_name, tuple(args)))
+            positions[shard].append(position)
+
+        for shard, batch in enumerate(batches):
+            if batch:
+                self._connections[shard].send(batch)
+        errors = []
+        for shard, batch in enumerate(batches):
+            if not batch:
+                continue
+            # Every shard is read before raising, so no reply is left
+            # in a pipe
+            replies = self._connections[shard].recv()
+            for position, (succeeded, value) in zip(positions[shard],
+                                                    replies):
+                if not succeeded:
+                    errors.append(value)
+                    self._record(*requests[position], None)
+                    continue
+                values[position] = value
+                self._record(*requests[position], value)
+        if errors:
+            raise errors[0]
+        return values
+
+    def _route(self, method_name, args):
+        """
+        This method chooses the shard of a request
+
+        Args:
+            method_name (str): The name of the method
+            args (tuple): The arguments of the method
+
+        Returns:
+            int: The number of the shard, or a failed Result when the
+            request can be answered without a shard
+        """
+        if method_name not in SHARD_METHODS or method_name in (
+                'insert_customer', 'search_availability',
+                'find_customer_reservations'):
+            raise ValueError(f'Unsupported request: {method_name}')
+
+        if method_name == 'cancel_customer_reservation':
+            shard = self._reservation_shards.get(args[0])
+            if shard is None:
+                return Result(False, 'Reservation does not exist')
+            return shard
+
+        if method_name == 'create_customer_reservation':
+            # The ID is claimed here, every shard only knows its own IDs
+            if args[0] in self._reservation_shards:
+                return Result(False, 'Reservation already created')
+            shard = shard_for(args[2], self.shards)
+            self._reservation_shards[args[0]] = shard
+            return shard
+
+        return shard_for(args[0], self.shards)
+
+    def _record(self, method_name, args, value):
+        """
+        This method updates the shards of the reservation IDs after a
+        request has been answered
+
+        Args:
+            method_name (str): The name of the method
+            args (tuple): The arguments of the method
+            value (object): The value returned by the shard
+
+        Returns:
+            None
+        """
+        if method_name == 'create_customer_reservation' and not value:
+            # Frees the ID claimed by _route
+            self._reservation_shards.pop(args[0], None)
+        elif method_name == 'cancel_customer_reservation' and value:
+            self._reservation_shards.pop(args[0], None)
+
+    def _broadcast(self, method_name, *args):
+        """
+        This method runs a request on every shard
+
+        Args:
+            method_name (str): The name of the method
+            args (tuple): The arguments of the method
+
+        Returns:
+            list: The value returned by each shard
+        """
+        for connection in self._connections:
+            connection.send([(method_name, args)])
+        replies = [connection.recv()[0] for connection
+                   in self._connections]
+        for succeeded, value in replies:
+            if not succeeded:
+                raise value
+        return [value for _, value in replies]
+
+    def create_hotel(self, hotel_name, location, rooms_info):
+        """
+        This method creates a Hotel in its shard
+
+        Args:
+            hotel_name (str): The name of the Hotel to be created
+            location (str): The location of the Hotel
+            rooms_info (dict): The room details by room number
+
+        Returns:
+            Result: The outcome of the creation
+        """
+        return self.execute_many([('create_hotel', (hotel_name, location,
+                                                    rooms_info))])[0]
+
+    def create_customer(self, customer_id, name, email, phone):
+        """
+        This method creates a customer in the front-end and copies it
+        to every shard
+
+        Args:
+            customer_id (str): The ID of the customer to be created
+            name (str): The name of the customer
+            email (str): The email of the customer
+            phone (str): The phone number of the customer
+
+        Returns:
+            Result: The outcome of the creation
+        """
+        result = self.customers_instance.create_customer(customer_id, name,
+                                                         email, phone)
+        if result and self._connections:
+            self._broadcast('insert_customer', customer_id, name, email,
+                            phone)
+        return result
+
+    def create_customer_reservation(self, reservation_id, customer_id,
+                                    hotel_name, room_number,
+                                    check_in=None, check_out=None):
+        """
+        This method creates a reservation in the shard of the Hotel
+
+        Args:
+            reservation_id (str): The ID of the reservation
+            customer_id (str): The ID of the customer
+            hotel_name (str): The name of the Hotel
+            room_number (str): The number of the reserved room
+            check_in (str or date): The first night of the stay
+            (if applicable)
+            check_out (str or date): The day the stay ends
+            (if applicable)
+
+        Returns:
+            Result: The outcome of the reservation
+        """
+        return self.execute_many([('create_customer_reservation',
+                                   (reservation_id, customer_id,
+                                    hotel_name, room_number, check_in,
+                                    check_out))])[0]
+
+    def cancel_customer_reservation(self, reservation_id):
+        """
+        This method cancels a reservation in the shard that holds it
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            Result: The outcome of the cancellation
+        """
+        return self.execute_many([('cancel_customer_reservation',
+                                   (reservation_id,))])[0]
+
+    def find_hotel_reservations(self, hotel_name):
+        """
+        This method finds the reservations of a Hotel in its shard
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            list: The reservations of the Hotel
+        """
+        return self.execute_many([('find_hotel_reservations',
+                                   (hotel_name,))])[0]
+
+    def find_customer_reservations(self, customer_id):
+        """
+        This method finds the reservations of a customer in all the
+        shards
+
+        Args:
+            customer_id (str): The ID of the customer
+
+        Returns:
+            list: The reservations of the customer
+        """
+        return [reservation for values
+                in self._broadcast('find_customer_reservations',
+                                   customer_id)
+                for reservation in values]
+
+    def search_availability(self, location=None, room_type=None,
+                            check_in=None, check_out=None):
+        """
+        This method searches the available rooms in all the shards
+
+        Args:
+            location (str): The location of the Hotels (if applicable)
+            room_type (str): The type of room (if applicable)
+            check_in (str or date): The first night of the stay
+            (if applicable)
+            check_out (str or date): The day the stay ends
+            (if applicable)
+
+        Returns:
+            list: (hotel_name, room_number) tuples of free rooms
+        """
+        return [room for values
+                in self._broadcast('search_availability', location,
+                                   room_type, check_in, check_out)
+                for room in values]
@@ -0,0 +1,143 @@
+"""
+Sharded Engine Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- shard_for()
+- create_customer_reservation()
+- cancel_customer_reservation()
+- execute_many()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import unittest
+from customers import Customers
+from sharded_engine import ShardedReservations, shard_for
+
+
+class ShardedEngineTest(unittest.TestCase):
+    """
+    Class to handle the ShardedReservations Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        customers_obj = Customers(sink=None)
+        customers_obj.create_customer('4444', 'Jose Lopez',
+                                      'jlopez@gmail.com', '6643127401')
+        self.engine = ShardedReservations(shards=2,
+                                          customers=customers_obj)
+        self.engine.start()
+        self.hotel_names = ['Hotel Uno', 'Hotel Dos', 'Hotel Tres']
+        for hotel_name in self.hotel_names:
+            self.engine.create_hotel(hotel_name, 'Monterrey',
+                                     {'101': {'status': 'available',
+                                              'type': 'single'}})
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.engine.close()
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_shard_for_happy_path(self):
+        # Verifies a Hotel always gets the same shard
+        self.assertEqual(shard_for('Hotel Uno', 4),
+                         shard_for('Hotel Uno', 4))
+        self.assertIn(shard_for('Hotel Uno', 4), range(4))
+
+    def test_create_customer_reservation_happy_path(self):
+        result = self.engine.create_customer_reservation(
+            '111111', '4444', 'Hotel Dos', '101')
+        self.assertTrue(result)
+        self.assertEqual(result.data['hotel_name'], 'Hotel Dos')
+        self.assertEqual(len(self.engine.find_hotel_reservations(
+            'Hotel Dos')), 1)
+        self.assertNotIn(('Hotel Dos', '101'),
+                         self.engine.search_availability())
+
+    def test_cancel_customer_reservation_happy_path(self):
+        self.engine.create_customer_reservation('111111', '4444',
+                                                'Hotel Tres', '101')
+        self.assertTrue(
+            self.engine.cancel_customer_reservation('111111'))
+        self.assertEqual(self.engine.find_customer_reservations('4444'),
+                         [])
+
+    def test_execute_many_happy_path(self):
+        results = self.engine.execute_many(
+            [('create_customer_reservation',
+              (f'{number:06d}', '4444', hotel_name, '101'))
+             for number, hotel_name in enumerate(self.hotel_names)])
+        # Verifies the results keep the order of the requests
+        self.assertEqual([result.data['hotel_name'] for result
+                          in results], self.hotel_names)
+        self.assertEqual(len(self.engine.find_customer_reservations(
+            '4444')), 3)
+
+    def test_create_customer_happy_path(self):
+        self.engine.create_customer('5555', 'Ana Perez',
+                                    'aperez@gmail.com', '6643127402')
+        # Verifies the shards received the new customer
+        self.assertTrue(self.engine.create_customer_reservation(
+            '111111', '5555', 'Hotel Uno', '101'))
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_create_customer_reservation_neg_path_1(self):
+        # Path 1: Reservation ID used in another shard
+        self.engine.create_customer_reservation('111111', '4444',
+                                                'Hotel Uno', '101')
+        result = self.engine.create_customer_reservation(
+            '111111', '4444', 'Hotel Dos', '101')
+        self.assertFalse(result)
+        self.assertEqual(result.message, 'Reservation already created')
+
+    def test_create_customer_reservation_neg_path_2(self):
+        # Path 2: Room not available, the ID can be used again
+        self.engine.create_customer_reservation('111111', '4444',
+                                                'Hotel Uno', '101')
+        self.assertFalse(self.engine.create_customer_reservation(
+            '222222', '4444', 'Hotel Uno', '101'))
+        self.assertTrue(self.engine.create_customer_reservation(
+            '222222', '4444', 'Hotel Dos', '101'))
+
+    def test_cancel_customer_reservation_neg_path_1(self):
+        # Path 1: Reservation that does not exist
+        result = self.engine.cancel_customer_reservation('999999')
+        self.assertFalse(result)
+        self.assertEqual(result.message, 'Reservation does not exist')
+
+    def test_execute_many_neg_path_1(self):
+        # Path 1: Request that the shards do not run
+        with self.assertRaises(ValueError):
+            self.engine.execute_many([('display_hotel_information',
+                                       ('Hotel Uno',))])
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(ShardedEngineTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('ShardedEngineTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
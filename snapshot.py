@@ -0,0 +1,324 @@
+"""
+Snapshot
+
+This program handles the saving and loading of the Hotels,
+Customers and Reservations to a versioned snapshot file, so the
+state can be restored after a restart without creating every
+Hotel, customer and reservation again
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import gc
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date
+
+from locking import NULL_LOCK
+
+SNAPSHOT_MAGIC = b'HOTELSNAP'
+SNAPSHOT_VERSION = 3
+
+# One character codes of the room fields in the snapshot
+STATUS_CHARS = {'available': 'a', 'reserved': 'r'}
+TYPE_CHARS = {'single': 's', 'double': 'd'}
+STATUS_VALUES = {char: status for status, char in STATUS_CHARS.items()}
+TYPE_VALUES = {char: room_type for room_type, char in TYPE_CHARS.items()}
+
+
+@dataclass
+class SnapshotSummary:
+    """
+    Class to summarize a snapshot that was saved or loaded
+    """
+    path: str
+    hotels: int = 0
+    rooms: int = 0
+    customers: int = 0
+    reservations: int = 0
+    # Last journal record included in the snapshot
+    seq: int = 0
+    size: int = 0
+    elapsed: float = 0.0
+
+
+def encode_hotels(hotels):
+    """
+    This function encodes the Hotels, the rooms of each Hotel are kept
+    as three strings: the room numbers one after the other, and one
+    character per room for its status and its type
+
+    Args:
+        hotels (Hotels): The Hotels object
+
+    Returns:
+        list: [hotel_id, hotel_name, location, numbers, status, types]
+        lists
+    """
+    records = []
+    for hotel_name, hotel in list(hotels.hotels.items()):
+        with hotels.hotel_lock(hotel_name) or NULL_LOCK:
+            rooms = [(room_number, room['status'], room['type'])
+                     for room_number, room in hotel['rooms'].items()]
+        records.append([hotel['hotel_id'], hotel_name, hotel['location'],
+                        ''.join(room[0] for room in rooms),
+                        ''.join(STATUS_CHARS[room[1]] for room in rooms),
+                        ''.join(TYPE_CHARS[room[2]] for room in rooms)])
+    return records
+
+
+def encode_state(reservations, seq=0):
+    """
+    This function encodes the Hotels, customers and reservations into
+    the payload of a snapshot
+
+    Args:
+        reservations (Reservations): The Reservations object, which
+        holds the Hotels and Customers objects
+        seq (int): The number of the last journal record applied to
+        the objects (if applicable)
+
+    Returns:
+        dict: The payload, made of lists of strings
+    """
+    customers = reservations.customers_instance.customers
+    return {
+        'seq': seq,
+        'hotels': encode_hotels(reservations.hotels_instance),
+        'customers': [[customer_id, info['name'], info['email'],
+                       info['phone']]
+                      for customer_id, info in list(customers.items())],
+        'reservations': [
+            [reservation['reservation_id'], reservation['customer_id'],
+             reservation['hotel_id'],
+             reservations.current_hotel_name(reservation),
+             reservation['room_number'],
+             None if reservation['check_in'] is None
+             else reservation['check_in'].isoformat(),
+             None if reservation['check_out'] is None
+             else reservation['check_out'].isoformat()]
+            for reservation in reservations.reservations]
+    }
+
+
+def write_file_atomically(path, *chunks):
+    """
+    This function replaces a file with new contents. They are written
+    to a temporary file in the same folder, flushed to disk and renamed
+    over the file, so a crash leaves either the old or the new file,
+    never a half written one
+
+    Args:
+        path (str): The path of the file
+        chunks (bytes): The contents of the file
+
+    Returns:
+        None
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    descriptor, temp_path = tempfile.mkstemp(
+        dir=folder, prefix=f'.{os.path.basename(path)}-')
+    try:
+        with os.fdopen(descriptor, 'wb') as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_snapshot(path, state):
+    """
+    This function writes an encoded state to a snapshot file
+
+    Args:
+        path (str): The path of the snapshot file
+        state (dict): The payload, from encode_state
+
+    Returns:
+        SnapshotSummary: The summary of the saved snapshot
+    """
+    start = time.perf_counter()
+    payload = json.dumps(state, separators=(',', ':')).encode('utf-8')
+    header = b'%s %d %s %d\n' % (SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                  hashlib.sha256(payload).hexdigest()
+                                  .encode('ascii'), len(payload))
+    write_file_atomically(path, header, payload)
+
+    return SnapshotSummary(
+        path, hotels=len(state['hotels']),
+        rooms=sum(len(record[4]) for record in state['hotels']),
+        customers=len(state['customers']),
+        reservations=len(state['reservations']), seq=state['seq'],
+        size=len(header) + len(payload),
+        elapsed=time.perf_counter() - start)
+
+
+def save_snapshot(path, reservations, seq=0):
+    """
+    This function saves the full state to a snapshot file, which is
+    replaced atomically (see write_file_atomically). Writes should be
+    paused while it runs, so the Hotels and the reservations agree
+
+    Args:
+        path (str): The path of the snapshot file
+        reservations (Reservations): The Reservations object, which
+        holds the Hotels and Customers objects
+        seq (int): The number of the last journal record applied to
+        the objects (if applicable)
+
+    Returns:
+        SnapshotSummary: The summary of the saved snapshot
+    """
+    start = time.perf_counter()
+    summary = write_snapshot(path, encode_state(reservations, seq))
+    summary.elapsed = time.perf_counter() - start
+    return summary
+
+
+def read_snapshot(path):
+    """
+    This function reads a snapshot file and checks its header
+
+    Args:
+        path (str): The path of the snapshot file
+
+    Returns:
+        dict: The payload of the snapshot
+
+    Raises:
+        ValueError: If the file is not a snapshot, has another version
+        or its checksum does not match its contents
+    """
+    with open(path, 'rb') as stream:
+        header = stream.readline()
+        payload = stream.read()
+
+    fields = header.split()
+    if len(fields) != 4 or fields[0] != SNAPSHOT_MAGIC:
+        raise ValueError(f'{path} is not a snapshot file')
+
+    if fields[1] != b'%d' % SNAPSHOT_VERSION:
+        raise ValueError('Unsupported snapshot version: '
+                         f'{fields[1].decode("ascii", "replace")}')
+
+    if (fields[3] != b'%d' % len(payload) or
+            fields[2] != hashlib.sha256(payload).hexdigest()
+            .encode('ascii')):
+        raise ValueError(f'{path} is corrupted, its checksum does not '
+                         'match')
+
+    return json.loads(payload)
+
+
+def insert_state(state, reservations, summary):
+    """
+    This function inserts the payload of a snapshot into the objects,
+    without validating the items
+
+    Args:
+        state (dict): The payload of the snapshot
+        reservations (Reservations): The Reservations object, which
+        holds the Hotels and Customers objects
+        summary (SnapshotSummary): The summary the counts are added to
+
+    Returns:
+        None
+    """
+    hotels = reservations.hotels_instance
+    customers = reservations.customers_instance
+    for (hotel_id, hotel_name, location, numbers, status,
+         types) in state['hotels']:
+        rooms_info = {
+            numbers[3 * position:3 * position + 3]:
+                {'status': STATUS_VALUES[status_char],
+                 'type': TYPE_VALUES[type_char]}
+            for position, (status_char, type_char)
+            in enumerate(zip(status, types))}
+        hotels.insert_hotel(hotel_name, location, rooms_info, hotel_id)
+        summary.hotels += 1
+        summary.rooms += len(rooms_info)
+
+    for customer_id, name, email, phone in state['customers']:
+        customers.insert_customer(customer_id, name, email, phone)
+    summary.customers = len(state['customers'])
+
+    for (reservation_id, customer_id, hotel_id, saved_name, room_number,
+         check_in, check_out) in state['reservations']:
+        # The reservations refer to the Hotels by ID, so they take the
+        # current name of the Hotel, or the last name known if it was
+        # deleted
+        hotels.hotel_ids.retire(hotel_id)
+        hotel_name = hotels.hotel_ids.name(hotel_id)
+        if check_in is not None:
+            check_in = date.fromisoformat(check_in)
+            check_out = date.fromisoformat(check_out)
+            # The room status was saved with the rooms, only the
+            # bookings of date ranges have to be rebuilt. The bookings
+            # of deleted Hotels are not rebuilt
+            if hotel_name is not None:
+                hotels.try_book_room(hotel_name, room_number, check_in,
+                                     check_out)
+        if hotel_name is None:
+            hotel_name = saved_name
+        reservations.reservations.add({
+            'reservation_id': reservation_id,
+            'customer_id': customer_id,
+            'hotel_id': hotel_id,
+            'hotel_name': hotel_name,
+            'room_number': room_number,
+            'check_in': check_in,
+            'check_out': check_out
+        })
+    summary.reservations = len(state['reservations'])
+    summary.seq = state['seq']
+
+
+def load_snapshot(path, reservations):
+    """
+    This function loads a snapshot into empty Hotels, Customers and
+    Reservations objects. The checksum proves the snapshot is the one
+    that was saved from valid objects, so the items are inserted
+    without being validated again and without printing
+
+    Args:
+        path (str): The path of the snapshot file
+        reservations (Reservations): The empty Reservations object,
+        which holds the empty Hotels and Customers objects
+
+    Returns:
+        SnapshotSummary: The summary of the loaded snapshot
+
+    Raises:
+        ValueError: If the snapshot cannot be read (see read_snapshot)
+        or the objects are not empty
+    """
+    start = time.perf_counter()
+    hotels = reservations.hotels_instance
+    customers = reservations.customers_instance
+    if hotels.hotels or customers.customers or len(
+            reservations.reservations):
+        raise ValueError('A snapshot can only be loaded into empty '
+                         'objects')
+
+    state = read_snapshot(path)
+    summary = SnapshotSummary(path, size=os.path.getsize(path))
+    # The cyclic garbage collector is paused while the objects are
+    # created, it would otherwise scan them again and again
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        insert_state(state, reservations, summary)
+    finally:
+        if collecting:
+            gc.enable()
+    summary.elapsed = time.perf_counter() - start
+    return summary
@@ -0,0 +1,92 @@
+"""
+Snapshot Benchmark
+
+This program measures the time taken to save and load a
+snapshot of one million rooms, with the customers and
+reservations, for each storage layout
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import os
+import tempfile
+import time
+
+from customers import Customers
+from hotels import Hotels
+from reservations import Reservations
+from snapshot import load_snapshot, save_snapshot
+
+HOTELS = 1000
+ROOMS_PER_HOTEL = 1000
+# Customer IDs have 4 digits, so 10000 is the most there can be
+CUSTOMERS = 10000
+RESERVATIONS = 100000
+
+
+def new_reservations(compact):
+    """
+    This function creates empty objects that do not print
+
+    Args:
+        compact (bool): True to use the compact storages
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    return Reservations(Hotels(compact=compact, sink=None),
+                        Customers(compact=compact, sink=None), sink=None)
+
+
+def build_state():
+    """
+    This function builds the Hotels, customers and reservations to be
+    saved, half of the reservations with dates
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    reservations_obj = new_reservations(compact=False)
+    hotels_obj = reservations_obj.hotels_instance
+    for number in range(HOTELS):
+        hotels_obj.create_hotel_bulk(f'Hotel {number}', 'Monterrey',
+                                     room_range=range(ROOMS_PER_HOTEL),
+                                     room_types=('single', 'double'))
+    for number in range(CUSTOMERS):
+        reservations_obj.customers_instance.insert_customer(
+            f'{number:04d}', f'Customer {number}',
+            f'customer{number}@mail.com', f'{6640000000 + number}')
+    for number in range(RESERVATIONS):
+        dates = ((None, None) if number % 2 else
+                 ('2024-05-01', '2024-05-04'))
+        reservations_obj.create_customer_reservation(
+            f'{number:06d}', f'{number % CUSTOMERS:04d}',
+            f'Hotel {number % HOTELS}',
+            f'{number // HOTELS % ROOMS_PER_HOTEL:03d}', *dates)
+    return reservations_obj
+
+
+def main():
+    """
+    Main function, prints the save and load times
+
+    Returns:
+        None
+    """
+    reservations_obj = build_state()
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'state.snap')
+        summary = save_snapshot(path, reservations_obj)
+        print(f'{summary.rooms} rooms, {summary.customers} customers, '
+              f'{summary.reservations} reservations')
+        print(f'save: {summary.elapsed:.2f} s, '
+              f'{summary.size / 1e6:.1f} MB')
+        for compact in (False, True):
+            start = time.perf_counter()
+            load_snapshot(path, new_reservations(compact))
+            layout = 'compact' if compact else 'dict'
+            print(f'load ({layout}): {time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Snapshot Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following functions:
+
+- save_snapshot()
+- load_snapshot()
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from hotels import Hotels
+from customers import Customers
+from reservations import Reservations
+from snapshot import load_snapshot, save_snapshot
+
+
+def new_reservations(compact=False):
+    """
+    This function creates empty Hotels, Customers and Reservations
+    objects that do not print
+
+    Args:
+        compact (bool): True to use the compact storages
+
+    Returns:
+        Reservations: The Reservations object
+    """
+    return Reservations(Hotels(compact=compact, sink=None),
+                        Customers(compact=compact, sink=None), sink=None)
+
+
+class SnapshotTest(unittest.TestCase):
+    """
+    Class to handle the Snapshot Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'state.snap')
+        self.reservations_obj = new_reservations()
+        self.reservations_obj.hotels_instance.create_hotel(
+            'Hotel California', 'Tijuana',
+            {'101': {'status': 'available', 'type': 'single'},
+             '102': {'status': 'available', 'type': 'double'}})
+        self.reservations_obj.customers_instance.create_customer(
+            '4444', 'Jose Lopez', 'jlopez@gmail.com', '6643127401')
+        self.reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel California', '101')
+        self.reservations_obj.create_customer_reservation(
+            '222222', '4444', 'Hotel California', '102', '2024-05-01',
+            '2024-05-04')
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.folder.cleanup()
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_save_snapshot_happy_path(self):
+        summary = save_snapshot(self.path, self.reservations_obj)
+        self.assertEqual((summary.hotels, summary.rooms, summary.customers,
+                          summary.reservations), (1, 2, 1, 2))
+        self.assertEqual(summary.size, os.path.getsize(self.path))
+        # Verifies no temporary file is left in the folder
+        self.assertEqual(os.listdir(self.folder.name), ['state.snap'])
+
+    def test_load_snapshot_happy_path(self):
+        save_snapshot(self.path, self.reservations_obj)
+        loaded = new_reservations()
+        summary = load_snapshot(self.path, loaded)
+        self.assertEqual(summary.rooms, 2)
+        self.assertEqual(loaded.hotels_instance.hotels,
+                         self.reservations_obj.hotels_instance.hotels)
+        self.assertEqual(loaded.customers_instance.find_by_email(
+            'JLOPEZ@gmail.com'), ['4444'])
+        self.assertEqual(loaded.reservations.get('222222')['check_in'],
+                         date(2024, 5, 1))
+
+    def test_load_snapshot_rebuilds_indexes(self):
+        save_snapshot(self.path, self.reservations_obj)
+        loaded = new_reservations()
+        load_snapshot(self.path, loaded)
+        # Verifies the rebuilt calendar and availability index
+        self.assertFalse(loaded.create_customer_reservation(
+            '333333', '4444', 'Hotel California', '102', '2024-05-02',
+            '2024-05-03'))
+        self.assertIsNone(loaded.hotels_instance.find_available_room(
+            'Hotel California', 'single'))
+        self.assertTrue(loaded.cancel_customer_reservation('111111'))
+        self.assertEqual(loaded.hotels_instance.find_available_room(
+            'Hotel California', 'single'), '101')
+
+    def test_load_snapshot_compact(self):
+        save_snapshot(self.path, self.reservations_obj)
+        loaded = new_reservations(compact=True)
+        load_snapshot(self.path, loaded)
+        self.assertEqual(loaded.hotels_instance.hotels['Hotel California']
+                         ['rooms']['101']['status'], 'reserved')
+        self.assertEqual(loaded.customers_instance.customers['4444']
+                         ['name'], 'Jose Lopez')
+
+    def test_load_snapshot_deleted_hotel(self):
+        self.reservations_obj.hotels_instance.delete_hotel(
+            'Hotel California')
+        save_snapshot(self.path, self.reservations_obj)
+        loaded = new_reservations()
+        load_snapshot(self.path, loaded)
+        # Verifies the reservations keep the last name of the Hotel
+        reservation = loaded.reservations.get('222222')
+        self.assertEqual(loaded.current_hotel_name(reservation),
+                         'Hotel California')
+        self.assertTrue(loaded.cancel_customer_reservation('222222'))
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_load_snapshot_neg_path_1(self):
+        # Path 1: Snapshot changed after it was saved
+        save_snapshot(self.path, self.reservations_obj)
+        with open(self.path, 'r+b') as stream:
+            stream.seek(-5, os.SEEK_END)
+            stream.write(b'X')
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path, new_reservations())
+
+    def test_load_snapshot_neg_path_2(self):
+        # Path 2: File that is not a snapshot
+        with open(self.path, 'wb') as stream:
+            stream.write(b'{"hotels": []}\n')
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path, new_reservations())
+
+    def test_load_snapshot_neg_path_3(self):
+        # Path 3: Objects that are not empty
+        save_snapshot(self.path, self.reservations_obj)
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path, self.reservations_obj)
+
+    def test_load_snapshot_neg_path_4(self):
+        # Path 4: Snapshot of another version
+        save_snapshot(self.path, self.reservations_obj)
+        with open(self.path, 'rb') as stream:
+            contents = stream.read()
+        with open(self.path, 'wb') as stream:
+            stream.write(contents.replace(b'HOTELSNAP 3 ',
+                                          b'HOTELSNAP 9 ', 1))
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path, new_reservations())
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(SnapshotTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('SnapshotTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
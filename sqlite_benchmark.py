@@ -0,0 +1,107 @@
+"""
+SQLite Benchmark
+
+This program measures the operations per second of the
+common operations when the Hotels, Customers and Reservations
+are kept in memory and when they are kept in SQLite
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import os
+import tempfile
+import time
+
+from customers import Customers
+from hotels import Hotels
+from reservations import Reservations
+from sqlite_storage import SqliteStorage
+
+HOTELS = 100
+ROOMS_PER_HOTEL = 100
+CUSTOMERS = 1000
+RESERVATIONS = 10000
+
+
+def timed(operations, count):
+    """
+    This function measures the operations per second of a function
+
+    Args:
+        operations (function): The function that runs the operations
+        count (int): The number of operations it runs
+
+    Returns:
+        float: The operations per second
+    """
+    start = time.perf_counter()
+    operations()
+    return count / (time.perf_counter() - start)
+
+
+def run_operations(reservations_obj):
+    """
+    This function runs each kind of operation and measures it
+
+    Args:
+        reservations_obj (Reservations): The Reservations object
+
+    Returns:
+        dict: The operations per second of each kind of operation
+    """
+    hotels_obj = reservations_obj.hotels_instance
+    customers_obj = reservations_obj.customers_instance
+    customer_ids = [f'{number:04d}' for number in range(CUSTOMERS)]
+    reservation_ids = [f'{number:06d}' for number in range(RESERVATIONS)]
+    return {
+        'create hotel (bulk)': timed(lambda: [
+            hotels_obj.create_hotel_bulk(f'Hotel {number}', 'Monterrey',
+                                         room_range=range(ROOMS_PER_HOTEL))
+            for number in range(HOTELS)], HOTELS),
+        'create customer': timed(lambda: [
+            customers_obj.create_customer(
+                customer_id, f'Customer {customer_id}',
+                f'customer{customer_id}@mail.com', f'664000{customer_id}')
+            for customer_id in customer_ids], CUSTOMERS),
+        'create reservation': timed(lambda: [
+            reservations_obj.create_customer_reservation(
+                reservation_id, customer_ids[number % CUSTOMERS],
+                f'Hotel {number % HOTELS}', f'{number // HOTELS:03d}')
+            for number, reservation_id in enumerate(reservation_ids)],
+            RESERVATIONS),
+        'find reservations': timed(lambda: [
+            reservations_obj.find_customer_reservations(
+                customer_ids[number % CUSTOMERS])
+            for number in range(RESERVATIONS)], RESERVATIONS),
+        'display hotel': timed(lambda: [
+            hotels_obj.display_hotel_information(f'Hotel {number}')
+            for number in range(HOTELS)], HOTELS),
+        'cancel reservation': timed(lambda: [
+            reservations_obj.cancel_customer_reservation(reservation_id)
+            for reservation_id in reservation_ids], RESERVATIONS)
+    }
+
+
+def main():
+    """
+    Main function, prints the operations per second of each backend
+
+    Returns:
+        None
+    """
+    memory = run_operations(Reservations(
+        Hotels(sink=None), Customers(sink=None), sink=None))
+    with tempfile.TemporaryDirectory() as folder:
+        with SqliteStorage(os.path.join(folder, 'hotels.db')) as storage:
+            sqlite = run_operations(Reservations(
+                Hotels(sink=None, storage=storage),
+                Customers(sink=None, storage=storage), sink=None,
+                storage=storage))
+
+    print(f'{"operation":<20} {"memory (op/s)":>14} {"sqlite (op/s)":>14}')
+    for operation, rate in memory.items():
+        print(f'{operation:<20} {rate:>14.0f} {sqlite[operation]:>14.0f}')
+
+
+if __name__ == '__main__':
+    main()
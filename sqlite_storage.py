@@ -0,0 +1,1005 @@
+"""
+SQLite Storage
+
+This program handles a storage for the Hotels, Customers and
+Reservations in a SQLite database file, which behaves as the
+dictionaries it replaces, so the data outlives the program and
+does not need to fit in memory
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from datetime import date
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS hotels (
+    hotel_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    location TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rooms (
+    hotel_id INTEGER NOT NULL,
+    room_number TEXT NOT NULL,
+    status TEXT NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (hotel_id, room_number)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS reservations (
+    reservation_id TEXT NOT NULL UNIQUE,
+    customer_id TEXT NOT NULL,
+    hotel_id INTEGER NOT NULL,
+    hotel_name TEXT NOT NULL,
+    room_number TEXT NOT NULL,
+    check_in TEXT,
+    check_out TEXT
+);
+CREATE INDEX IF NOT EXISTS reservations_by_customer
+    ON reservations (customer_id);
+CREATE INDEX IF NOT EXISTS reservations_by_room
+    ON reservations (hotel_id, room_number);
+'''
+
+# Fields of the rows viewed as dictionaries, and the columns that
+# identify a row of each table
+RECORD_FIELDS = {'rooms': ('status', 'type'),
+                 'customers': ('name', 'email', 'phone')}
+RECORD_KEYS = {'rooms': 'hotel_id = ? AND room_number = ?',
+               'customers': 'customer_id = ?'}
+
+RESERVATION_COLUMNS = ('reservation_id', 'customer_id', 'hotel_id',
+                       'hotel_name', 'room_number', 'check_in', 'check_out')
+SELECT_RESERVATIONS = ('SELECT ' + ', '.join(RESERVATION_COLUMNS)
+                       + ' FROM reservations')
+
+
+def reservation_from_row(row):
+    """
+    This function converts a row of the reservations table into the
+    reservation dictionary
+
+    Args:
+        row (tuple): The values of RESERVATION_COLUMNS
+
+    Returns:
+        dict: The reservation data, with the dates as date objects
+    """
+    reservation = dict(zip(RESERVATION_COLUMNS, row))
+    for column in ('check_in', 'check_out'):
+        if reservation[column] is not None:
+            reservation[column] = date.fromisoformat(reservation[column])
+    return reservation
+
+
+class SqliteStorage:
+    """
+    Class to open a SQLite database in WAL mode and run its statements.
+    Writes are grouped in transactions of batch_size statements, which
+    are committed together, so only the writes of the open transaction
+    are lost if the program stops before commit() or close()
+    """
+    def __init__(self, path, batch_size=1000):
+        """
+        Initializes the SqliteStorage object, the tables are created if
+        the database is new
+
+        Args:
+            path (str): The path of the database file, or ':memory:'
+            batch_size (int): The number of writes per transaction
+
+        Returns:
+            None
+        """
+        # Statements are compiled once and kept in the statement cache
+        # of the connection, since their text never changes
+        self._connection = sqlite3.connect(path, isolation_level=None,
+                                           check_same_thread=False,
+                                           cached_statements=256)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.RLock()
+        self._writes = 0
+        self.batch_size = batch_size
+        self.hotels = SqliteHotels(self)
+        self.customers = SqliteCustomers(self)
+        self.reservations = SqliteReservationStore(self)
+
+    def __enter__(self):
+        """
+        This method returns the storage at the start of a with block
+
+        Returns:
+            SqliteStorage: The storage
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        This method commits and closes the database at the end of a
+        with block
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def read(self, sql, params=()):
+        """
+        This method runs a query
+
+        Args:
+            sql (str): The query
+            params (tuple): The values of its parameters
+
+        Returns:
+            list: The rows found
+        """
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def read_one(self, sql, params=()):
+        """
+        This method runs a query that finds at most one row
+
+        Args:
+            sql (str): The query
+            params (tuple): The values of its parameters
+
+        Returns:
+            tuple: The row found, None if there is none
+        """
+        with self._lock:
+            return self._connection.execute(sql, params).fetchone()
+
+    def write(self, sql, params=()):
+        """
+        This method runs a statement that changes the database inside
+        the open transaction, which is committed every batch_size writes
+
+        Args:
+            sql (str): The statement
+            params (tuple): The values of its parameters
+
+        Returns:
+            Cursor: The cursor of the statement
+        """
+        with self._lock:
+            if not self._connection.in_transaction:
+                self._connection.execute('BEGIN')
+            cursor = self._connection.execute(sql, params)
+            self._writes += 1
+            if self._writes >= self.batch_size:
+                self._commit()
+            return cursor
+
+    def write_many(self, sql, rows):
+        """
+        This method runs a statement once for each row inside the open
+        transaction
+
+        Args:
+            sql (str): The statement
+            rows (list): The values of the parameters of each row
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if not self._connection.in_transaction:
+                self._connection.execute('BEGIN')
+            self._connection.executemany(sql, rows)
+            self._writes += len(rows)
+            if self._writes >= self.batch_size:
+                self._commit()
+
+    def commit(self):
+        """
+        This method commits the open transaction
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._commit()
+
+    def _commit(self):
+        """
+        This method commits the open transaction, the lock must be held
+
+        Returns:
+            None
+        """
+        if self._connection.in_transaction:
+            self._connection.execute('COMMIT')
+        self._writes = 0
+
+    def close(self):
+        """
+        This method commits the open transaction and closes the database
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+
+class SqliteRecord(MutableMapping):
+    """
+    Class to view one row of the rooms or customers table as a
+    dictionary of its fields, which are read from and written to the
+    database
+    """
+    __slots__ = ('_storage', '_table', '_key')
+
+    def __init__(self, storage, table, key):
+        """
+        Initializes the SqliteRecord object
+
+        Args:
+            storage (SqliteStorage): The storage that holds the row
+            table (str): 'rooms' or 'customers'
+            key (tuple): The values of the columns that identify the row
+
+        Returns:
+            None
+        """
+        self._storage = storage
+        self._table = table
+        self._key = key
+
+    def __getitem__(self, field):
+        """
+        This method reads a field of the row
+
+        Args:
+            field (str): The name of the field
+
+        Returns:
+            str: The value of the field
+        """
+        if field not in RECORD_FIELDS[self._table]:
+            raise KeyError(field)
+        row = self._storage.read_one(
+            f'SELECT {field} FROM {self._table} '
+            f'WHERE {RECORD_KEYS[self._table]}', self._key)
+        if row is None:
+            raise KeyError(field)
+        return row[0]
+
+    def __setitem__(self, field, value):
+        """
+        This method writes a field of the row
+
+        Args:
+            field (str): The name of the field
+            value (str): The new value of the field
+
+        Returns:
+            None
+        """
+        if field not in RECORD_FIELDS[self._table]:
+            raise KeyError(field)
+        self._storage.write(f'UPDATE {self._table} SET {field} = ? '
+                            f'WHERE {RECORD_KEYS[self._table]}',
+                            (value, *self._key))
+
+    def __delitem__(self, field):
+        """
+        This method rejects removing a field, every row keeps all
+
+        Args:
+            field (str): The field to be removed
+
+        Returns:
+            None
+        """
+        raise TypeError('Fields cannot be removed')
+
+    def __iter__(self):
+        """
+        This method iterates over the fields of the row
+
+        Returns:
+            iterator: The field names
+        """
+        return iter(RECORD_FIELDS[self._table])
+
+    def __len__(self):
+        """
+        This method returns the number of fields of the row
+
+        Returns:
+            int: The number of fields
+        """
+        return len(RECORD_FIELDS[self._table])
+
+    def __repr__(self):
+        """
+        This method represents the row as a dictionary
+
+        Returns:
+            str: The representation of the row
+        """
+        return repr(dict(self))
+
+
+class SqliteRooms(MutableMapping):
+    """
+    Class to view the rooms of a Hotel as the dictionary of room
+    dictionaries it replaces
+    """
+    def __init__(self, storage, hotel_id):
+        """
+        Initializes the SqliteRooms object
+
+        Args:
+            storage (SqliteStorage): The storage that holds the rooms
+            hotel_id (int): The ID of the Hotel in the database
+
+        Returns:
+            None
+        """
+        self._storage = storage
+        self._hotel_id = hotel_id
+
+    def __getitem__(self, room_number):
+        """
+        This method returns a view of a room
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            SqliteRecord: The view of the room
+        """
+        if room_number not in self:
+            raise KeyError(room_number)
+        return SqliteRecord(self._storage, 'rooms',
+                            (self._hotel_id, room_number))
+
+    def __setitem__(self, room_number, room_details):
+        """
+        This method stores a room
+
+        Args:
+            room_number (str): The room number
+            room_details (dict): The 'status' and 'type' of the room
+
+        Returns:
+            None
+        """
+        self._storage.write(
+            'INSERT OR REPLACE INTO rooms VALUES (?, ?, ?, ?)',
+            (self._hotel_id, room_number, room_details['status'],
+             room_details['type']))
+
+    def __delitem__(self, room_number):
+        """
+        This method removes a room
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            None
+        """
+        cursor = self._storage.write(
+            'DELETE FROM rooms WHERE hotel_id = ? AND room_number = ?',
+            (self._hotel_id, room_number))
+        if cursor.rowcount == 0:
+            raise KeyError(room_number)
+
+    def __contains__(self, room_number):
+        """
+        This method checks whether a room exists
+
+        Args:
+            room_number (str): The room number
+
+        Returns:
+            bool: True if the room exists, False otherwise
+        """
+        return self._storage.read_one(
+            'SELECT 1 FROM rooms WHERE hotel_id = ? AND room_number = ?',
+            (self._hotel_id, room_number)) is not None
+
+    def __iter__(self):
+        """
+        This method iterates over the room numbers in ascending order
+
+        Returns:
+            iterator: The room numbers
+        """
+        return iter([row[0] for row in self._storage.read(
+            'SELECT room_number FROM rooms WHERE hotel_id = ? '
+            'ORDER BY room_number', (self._hotel_id,))])
+
+    def __len__(self):
+        """
+        This method returns the number of rooms
+
+        Returns:
+            int: The number of rooms
+        """
+        return self._storage.read_one(
+            'SELECT COUNT(*) FROM rooms WHERE hotel_id = ?',
+            (self._hotel_id,))[0]
+
+    def items(self):
+        """
+        This method reads all the rooms with one query. The room
+        dictionaries are copies, changes to them are not stored
+
+        Returns:
+            list: (room_number, room_details) tuples in ascending order
+        """
+        return [(room_number, {'status': status, 'type': room_type})
+                for room_number, status, room_type in self._storage.read(
+                    'SELECT room_number, status, type FROM rooms '
+                    'WHERE hotel_id = ? ORDER BY room_number',
+                    (self._hotel_id,))]
+
+    def __repr__(self):
+        """
+        This method represents the rooms as a dictionary
+
+        Returns:
+            str: The representation of the rooms
+        """
+        return repr(dict(self.items()))
+
+
+class SqliteHotel(MutableMapping):
+    """
+    Class to view a Hotel as a dictionary with the 'hotel_id',
+    'location' and 'rooms' keys
+    """
+    __slots__ = ('_storage', '_hotel_id')
+
+    def __init__(self, storage, hotel_id):
+        """
+        Initializes the SqliteHotel object
+
+        Args:
+            storage (SqliteStorage): The storage that holds the Hotel
+            hotel_id (int): The ID of the Hotel in the database
+
+        Returns:
+            None
+        """
+        self._storage = storage
+        self._hotel_id = hotel_id
+
+    def __getitem__(self, field):
+        """
+        This method reads the ID, the location or the rooms of the
+        Hotel
+
+        Args:
+            field (str): 'hotel_id', 'location' or 'rooms'
+
+        Returns:
+            object: The ID (int), the location (str) or the rooms
+            (SqliteRooms)
+        """
+        if field == 'rooms':
+            return SqliteRooms(self._storage, self._hotel_id)
+        if field == 'hotel_id':
+            return self._hotel_id
+        if field == 'location':
+            return self._storage.read_one(
+                'SELECT location FROM hotels WHERE hotel_id = ?',
+                (self._hotel_id,))[0]
+        raise KeyError(field)
+
+    def __setitem__(self, field, value):
+        """
+        This method writes the location of the Hotel
+
+        Args:
+            field (str): 'location'
+            value (str): The new location
+
+        Returns:
+            None
+        """
+        if field != 'location':
+            raise TypeError(f'{field} cannot be replaced')
+        self._storage.write('UPDATE hotels SET location = ? '
+                            'WHERE hotel_id = ?', (value, self._hotel_id))
+
+    def __delitem__(self, field):
+        """
+        This method rejects removing a field, every Hotel keeps both
+
+        Args:
+            field (str): The field to be removed
+
+        Returns:
+            None
+        """
+        raise TypeError('Hotel fields cannot be removed')
+
+    def __iter__(self):
+        """
+        This method iterates over the fields of the Hotel
+
+        Returns:
+            iterator: The field names
+        """
+        return iter(('hotel_id', 'location', 'rooms'))
+
+    def __len__(self):
+        """
+        This method returns the number of fields of the Hotel
+
+        Returns:
+            int: The number of fields
+        """
+        return 3
+
+    def __repr__(self):
+        """
+        This method represents the Hotel as a dictionary
+
+        Returns:
+            str: The representation of the Hotel
+        """
+        return repr({'hotel_id': self['hotel_id'],
+                     'location': self['location'], 'rooms': self['rooms']})
+
+
+class SqliteHotels(MutableMapping):
+    """
+    Class to view the Hotels table as the dictionary of Hotel
+    dictionaries it replaces. The IDs of the Hotels are kept in memory
+    by name, the locations and rooms are read when they are used
+    """
+    def __init__(self, storage):
+        """
+        Initializes the SqliteHotels object
+
+        Args:
+            storage (SqliteStorage): The storage that holds the Hotels
+
+        Returns:
+            None
+        """
+        self._storage = storage
+        self._ids = {name: hotel_id for hotel_id, name in storage.read(
+            'SELECT hotel_id, name FROM hotels ORDER BY hotel_id')}
+
+    def __getitem__(self, hotel_name):
+        """
+        This method returns a view of a Hotel
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            SqliteHotel: The view of the Hotel
+        """
+        return SqliteHotel(self._storage, self._ids[hotel_name])
+
+    def __setitem__(self, hotel_name, hotel):
+        """
+        This method stores a Hotel with its rooms, replacing the Hotel
+        with the same name (if any)
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            hotel (dict): The 'location' and 'rooms' of the Hotel, and
+            its 'hotel_id' (if applicable)
+
+        Returns:
+            None
+        """
+        rooms = [(room_number, room['status'], room['type'])
+                 for room_number, room in hotel['rooms'].items()]
+        if hotel_name in self._ids:
+            del self[hotel_name]
+        hotel_id = self._storage.write(
+            'INSERT INTO hotels (hotel_id, name, location) '
+            'VALUES (?, ?, ?)',
+            (hotel.get('hotel_id'), hotel_name, hotel['location'])
+        ).lastrowid
+        self._storage.write_many(
+            'INSERT INTO rooms VALUES (?, ?, ?, ?)',
+            [(hotel_id, *room) for room in rooms])
+        self._ids[hotel_name] = hotel_id
+
+    def __delitem__(self, hotel_name):
+        """
+        This method removes a Hotel and its rooms
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            None
+        """
+        hotel_id = self._ids.pop(hotel_name)
+        self._storage.write('DELETE FROM rooms WHERE hotel_id = ?',
+                            (hotel_id,))
+        self._storage.write('DELETE FROM hotels WHERE hotel_id = ?',
+                            (hotel_id,))
+
+    def rename(self, hotel_name, new_hotel_name):
+        """
+        This method changes the name of a Hotel in its row, without
+        copying its rooms, replacing the Hotel with the new name
+        (if any)
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            new_hotel_name (str): The new name of the Hotel
+
+        Returns:
+            None
+        """
+        hotel_id = self._ids[hotel_name]
+        if new_hotel_name != hotel_name and new_hotel_name in self._ids:
+            del self[new_hotel_name]
+        self._storage.write('UPDATE hotels SET name = ? WHERE hotel_id = ?',
+                            (new_hotel_name, hotel_id))
+        del self._ids[hotel_name]
+        self._ids[new_hotel_name] = hotel_id
+
+    def pop(self, hotel_name, *default):
+        """
+        This method removes a Hotel and returns a copy of it, which can
+        be stored again under another name
+
+        Args:
+            hotel_name (str): The name of the Hotel
+            default (object): The value returned if the Hotel does not
+            exist (if applicable)
+
+        Returns:
+            dict: The 'hotel_id', 'location' and 'rooms' of the Hotel
+        """
+        if hotel_name not in self._ids:
+            if default:
+                return default[0]
+            raise KeyError(hotel_name)
+        hotel = self[hotel_name]
+        copy = {'hotel_id': hotel['hotel_id'],
+                'location': hotel['location'],
+                'rooms': dict(hotel['rooms'].items())}
+        del self[hotel_name]
+        return copy
+
+    def __contains__(self, hotel_name):
+        """
+        This method checks whether a Hotel exists
+
+        Args:
+            hotel_name (str): The name of the Hotel
+
+        Returns:
+            bool: True if the Hotel exists, False otherwise
+        """
+        return hotel_name in self._ids
+
+    def __iter__(self):
+        """
+        This method iterates over the Hotel names
+
+        Returns:
+            iterator: The Hotel names
+        """
+        return iter(list(self._ids))
+
+    def __len__(self):
+        """
+        This method returns the number of Hotels
+
+        Returns:
+            int: The number of Hotels
+        """
+        return len(self._ids)
+
+    def __repr__(self):
+        """
+        This method represents the Hotels as a dictionary
+
+        Returns:
+            str: The representation of the Hotels
+        """
+        return repr(dict(self.items()))
+
+
+class SqliteCustomers(MutableMapping):
+    """
+    Class to view the customers table as the dictionary of customer
+    dictionaries it replaces
+    """
+    def __init__(self, storage):
+        """
+        Initializes the SqliteCustomers object
+
+        Args:
+            storage (SqliteStorage): The storage that holds the
+            customers
+
+        Returns:
+            None
+        """
+        self._storage = storage
+
+    def __getitem__(self, customer_id):
+        """
+        This method returns a view of a customer
+
+        Args:
+            customer_id (str): The customer ID
+
+        Returns:
+            SqliteRecord: The view of the customer
+        """
+        if customer_id not in self:
+            raise KeyError(customer_id)
+        return SqliteRecord(self._storage, 'customers', (customer_id,))
+
+    def __setitem__(self, customer_id, customer_details):
+        """
+        This method stores a customer
+
+        Args:
+            customer_id (str): The customer ID
+            customer_details (dict): The 'name', 'email' and 'phone'
+            of the customer
+
+        Returns:
+            None
+        """
+        self._storage.write(
+            'INSERT OR REPLACE INTO customers VALUES (?, ?, ?, ?)',
+            (customer_id, customer_details['name'],
+             customer_details['email'], customer_details['phone']))
+
+    def __delitem__(self, customer_id):
+        """
+        This method removes a customer
+
+        Args:
+            customer_id (str): The customer ID
+
+        Returns:
+            None
+        """
+        cursor = self._storage.write(
+            'DELETE FROM customers WHERE customer_id = ?', (customer_id,))
+        if cursor.rowcount == 0:
+            raise KeyError(customer_id)
+
+    def __contains__(self, customer_id):
+        """
+        This method checks whether a customer exists
+
+        Args:
+            customer_id (str): The customer ID
+
+        Returns:
+            bool: True if the customer exists, False otherwise
+        """
+        return self._storage.read_one(
+            'SELECT 1 FROM customers WHERE customer_id = ?',
+            (customer_id,)) is not None
+
+    def __iter__(self):
+        """
+        This method iterates over the customer IDs in ascending order
+
+        Returns:
+            iterator: The customer IDs
+        """
+        return iter([row[0] for row in self._storage.read(
+            'SELECT customer_id FROM customers ORDER BY customer_id')])
+
+    def __len__(self):
+        """
+        This method returns the number of customers
+
+        Returns:
+            int: The number of customers
+        """
+        return self._storage.read_one('SELECT COUNT(*) FROM customers')[0]
+
+    def items(self):
+        """
+        This method reads all the customers with one query. The
+        customer dictionaries are copies, changes to them are not stored
+
+        Returns:
+            list: (customer_id, customer_details) tuples in ascending
+            order
+        """
+        return [(customer_id, {'name': name, 'email': email,
+                               'phone': phone})
+                for customer_id, name, email, phone in self._storage.read(
+                    'SELECT customer_id, name, email, phone '
+                    'FROM customers ORDER BY customer_id')]
+
+    def __repr__(self):
+        """
+        This method represents the customers as a dictionary
+
+        Returns:
+            str: The representation of the customers
+        """
+        return repr(dict(self.items()))
+
+
+class SqliteReservationStore:
+    """
+    Class to store the reservations in the reservations table, with
+    the same methods as ReservationStore. The customer and room
+    lookups use the indexes of the table
+    """
+    def __init__(self, storage):
+        """
+        Initializes the SqliteReservationStore object
+
+        Args:
+            storage (SqliteStorage): The storage that holds the
+            reservations
+
+        Returns:
+            None
+        """
+        self._storage = storage
+
+    def __len__(self):
+        """
+        This method returns the number of stored reservations
+
+        Returns:
+            int: The number of reservations
+        """
+        return self._storage.read_one(
+            'SELECT COUNT(*) FROM reservations')[0]
+
+    def __iter__(self):
+        """
+        This method iterates over the stored reservations
+
+        Returns:
+            iterator: The reservation dictionaries in creation order
+        """
+        return iter(self._select('ORDER BY rowid'))
+
+    def __contains__(self, reservation_id):
+        """
+        This method checks whether a reservation ID is stored
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            bool: True if the reservation exists, False otherwise
+        """
+        return self._storage.read_one(
+            'SELECT 1 FROM reservations WHERE reservation_id = ?',
+            (reservation_id,)) is not None
+
+    def _select(self, condition, params=()):
+        """
+        This method reads the reservations that meet a condition
+
+        Args:
+            condition (str): The WHERE and ORDER BY clauses
+            params (tuple): The values of their parameters
+
+        Returns:
+            list: The reservation dictionaries
+        """
+        return [reservation_from_row(row) for row in self._storage.read(
+            f'{SELECT_RESERVATIONS} {condition}', params)]
+
+    def get(self, reservation_id):
+        """
+        This method looks up a reservation by its ID
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            dict: The reservation data, None if it does not exist
+        """
+        reservations = self._select('WHERE reservation_id = ?',
+                                    (reservation_id,))
+        return reservations[0] if reservations else None
+
+    def add(self, reservation):
+        """
+        This method stores a reservation under its ID, unless the ID
+        is already used
+
+        Args:
+            reservation (dict): The reservation data, it must contain
+            the 'reservation_id' key
+
+        Returns:
+            bool: True if the reservation was stored, False otherwise
+
+        Raises:
+            sqlite3.IntegrityError: If a field is missing, only the
+            reservations with a used ID are skipped
+        """
+        values = [reservation[column] for column in RESERVATION_COLUMNS]
+        values[5:] = [None if value is None else value.isoformat()
+                      for value in values[5:]]
+        return self._storage.write(
+            'INSERT INTO reservations VALUES (?, ?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (reservation_id) DO NOTHING', values).rowcount == 1
+
+    def remove(self, reservation_id):
+        """
+        This method removes a reservation by its ID
+
+        Args:
+            reservation_id (str): The ID of the reservation
+
+        Returns:
+            dict: The removed reservation data, None if it does not
+            exist
+        """
+        reservation = self.get(reservation_id)
+        if reservation is None:
+            return None
+        cursor = self._storage.write(
+            'DELETE FROM reservations WHERE reservation_id = ?',
+            (reservation_id,))
+        return reservation if cursor.rowcount == 1 else None
+
+    def for_customer(self, customer_id):
+        """
+        This method lists the reservations held by a customer
+
+        Args:
+            customer_id (str): The ID of the customer
+
+        Returns:
+            list: The reservation dictionaries of the customer
+        """
+        return self._select('WHERE customer_id = ? ORDER BY rowid',
+                            (customer_id,))
+
+    def for_hotel(self, hotel_id):
+        """
+        This method lists the reservations made in a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+
+        Returns:
+            list: The reservation dictionaries of the Hotel
+        """
+        return self._select('WHERE hotel_id = ? ORDER BY rowid',
+                            (hotel_id,))
+
+    def for_room(self, hotel_id, room_number):
+        """
+        This method lists the reservations made for a room of a Hotel
+
+        Args:
+            hotel_id (int): The ID of the Hotel
+            room_number (str): The number of the room
+
+        Returns:
+            list: The reservation dictionaries of the room
+        """
+        return self._select('WHERE hotel_id = ? AND room_number = ? '
+                            'ORDER BY rowid', (hotel_id, room_number))
@@ -0,0 +1,263 @@
+"""
+SQLite Storage Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following classes:
+
+- SqliteStorage
+- SqliteHotels
+- SqliteCustomers
+- SqliteReservationStore
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+from hotels import Hotels
+from customers import Customers
+from reservations import Reservations
+from snapshot import load_snapshot, save_snapshot
+from sqlite_storage import SqliteStorage
+
+
+class SqliteStorageTest(unittest.TestCase):
+    """
+    Class to handle the SqliteStorage Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'hotels.db')
+
+    def tearDown(self):
+        """
+        Teardown method
+
+        Returns:
+            None
+        """
+        self.folder.cleanup()
+
+    def open_reservations(self, storage):
+        """
+        This method opens the objects kept in a storage
+
+        Returns:
+            Reservations: The Reservations object
+        """
+        return Reservations(Hotels(sink=None, storage=storage),
+                            Customers(sink=None, storage=storage),
+                            sink=None, storage=storage)
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_reopen_happy_path(self):
+        with SqliteStorage(self.path) as storage:
+            reservations_obj = self.open_reservations(storage)
+            reservations_obj.hotels_instance.create_hotel(
+                'Hotel California', 'Tijuana',
+                {'101': {'status': 'available', 'type': 'single'},
+                 '102': {'status': 'available', 'type': 'double'}})
+            reservations_obj.customers_instance.create_customer(
+                '4444', 'Jose Lopez', 'jlopez@gmail.com', '6643127401')
+            reservations_obj.create_customer_reservation(
+                '111111', '4444', 'Hotel California', '101')
+            reservations_obj.create_customer_reservation(
+                '222222', '4444', 'Hotel California', '102',
+                '2024-05-01', '2024-05-04')
+
+        with SqliteStorage(self.path) as storage:
+            reservations_obj = self.open_reservations(storage)
+            hotels_obj = reservations_obj.hotels_instance
+            # Verifies the data and the rebuilt indexes
+            self.assertEqual(reservations_obj.reservations.get('222222')
+                             ['check_out'], date(2024, 5, 4))
+            self.assertEqual(hotels_obj.list_rooms('Hotel California',
+                                                   'reserved'), ['101'])
+            self.assertFalse(hotels_obj.is_room_free(
+                'Hotel California', '102', date(2024, 5, 2),
+                date(2024, 5, 3)))
+            self.assertEqual(reservations_obj.customers_instance.
+                             find_by_name_prefix('lop'), ['4444'])
+
+    def test_rename_hotel_happy_path(self):
+        with SqliteStorage(self.path) as storage:
+            hotels_obj = Hotels(sink=None, storage=storage)
+            hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                         room_range=range(101, 104))
+            hotels_obj.modify_hotel_name('Hotel Uno', 'Hotel Dos')
+            self.assertEqual(list(storage.hotels), ['Hotel Dos'])
+            self.assertEqual(len(storage.hotels['Hotel Dos']['rooms']), 3)
+
+    def test_rename_hotel_keeps_rooms(self):
+        with SqliteStorage(self.path) as storage:
+            hotels_obj = Hotels(sink=None, storage=storage)
+            hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                         room_range=range(101, 104))
+            storage.commit()
+            writer = sqlite3.connect(self.path)
+            writer.executescript(
+                'CREATE TABLE room_writes (room_number TEXT);'
+                'CREATE TRIGGER room_deleted AFTER DELETE ON rooms '
+                'BEGIN INSERT INTO room_writes VALUES (old.room_number); END;'
+                'CREATE TRIGGER room_inserted AFTER INSERT ON rooms '
+                'BEGIN INSERT INTO room_writes VALUES (new.room_number); END;')
+            writer.close()
+            hotels_obj.modify_hotel_name('Hotel Uno', 'Hotel Dos')
+            storage.commit()
+            # Verifies only the name of the Hotel was written
+            reader = sqlite3.connect(self.path)
+            self.assertEqual(reader.execute(
+                'SELECT COUNT(*) FROM room_writes').fetchone()[0], 0)
+            self.assertEqual(reader.execute(
+                'SELECT hotel_id, name FROM hotels').fetchall(),
+                             [(1, 'Hotel Dos')])
+            reader.close()
+
+    def test_reopen_after_rename(self):
+        with SqliteStorage(self.path) as storage:
+            reservations_obj = self.open_reservations(storage)
+            reservations_obj.hotels_instance.create_hotel_bulk(
+                'Hotel Uno', 'Monterrey', room_range=range(101, 103))
+            reservations_obj.customers_instance.create_customer(
+                '4444', 'Jose Lopez', 'jlopez@gmail.com', '6643127401')
+            reservations_obj.create_customer_reservation(
+                '111111', '4444', 'Hotel Uno', '101')
+            reservations_obj.hotels_instance.modify_hotel_name(
+                'Hotel Uno', 'Hotel Dos')
+
+        with SqliteStorage(self.path) as storage:
+            reservations_obj = self.open_reservations(storage)
+            # Verifies the Hotel keeps its ID and its reservations
+            self.assertEqual(storage.hotels['Hotel Dos']['hotel_id'], 1)
+            self.assertEqual([reservation['hotel_name'] for reservation
+                              in reservations_obj.
+                              find_hotel_reservations('Hotel Dos')],
+                             ['Hotel Dos'])
+            self.assertTrue(
+                reservations_obj.cancel_customer_reservation('111111'))
+
+    def test_reopen_after_hotel_deleted(self):
+        with SqliteStorage(self.path) as storage:
+            reservations_obj = self.open_reservations(storage)
+            reservations_obj.hotels_instance.create_hotel_bulk(
+                'Hotel Uno', 'Monterrey', room_range=range(101, 103))
+            reservations_obj.customers_instance.create_customer(
+                '4444', 'Jose Lopez', 'jlopez@gmail.com', '6643127401')
+            reservations_obj.create_customer_reservation(
+                '111111', '4444', 'Hotel Uno', '101', '2024-03-10',
+                '2024-03-15')
+            reservations_obj.hotels_instance.delete_hotel('Hotel Uno')
+
+        with SqliteStorage(self.path) as storage:
+            reservations_obj = self.open_reservations(storage)
+            hotels_obj = reservations_obj.hotels_instance
+            hotels_obj.create_hotel_bulk('Hotel Uno', 'Monterrey',
+                                         room_range=range(101, 103))
+            # Verifies the new Hotel takes neither the ID nor the
+            # bookings of the deleted one
+            self.assertEqual(storage.hotels['Hotel Uno']['hotel_id'], 2)
+            self.assertTrue(hotels_obj.is_room_free(
+                'Hotel Uno', '101', date(2024, 3, 10), date(2024, 3, 15)))
+            self.assertTrue(
+                reservations_obj.cancel_customer_reservation('111111'))
+
+    def test_load_snapshot_after_hotel_deleted(self):
+        reservations_obj = Reservations(Hotels(sink=None),
+                                        Customers(sink=None), sink=None)
+        reservations_obj.hotels_instance.create_hotel_bulk(
+            'Hotel Uno', 'Monterrey', room_range=range(101, 103))
+        reservations_obj.customers_instance.create_customer(
+            '4444', 'Jose Lopez', 'jlopez@gmail.com', '6643127401')
+        reservations_obj.create_customer_reservation(
+            '111111', '4444', 'Hotel Uno', '101')
+        reservations_obj.hotels_instance.delete_hotel('Hotel Uno')
+        snapshot_path = os.path.join(self.folder.name, 'state.snap')
+        save_snapshot(snapshot_path, reservations_obj)
+
+        with SqliteStorage(self.path) as storage:
+            summary = load_snapshot(snapshot_path,
+                                    self.open_reservations(storage))
+            # Verifies the reservation of the deleted Hotel is stored
+            # with its last name
+            self.assertEqual(summary.reservations, 1)
+            self.assertEqual(storage.reservations.get('111111')
+                             ['hotel_name'], 'Hotel Uno')
+
+    def test_batch_commit(self):
+        storage = SqliteStorage(self.path, batch_size=2)
+        customers_obj = Customers(sink=None, storage=storage)
+        customers_obj.create_customer('0001', 'Ana Perez',
+                                      'aperez@gmail.com', '8112345678')
+        reader = sqlite3.connect(self.path)
+        # Verifies the write waits for its batch
+        self.assertEqual(reader.execute(
+            'SELECT COUNT(*) FROM customers').fetchone()[0], 0)
+        customers_obj.create_customer('0002', 'Luis Perez',
+                                      'lperez@gmail.com', '8112345679')
+        self.assertEqual(reader.execute(
+            'SELECT COUNT(*) FROM customers').fetchone()[0], 2)
+        reader.close()
+        storage.close()
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_reservation_store_neg_path_1(self):
+        # Path 1: Reservation ID already used or not stored
+        with SqliteStorage(':memory:') as storage:
+            reservation = {'reservation_id': '111111',
+                           'customer_id': '4444', 'hotel_id': 1,
+                           'hotel_name': 'Hotel Uno',
+                           'room_number': '101',
+                           'check_in': None, 'check_out': None}
+            self.assertTrue(storage.reservations.add(reservation))
+            self.assertFalse(storage.reservations.add(reservation))
+            self.assertIsNone(storage.reservations.remove('999999'))
+            self.assertEqual(storage.reservations.remove('111111'),
+                             reservation)
+            self.assertEqual(len(storage.reservations), 0)
+            # Verifies a missing field is not skipped as a used ID
+            with self.assertRaises(sqlite3.IntegrityError):
+                storage.reservations.add(dict(reservation,
+                                              hotel_name=None))
+
+    def test_hotels_neg_path_1(self):
+        # Path 1: Hotel, room or field that does not exist
+        with SqliteStorage(':memory:') as storage:
+            with self.assertRaises(KeyError):
+                storage.hotels.pop('Hotel Uno')
+            self.assertIsNone(storage.hotels.get('Hotel Uno'))
+            storage.hotels['Hotel Uno'] = {'location': 'Monterrey',
+                                           'rooms': {}}
+            rooms = storage.hotels['Hotel Uno']['rooms']
+            with self.assertRaises(KeyError):
+                del rooms['101']
+            rooms['101'] = {'status': 'available', 'type': 'single'}
+            with self.assertRaises(KeyError):
+                rooms['101']['price'] = 100
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(SqliteStorageTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('SqliteStorageTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)
@@ -0,0 +1,246 @@
+"""
+Views
+
+This program handles the materialized views over the Hotels. A view
+keeps the number of rooms of a status and, optionally, of a location
+and a type (e.g. the available doubles of Cancun) up to date as the
+rooms change, and calls its subscribers when the number crosses a
+threshold
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+from locking import make_lock
+
+
+class AvailabilityView:
+    """
+    Class to keep the number of rooms of all the Hotels that have a
+    status and, optionally, a location and a type
+    """
+    def __init__(self, location=None, room_type=None, status='available'):
+        """
+        Initializes the AvailabilityView object
+
+        Args:
+            location (str): The location of the Hotels, in any case and
+            spacing, None for every location (if applicable)
+            room_type (str): The type of the rooms, 'single' or
+            'double', None for both (if applicable)
+            status (str): The status of the rooms, 'available' or
+            'reserved' (if applicable)
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the status or the type are not valid
+        """
+        if status not in ('available', 'reserved'):
+            raise ValueError(f'Invalid status: {status}')
+        if room_type not in (None, 'single', 'double'):
+            raise ValueError(f'Invalid room type: {room_type}')
+
+        self.location = location
+        self.room_type = room_type
+        self.status = status
+        # Number of matching rooms, set when the view is registered
+        self.count = 0
+        self._subscribers = []
+
+    def __repr__(self):
+        """
+        This method represents the view with its filters and count
+
+        Returns:
+            str: The representation of the view
+        """
+        return (f'AvailabilityView(location={self.location!r}, '
+                f'room_type={self.room_type!r}, status={self.status!r}, '
+                f'count={self.count})')
+
+    def subscribe(self, threshold, callback):
+        """
+        This method calls a function each time the number of rooms
+        falls below a threshold or rises back to it. For example, a
+        threshold of 1 tells when the rooms are sold out and when they
+        are available again
+
+        Args:
+            threshold (int): The number of rooms watched
+            callback (function): The function called with the view and
+            its new number of rooms
+
+        Returns:
+            None
+        """
+        self._subscribers.append((threshold, callback))
+
+    def unsubscribe(self, callback):
+        """
+        This method stops calling a function (if it is subscribed)
+
+        Args:
+            callback (function): The subscribed function
+
+        Returns:
+            bool: True if the function was subscribed, False otherwise
+        """
+        subscribers = [subscriber for subscriber in self._subscribers
+                       if subscriber[1] != callback]
+        removed = len(subscribers) != len(self._subscribers)
+        self._subscribers = subscribers
+        return removed
+
+    def apply(self, step):
+        """
+        This method adds rooms to, or takes rooms from, the view
+
+        Args:
+            step (int): The number of rooms added, negative if taken
+
+        Returns:
+            list: The (callback, view, count) of each threshold crossed,
+            the callbacks are called once the views are unlocked
+        """
+        previous = self.count
+        self.count = count = previous + step
+        return [(callback, self, count)
+                for threshold, callback in self._subscribers
+                if (previous >= threshold) != (count >= threshold)]
+
+
+class ViewRegistry:
+    """
+    Class to keep the views registered over the Hotels, grouped by
+    (location, status, type) so a room change only updates the views
+    that match it
+    """
+    def __init__(self, concurrent=False):
+        """
+        Initializes the ViewRegistry object
+
+        Args:
+            concurrent (bool): True if the views are shared by threads
+
+        Returns:
+            None
+        """
+        # Views of each (location, status, type), None in the location
+        # or the type for the views of every location or type
+        self._views = {}
+        self._keys = {}
+        # Held while the views and the room counts they are built from
+        # are changed, so both stay in step
+        self.lock = make_lock(concurrent)
+
+    def __len__(self):
+        """
+        This method returns the number of registered views
+
+        Returns:
+            int: The number of views
+        """
+        return len(self._keys)
+
+    def __contains__(self, view):
+        """
+        This method checks whether a view is registered
+
+        Args:
+            view (AvailabilityView): The view
+
+        Returns:
+            bool: True if the view is registered, False otherwise
+        """
+        return view in self._keys
+
+    def add(self, view, location, count):
+        """
+        This method registers a view with its current number of rooms.
+        A view that is already registered is left as it is, so its
+        rooms are not counted twice
+
+        Args:
+            view (AvailabilityView): The view
+            location (str): The normalized location of the view, None
+            for every location
+            count (int): The number of matching rooms
+
+        Returns:
+            bool: True if the view was registered, False if it already
+            was
+        """
+        if view in self._keys:
+            return False
+
+        key = (location, view.status, view.room_type)
+        view.count = count
+        self._views.setdefault(key, []).append(view)
+        self._keys[view] = key
+        return True
+
+    def remove(self, view):
+        """
+        This method unregisters a view (if it is registered)
+
+        Args:
+            view (AvailabilityView): The view
+
+        Returns:
+            bool: True if the view was registered, False otherwise
+        """
+        key = self._keys.pop(view, None)
+        if key is None:
+            return False
+        views = self._views[key]
+        views.remove(view)
+        if not views:
+            del self._views[key]
+        return True
+
+    def apply(self, changes):
+        """
+        This method updates the views that match a change of rooms.
+        The steps of each view are added first, so a room that only
+        moves within a view (e.g. from single to double) does not
+        change it
+
+        Args:
+            changes (list): The (location, (status, type), step) of
+            each group of rooms added, with a negative step if taken
+
+        Returns:
+            list: The (callback, view, count) of each threshold crossed
+        """
+        if not self._views:
+            return []
+
+        steps = {}
+        for location, (status, room_type), step in changes:
+            for key in ((location, status, room_type),
+                        (location, status, None),
+                        (None, status, room_type), (None, status, None)):
+                for view in self._views.get(key, ()):
+                    steps[view] = steps.get(view, 0) + step
+        notices = []
+        for view, step in steps.items():
+            if step:
+                notices.extend(view.apply(step))
+        return notices
+
+    @staticmethod
+    def notify(notices):
+        """
+        This method calls the subscribers of the thresholds crossed
+
+        Args:
+            notices (list): The (callback, view, count) of each
+            threshold crossed
+
+        Returns:
+            None
+        """
+        for callback, view, count in notices:
+            callback(view, count)
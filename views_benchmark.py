@@ -0,0 +1,108 @@
+"""
+Views Benchmark
+
+This program measures the time taken to read the available rooms
+of a location and type from a view and by searching the Hotels,
+and the time taken per reservation and cancellation as the number
+of registered views grows
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+import time
+
+from hotels import Hotels
+from location_benchmark import location_name
+from views import AvailabilityView
+
+HOTELS = 1000
+LOCATIONS = 100
+ROOMS_PER_HOTEL = 100
+VIEW_COUNTS = (0, 10, 100)
+READS = 100
+OPERATIONS = 100000
+
+
+def build_hotels():
+    """
+    This function creates the Hotels, with single and double rooms in
+    turn
+
+    Returns:
+        Hotels: The Hotels object
+    """
+    hotels_obj = Hotels(sink=None)
+    for number in range(HOTELS):
+        hotels_obj.create_hotel_bulk(f'Hotel {number}',
+                                     location_name(number % LOCATIONS),
+                                     room_range=range(ROOMS_PER_HOTEL),
+                                     room_types=('single', 'double'))
+    return hotels_obj
+
+
+def search_count(hotels_obj, location):
+    """
+    This function counts the available doubles of a location by
+    searching the Hotels
+
+    Args:
+        hotels_obj (Hotels): The Hotels object
+        location (str): The location
+
+    Returns:
+        int: The number of available doubles
+    """
+    return sum(1 for _ in hotels_obj.search_availability(location,
+                                                         'double'))
+
+
+def time_operations(hotels_obj):
+    """
+    This function reserves and cancels rooms of every Hotel
+
+    Args:
+        hotels_obj (Hotels): The Hotels object
+
+    Returns:
+        float: The microseconds per operation
+    """
+    start = time.perf_counter()
+    for number in range(OPERATIONS // 2):
+        hotel_name = f'Hotel {number % HOTELS}'
+        room_number = f'{number // HOTELS % ROOMS_PER_HOTEL:03d}'
+        hotels_obj.reserve_room(hotel_name, room_number)
+        hotels_obj.cancel_reservation(hotel_name, room_number)
+    return (time.perf_counter() - start) * 1e6 / OPERATIONS
+
+
+def main():
+    """
+    Main function, prints the time per read of each method and the
+    time per operation for each number of views
+
+    Returns:
+        None
+    """
+    hotels_obj = build_hotels()
+    view = hotels_obj.register_view(
+        AvailabilityView(location_name(0), 'double'))
+    start = time.perf_counter()
+    for _ in range(READS):
+        search_count(hotels_obj, location_name(0))
+    searched = (time.perf_counter() - start) * 1e3 / READS
+    print(f'view count: {view.count} (read from the view attribute), '
+          f'search: {searched:.3f} ms per read')
+    hotels_obj.unregister_view(view)
+
+    print(f'{"views":>6} {"reserve/cancel (us)":>20}')
+    for views in VIEW_COUNTS:
+        hotels_obj = build_hotels()
+        for number in range(views):
+            hotels_obj.register_view(
+                AvailabilityView(location_name(number % LOCATIONS),
+                                 ('single', 'double')[number % 2]))
+        print(f'{views:>6} {time_operations(hotels_obj):>20.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Views Test
+
+This program handles the Test Cases that will
+be used to test the functionality of the
+following classes:
+
+- AvailabilityView
+- ViewRegistry
+
+It includes Test Cases with happy path,
+negative path and edge cases
+
+Author:
+    Julia Gabriela Pinedo (A01795315)
+"""
+
+import unittest
+from hotels import Hotels
+from views import AvailabilityView
+
+
+class ViewsTest(unittest.TestCase):
+    """
+    Class to handle the Views Test Cases
+    """
+    def setUp(self):
+        """
+        Setup method
+
+        Returns:
+            None
+        """
+        self.hotels_obj = Hotels(sink=None)
+        self.hotels_obj.create_hotel_bulk('Hotel Uno', 'Cancun',
+                                          room_range=range(101, 103),
+                                          room_types=('double',))
+        self.hotels_obj.create_hotel_bulk('Hotel Dos', 'Monterrey',
+                                          room_range=range(101, 103),
+                                          room_types=('double',))
+        self.notices = []
+
+    def record(self, view, count):
+        """
+        This method keeps the notices sent to a subscriber
+
+        Args:
+            view (AvailabilityView): The view that crossed a threshold
+            count (int): The new number of rooms of the view
+
+        Returns:
+            None
+        """
+        self.notices.append((view.location, count))
+
+    # PART 1: This part of the Test Cases include the Happy Path
+    # scenarios, where all the values that are input are valid.
+
+    def test_register_view_happy_path(self):
+        cancun = self.hotels_obj.register_view(
+            AvailabilityView(' CANCUN', 'double'))
+        every_location = self.hotels_obj.register_view(AvailabilityView())
+        self.assertEqual((cancun.count, every_location.count), (2, 4))
+        # Verifies the views follow the rooms without being counted again
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.hotels_obj.create_hotel_room('Hotel Uno', '103', 'available',
+                                          'single')
+        self.assertEqual((cancun.count, every_location.count), (1, 4))
+        self.hotels_obj.modify_hotel_location('Hotel Dos', None, 'Cancun')
+        self.assertEqual(cancun.count, 3)
+        self.hotels_obj.delete_hotel('Hotel Uno')
+        self.assertEqual((cancun.count, every_location.count), (2, 2))
+
+    def test_subscribe_happy_path(self):
+        cancun = self.hotels_obj.register_view(
+            AvailabilityView('Cancun', 'double'))
+        cancun.subscribe(1, self.record)
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.assertEqual(self.notices, [])
+        # Verifies the subscriber hears when the view is sold out and
+        # when it has rooms again
+        self.hotels_obj.reserve_room('Hotel Uno', '102')
+        self.hotels_obj.cancel_reservation('Hotel Uno', '101')
+        self.assertEqual(self.notices, [('Cancun', 0), ('Cancun', 1)])
+
+    def test_subscribe_room_moved_within_view(self):
+        cancun = self.hotels_obj.register_view(AvailabilityView('Cancun'))
+        every_location = self.hotels_obj.register_view(AvailabilityView())
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        cancun.subscribe(1, self.record)
+        every_location.subscribe(3, self.record)
+        # Verifies a change of type or of location that keeps the rooms
+        # in a view does not notify its subscribers
+        self.hotels_obj.modify_hotel_rooms(
+            'Hotel Uno', None,
+            {'102': {'status': 'available', 'type': 'single'}})
+        self.hotels_obj.modify_hotel_location('Hotel Dos', None, 'Cancun')
+        self.assertEqual((cancun.count, every_location.count), (3, 3))
+        self.assertEqual(self.notices, [])
+
+    def test_unregister_view_happy_path(self):
+        view = self.hotels_obj.register_view(AvailabilityView('Cancun'))
+        self.assertTrue(self.hotels_obj.unregister_view(view))
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.assertEqual(view.count, 2)
+
+    # PART 2: This part of the Test Cases include the negative path
+    # and edge case scenarios, where all the values are invalid or
+    # the operations cannot be completed.
+
+    def test_view_neg_path_1(self):
+        # Path 1: Status or room type that is not valid
+        with self.assertRaises(ValueError):
+            AvailabilityView(status='booked')
+        with self.assertRaises(ValueError):
+            AvailabilityView(room_type='suite')
+
+    def test_register_view_neg_path_1(self):
+        # Path 1: Location without Hotels, filled in later
+        view = self.hotels_obj.register_view(AvailabilityView('Saltillo'))
+        view.subscribe(1, self.record)
+        self.assertEqual(view.count, 0)
+        self.hotels_obj.create_hotel_bulk('Hotel Tres', 'saltillo',
+                                          room_range=range(101, 104))
+        self.assertEqual(view.count, 3)
+        self.assertEqual(self.notices, [('Saltillo', 3)])
+
+    def test_register_view_neg_path_2(self):
+        # Path 2: View registered twice
+        view = self.hotels_obj.register_view(AvailabilityView('Cancun'))
+        self.assertIs(self.hotels_obj.register_view(view), view)
+        self.hotels_obj.reserve_room('Hotel Uno', '101')
+        self.assertEqual(view.count, 1)
+        self.assertTrue(self.hotels_obj.unregister_view(view))
+        self.assertFalse(self.hotels_obj.unregister_view(view))
+
+    def test_unsubscribe_neg_path_1(self):
+        # Path 1: Function that is not subscribed, or view that is not
+        # registered
+        view = AvailabilityView('Cancun')
+        self.assertFalse(view.unsubscribe(self.record))
+        self.assertFalse(self.hotels_obj.unregister_view(view))
+        view.subscribe(1, self.record)
+        self.assertTrue(view.unsubscribe(self.record))
+
+
+# This part of the code prints the results from the Unit Tests performed
+if __name__ == '__main__':
+    test_suite = unittest.defaultTestLoader.loadTestsFromTestCase(ViewsTest)
+
+    # Run the tests and store the results
+    test_result = unittest.TextTestRunner(stream=open('ViewsTestResults.txt', 'w'),
+                                          verbosity=3).run(test_suite)